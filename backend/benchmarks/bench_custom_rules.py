@@ -0,0 +1,62 @@
+"""Compare compiled and interpreted pattern matching in custom rules.
+
+Run from the backend directory with `python benchmarks/bench_custom_rules.py`.
+Each rule is verified against supports it applies to, once with the matchers
+and builders compiled at registration and once with the generic
+match/substitute path.
+"""
+import time
+from proof_helper.core.formula import Variable, Not, And, Or, Implies
+from proof_helper.core.proof import Proof, StepID, Statement
+from proof_helper.logic.compiled_patterns import interpreted_builder, interpreted_matcher
+from proof_helper.logic.rules_custom import CustomRule
+
+REPEAT = 2_000
+
+def stmt(i: int, formula, rule=None) -> Statement:
+    return Statement(StepID((i,)), formula, rule)
+
+def interpreted(rule: CustomRule) -> CustomRule:
+    copy = CustomRule(rule.name(), rule.proof)
+    copy._premise_matchers = [interpreted_matcher(p.formula) for p in rule.premises]
+    copy._conclusion_matchers = [interpreted_matcher(c.formula) for c in rule.conclusions]
+    copy._conclusion_builders = [interpreted_builder(c.formula) for c in rule.conclusions]
+    return copy
+
+def cases():
+    A, B, C, D = (Variable(x) for x in "ABCD")
+    P, Q, R, S = (Variable(x) for x in "PQRS")
+    big = And(Or(P, Not(Q)), Implies(R, And(S, P)))
+
+    # Constructive dilemma over large formulas
+    dilemma = CustomRule("Dilemma", Proof(
+        [stmt(1, Implies(A, C), "Assumption"), stmt(2, Implies(B, D), "Assumption"), stmt(3, Or(A, B), "Assumption")],
+        [], [stmt(4, Or(C, D), "Reiteration")]))
+    x, y, u, v = big, Not(big), Implies(big, P), Or(big, Q)
+    yield dilemma, [stmt(1, Or(x, y)), stmt(2, Implies(y, v)), stmt(3, Implies(x, u))], stmt(4, Or(u, v))
+
+    # A 7-premise chain of implications
+    ps = [Variable(f"P{i}") for i in range(1, 8)]
+    chain = CustomRule("Chain", Proof(
+        [stmt(i, Implies(ps[i - 1], ps[i]), "Assumption") for i in range(1, 7)] + [stmt(7, ps[0], "Assumption")],
+        [], [stmt(8, ps[-1], "Reiteration")]))
+    fs = [Not(Implies(big, Variable(f"X{i}"))) for i in range(7)]
+    supports = [stmt(7 - i, Implies(fs[i], fs[i + 1])) for i in range(6)] + [stmt(7, fs[0])]
+    yield chain, supports, stmt(8, fs[-1])
+
+def timed(rule: CustomRule, supports, statement) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        assert rule.verify(supports, statement)
+        assert rule.conclude(supports)
+    return (time.perf_counter() - start) * 1e6 / REPEAT
+
+def main():
+    print(f"{'rule':>10} {'compiled us':>12} {'interpreted us':>15}")
+    for rule, supports, statement in cases():
+        compiled = timed(rule, supports, statement)
+        generic = timed(interpreted(rule), supports, statement)
+        print(f"{rule.name():>10} {compiled:>12.1f} {generic:>15.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Time formula traversals on very deep formulas.
+
+Run from the backend directory with `python benchmarks/bench_deep_formulas.py`.
+Each traversal should take roughly constant time per node as the size doubles.
+"""
+import time
+from proof_helper.core.formula import Variable, Not, And, Formula
+from proof_helper.io.serialize import dump_formula
+from proof_helper.io.deserialize import parse_formula
+from proof_helper.logic.formula_similarity import score_similarity
+
+SIZES = [12_500, 25_000, 50_000, 100_000]
+
+def build(n: int, leaf: Formula) -> Formula:
+    # Alternate negations and left-nested conjunctions to get roughly n nodes
+    f = leaf
+    for i in range(n // 3):
+        f = And(Not(f), Variable(f"X{i % 50}"))
+    return f
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+def main():
+    print(f"{'nodes':>8} {'operation':>12} {'total ms':>10} {'ns/node':>9}")
+    for n in SIZES:
+        pattern = build(n, Variable("A"))
+        target = build(n, And(Variable("P"), Variable("Q")))
+        nodes = target.size
+        data = dump_formula(target)
+        operations = {
+            "to_string": lambda: str(target),
+            "dump": lambda: dump_formula(target),
+            "parse": lambda: parse_formula(data),
+            "match": lambda: pattern.match(target, {}),
+            "substitute": lambda: pattern.substitute({"A": Variable("B")}),
+            "similarity": lambda: score_similarity(pattern, target),
+        }
+        for name, op in operations.items():
+            seconds = timed(op)
+            print(f"{nodes:>8} {name:>12} {seconds * 1000:>10.1f} {seconds * 1e9 / nodes:>9.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare sequential and process-pool verification of a proof full of custom rule steps.
+
+Run from the backend directory with `python benchmarks/bench_parallel_verify.py`.
+Every step applies a six-premise custom rule whose premises are cited in
+reverse order, so each check has to search for the premise assignment. Each
+step uses its own variables, and the registry's verdict cache is cleared before
+each timing, so every check really runs. Speedups are bounded by the number of
+CPU cores available.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from proof_helper.core.formula import Variable, Implies
+from proof_helper.core.proof import Proof, StepID, Statement
+from proof_helper.logic.parallel import parallel_verify_proof
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.verify import verify_proof
+
+STEPS = 400
+WORKERS = [1, 2, 4, 8]
+CHAIN = 6
+
+def statement(i: int, formula, rule: str, premises=()) -> Statement:
+    return Statement(StepID((i,)), formula, rule, [StepID((p,)) for p in premises])
+
+def chain_rule() -> Proof:
+    # A0, A0 → A1, ..., A4 → A5 therefore A5
+    names = [Variable(f"A{i}") for i in range(CHAIN)]
+    premises = [statement(1, names[0], "Assumption")]
+    premises += [statement(i + 2, Implies(names[i], names[i + 1]), "Assumption") for i in range(CHAIN - 1)]
+    return Proof(premises, [], [statement(CHAIN + 1, names[-1], "Reiteration", [CHAIN])])
+
+def build() -> Proof:
+    # Step s concludes X{s}_5 from its own chain X{s}_0, X{s}_0 → X{s}_1, ...
+    premises, steps = [], []
+    for s in range(STEPS):
+        xs = [Variable(f"X{s}_{i}") for i in range(CHAIN)]
+        first = len(premises) + 1
+        premises.append(statement(first, xs[0], "Assumption"))
+        premises += [statement(first + i + 1, Implies(xs[i], xs[i + 1]), "Assumption") for i in range(CHAIN - 1)]
+        cited = list(range(first + CHAIN - 1, first - 1, -1))
+        steps.append((xs[-1], cited))
+    base = len(premises) + 1
+    return Proof(premises, [statement(base + i, f, "Chain", cited) for i, (f, cited) in enumerate(steps)], [])
+
+def timed(fn, registry: RuleRegistry) -> float:
+    registry.verdicts.clear()
+    start = time.perf_counter()
+    assert fn() is True
+    return time.perf_counter() - start
+
+def main():
+    registry = RuleRegistry()
+    registry.add_custom_rule("Chain", chain_rule())
+    proof = build()
+    print(f"{STEPS} steps, {os.cpu_count()} CPUs")
+    sequential = timed(lambda: verify_proof(proof, registry), registry)
+    print(f"{'sequential':>12} {sequential * 1000:>9.1f} ms")
+    for workers in WORKERS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pool.submit(int).result()  # Start the workers before timing
+            seconds = timed(lambda: parallel_verify_proof(proof, registry, pool, chunk_size=16), registry)
+        print(f"{workers:>4} workers {seconds * 1000:>9.1f} ms {sequential / seconds:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Measure the memory held by many proofs at once.
+
+Run from the backend directory with `python benchmarks/bench_proof_memory.py`.
+Proofs are parsed from JSON, as the server and batch grading do, and the
+figures exclude formulas, which are interned and shared between proofs.
+"""
+import tracemalloc
+from proof_helper.core.formula import Variable
+from proof_helper.io.deserialize import build_proof
+
+PROOFS = 2_000
+STEPS = 50
+
+def proof_data(n: int) -> dict:
+    # Premises P0..P9, then reiterations, every fifth one inside a subproof
+    var = {"type": "var", "name": "P"}
+    data = {
+        "premises": [{"id": str(i), "formula": var, "rule": "Assumption"} for i in range(1, 11)],
+        "steps": [],
+        "conclusions": [{"id": str(n + 1), "formula": var, "rule": "Reiteration", "premises": [str(n)]}],
+    }
+    for i in range(11, n + 1):
+        step = {"id": str(i), "formula": var, "rule": "Reiteration", "premises": [str(i - 1)]}
+        if i % 5 == 0:
+            step = {
+                "id": str(i), "type": "subproof",
+                "assumption": {"id": f"{i}.1", "formula": var, "rule": "Assumption"},
+                "steps": [{"id": f"{i}.2", "formula": var, "rule": "Reiteration", "premises": [f"{i}.1"]}],
+            }
+        data["steps"].append(step)
+    return data
+
+def main():
+    Variable("P")  # Keep the shared formula out of the measurement
+    datas = [proof_data(STEPS) for _ in range(PROOFS)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    proofs = [build_proof(d) for d in datas]
+    after = tracemalloc.take_snapshot()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    steps = PROOFS * len(proofs[0].step_index)
+    print(f"{len(proofs)} proofs, {steps} steps")
+    print(f"{total / 1e6:.1f} MB total, {total / len(proofs):.0f} B/proof, {total / steps:.0f} B/step")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Time verification of long generated proofs.
+
+Run from the backend directory with `python benchmarks/bench_verify_proof.py`.
+Every step cites the one before it, so the time per step should stay roughly
+constant as the proof grows.
+"""
+import time
+from proof_helper.core.formula import Variable
+from proof_helper.core.proof import Proof, StepID, Statement, Subproof
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.verify import verify_proof
+
+SIZES = [1_250, 2_500, 5_000, 10_000]
+
+def build(n: int) -> Proof:
+    # A chain of reiterations, with every tenth step wrapped in a subproof
+    P = Variable("P")
+    premises = [Statement(StepID((1,)), P, "Assumption")]
+    steps = []
+    previous = premises[0].id
+    for i in range(2, n):
+        if i % 10 == 0:
+            assumption = Statement(StepID((i, 1)), P, "Assumption")
+            inner = Statement(StepID((i, 2)), P, "Reiteration", [previous])
+            steps.append(Subproof(StepID((i,)), assumption, [inner]))
+        else:
+            steps.append(Statement(StepID((i,)), P, "Reiteration", [previous]))
+            previous = steps[-1].id
+    conclusions = [Statement(StepID((n,)), P, "Reiteration", [previous])]
+    return Proof(premises, steps, conclusions)
+
+def main():
+    registry = RuleRegistry()
+    print(f"{'steps':>8} {'total ms':>10} {'us/step':>9}")
+    for n in SIZES:
+        proof = build(n)
+        start = time.perf_counter()
+        assert verify_proof(proof, registry) is True
+        seconds = time.perf_counter() - start
+        print(f"{n:>8} {seconds * 1000:>10.1f} {seconds * 1e6 / n:>9.1f}")
+
+if __name__ == "__main__":
+    main()
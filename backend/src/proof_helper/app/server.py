@@ -1,12 +1,14 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from proof_helper.logic.rule_registry import RuleRegistry
 from proof_helper.io.deserialize import build_proof
 from proof_helper.io.serialize import dump_proof, dump_formula
 from proof_helper.logic.verify import verify_proof, VerificationError
+from proof_helper.logic.incremental import IncrementalVerifier
 from proof_helper.logic.step_suggestions import generate_next_steps
+from proof_helper.logic.semantics import proof_goal_countermodel, unprovable_conclusion
 from proof_helper.io.rule_storage import CustomRuleStore
-from typing import Optional
+from typing import Iterator, Optional
 import argparse
 import traceback
 import json
@@ -16,6 +18,20 @@ class ProofApp(Flask):
         super().__init__(import_name)
         self.custom_rule_store = CustomRuleStore(rules_dir) if rules_dir else None
         self.rule_registry = RuleRegistry(custom_rule_store=self.custom_rule_store)
+        # The frontend re-submits the whole proof after every edit
+        self.verifier = IncrementalVerifier(self.rule_registry)
+
+def stream_errors(errors: Iterator[VerificationError]) -> Iterator[str]:
+    count = 0
+    try:
+        for error in errors:
+            count += 1
+            yield json.dumps({"step_id": error.step_id, "message": error.message}) + "\n"
+    except Exception as e:
+        # The status line has already been sent, so failures are reported in-band
+        yield json.dumps({"step_id": None, "message": str(e), "trace": traceback.format_exc()}) + "\n"
+        return
+    yield json.dumps({"done": True, "valid": count == 0, "error_count": count}) + "\n"
 
 def register_routes(app: ProofApp):
     @app.route('/verify_proof', methods=['POST'])
@@ -23,9 +39,12 @@ def register_routes(app: ProofApp):
         try:
             data = json.loads(request.data.decode())
             proof = build_proof(data)
-            rule_checker = app.rule_registry
 
-            result = verify_proof(proof, rule_checker)
+            # ?all=true streams every error as one JSON object per line, then a summary line
+            if request.args.get("all", "").lower() in ("1", "true"):
+                return Response(stream_errors(app.verifier.proof_errors(proof)), mimetype="application/x-ndjson")
+
+            result = app.verifier.verify_proof(proof)
 
             if result is True:
                 return "", 200
@@ -43,6 +62,24 @@ def register_routes(app: ProofApp):
                 "trace": traceback.format_exc()
             }), 400
         
+    @app.route('/check_goal', methods=['POST'])
+    def check_goal_api():
+        try:
+            data = json.loads(request.data.decode())
+            proof = build_proof(data)
+
+            model = proof_goal_countermodel(proof)
+            if model is None:
+                return jsonify({"provable": True}), 200
+            return jsonify({"provable": False, "countermodel": model}), 200
+
+        except Exception as e:
+            return jsonify({
+                "step_id": None,
+                "message": str(e),
+                "trace": traceback.format_exc()
+            }), 400
+
     @app.route('/rules', methods=['POST'])
     def add_custom_rule_api():
         try:
@@ -52,6 +89,16 @@ def register_routes(app: ProofApp):
             proof = build_proof(raw_proof)
             rule_checker = app.rule_registry
 
+            # Reject unsound rules before verifying the whole proof
+            failure = unprovable_conclusion(proof)
+            if failure is not None:
+                conclusion, model = failure
+                return jsonify({
+                    "step_id": str(conclusion.id),
+                    "message": "Conclusion does not follow from the premises",
+                    "countermodel": model
+                }), 400
+
             result = verify_proof(proof, rule_checker)
             if result is not True:
                 assert isinstance(result, VerificationError)
@@ -60,13 +107,17 @@ def register_routes(app: ProofApp):
                     "message": result.message
                 }), 400
 
+            # Rules already covering this one are reported, not rejected
+            equivalent = app.rule_registry.equivalent_rule(proof)
+            subsumed_by = app.rule_registry.subsuming_rules(proof)
+
             # Save the raw JSON
             app.custom_rule_store.save_rule(name, raw_proof)
 
             # Add rule to registry
             app.rule_registry.add_custom_rule(name, proof)
 
-            return "", 200
+            return jsonify({"equivalent_to": equivalent, "subsumed_by": subsumed_by}), 200
 
         except Exception as e:
             return jsonify({
@@ -104,6 +155,17 @@ def register_routes(app: ProofApp):
                 }), 400
 
             proof = build_proof(raw_proof)
+
+            # No sequence of steps can reach a goal the premises do not entail
+            failure = unprovable_conclusion(proof)
+            if failure is not None:
+                conclusion, model = failure
+                return jsonify({
+                    "step_id": str(conclusion.id),
+                    "message": "Conclusion does not follow from the premises",
+                    "countermodel": model
+                }), 400
+
             registry = app.rule_registry
             suggestions = generate_next_steps(proof, registry)
 
@@ -0,0 +1,98 @@
+from __future__ import annotations
+import hashlib
+from typing import List, TYPE_CHECKING
+from proof_helper.core.formula import DIGEST_SIZE
+from proof_helper.core.proof import StepID, Step, Statement, Subproof
+
+if TYPE_CHECKING:
+    from proof_helper.core.proof import Proof
+
+# Content hashes are Merkle hashes: a subproof's hash covers the hashes of its
+# assumption and body, and a proof's covers its premises, steps and conclusions.
+# Ids are hashed relative to where they appear, so a subproof pasted at another
+# position (3.1, 3.2 ... becoming 7.1, 7.2 ...) keeps its hash:
+#
+#   * a step's own id is not part of its hash. Its parent hashes the last
+#     component of the step's id when that id extends the parent's, and the
+#     full id otherwise. A subproof with such a misplaced child also hashes
+#     its own full id, since checks inside it then depend on where it is;
+#   * a citation is hashed as the number of levels to climb from the citing
+#     statement's id to the common prefix, plus the rest of the cited id.
+#
+# Given the id of the root, the hash therefore determines every id inside it.
+
+_COMPONENT = 4  # Bytes per path component in StepID.key
+
+def _blake(tag: bytes):
+    return hashlib.blake2b(tag, digest_size=DIGEST_SIZE)
+
+def _sized(data: bytes) -> bytes:
+    return len(data).to_bytes(4, "big") + data
+
+def _placement(child: StepID, parent_key: bytes) -> bytes:
+    key = child.key
+    if len(key) > len(parent_key) and key[:-_COMPONENT] == parent_key:
+        return b"\0" + key[-_COMPONENT:]
+    return b"\1" + _sized(key)
+
+def _relative(cited: StepID, at: StepID) -> bytes:
+    a, c = at.key, cited.key
+    common = 0
+    while common < len(a) and common < len(c) and a[common:common + _COMPONENT] == c[common:common + _COMPONENT]:
+        common += _COMPONENT
+    up = (len(a) - common) // _COMPONENT
+    return up.to_bytes(4, "big") + _sized(c[common:])
+
+def _statement_hash(statement: Statement) -> bytes:
+    h = _blake(b"statement")
+    h.update(statement.formula.digest)
+    h.update(b"\0" if statement.rule is None else b"\1" + _sized(statement.rule.encode("utf-8")))
+    h.update(len(statement.premises).to_bytes(4, "big"))
+    for pid in statement.premises:
+        h.update(_relative(pid, statement.id))
+    return h.digest()
+
+def _subproof_hash(subproof: Subproof) -> bytes:
+    parent = subproof.id.key
+    children = [subproof.assumption, *subproof.steps]
+    placements = [_placement(s.id, parent) for s in children]
+    h = _blake(b"subproof")
+    if any(p.startswith(b"\1") for p in placements):
+        h.update(b"\1" + _sized(parent))
+    else:
+        h.update(b"\0")
+    h.update(len(children).to_bytes(4, "big"))
+    for placement, step in zip(placements, children):
+        h.update(placement + step._content_hash)
+    return h.digest()
+
+def step_hash(root: Step) -> bytes:
+    """Content hash of a step, cached on it and on every step nested inside it."""
+    # Explicit post-order walk, like formula._bottom_up, over steps without a hash yet
+    stack: List[Step] = [root]
+    while stack:
+        step = stack[-1]
+        if step._content_hash is not None:
+            stack.pop()
+            continue
+        if isinstance(step, Subproof):
+            pending = [s for s in [step.assumption, *step.steps] if s._content_hash is None]
+            if pending:
+                stack.extend(pending)
+                continue
+            digest = _subproof_hash(step)
+        elif isinstance(step, Statement):
+            digest = _statement_hash(step)
+        else:
+            raise TypeError(f"Cannot hash step type: {type(step)}")
+        stack.pop()
+        object.__setattr__(step, "_content_hash", digest)
+    return root._content_hash
+
+def proof_hash(proof: Proof) -> bytes:
+    h = _blake(b"proof")
+    for section in (proof.premises, proof.steps, proof.conclusions):
+        h.update(len(section).to_bytes(4, "big"))
+        for step in section:
+            h.update(_placement(step.id, b"") + step_hash(step))
+    return h.digest()
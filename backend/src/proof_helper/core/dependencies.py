@@ -0,0 +1,100 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Set, TYPE_CHECKING
+from proof_helper.core.proof import StepID, Step, Statement
+
+if TYPE_CHECKING:
+    from proof_helper.core.proof import Proof
+
+# Nodes are the steps of a proof, numbered in proof order as in ScopeTable. A
+# statement depends on the steps it cites, and a subproof depends on its
+# assumption and body, so a step citing a subproof transitively depends on
+# everything inside it.
+
+class DependencyGraph:
+    """Which steps each step relies on, and which steps rely on it."""
+
+    def __init__(self, proof: Proof):
+        scope = proof.scope
+        self.steps: List[Step] = scope.steps
+        self.position: Dict[StepID, int] = scope.position
+        self._conclusions = set(range(scope.conclusions_start, len(self.steps)))
+        self._uses: List[List[int]] = [[] for _ in self.steps]
+        self._used_by: List[List[int]] = [[] for _ in self.steps]
+        self.dirty: Set[StepID] = set()
+
+        for i, step in enumerate(self.steps):
+            if isinstance(step, Statement):
+                cited = (self.position.get(pid) for pid in step.premises)
+            else:
+                cited = (self.position[s.id] for s in [step.assumption, *step.steps])
+            for j in cited:
+                # Dangling citations have no node; the verifier reports them
+                if j is not None and j not in self._uses[i]:
+                    self._uses[i].append(j)
+                    self._used_by[j].append(i)
+
+    def _ids(self, nodes: Iterable[int]) -> List[StepID]:
+        return [self.steps[i].id for i in sorted(nodes)]
+
+    def _closure(self, start: Iterable[StepID], edges: List[List[int]]) -> Set[int]:
+        seen: Set[int] = set()
+        stack = [self.position[s] for s in start if s in self.position]
+        while stack:
+            for j in edges[stack.pop()]:
+                if j not in seen:
+                    seen.add(j)
+                    stack.append(j)
+        return seen
+
+    # --- Queries ---
+
+    def dependencies(self, step: StepID) -> List[StepID]:
+        """Steps that `step` relies on directly."""
+        return self._ids(self._uses[self.position[step]])
+
+    def dependents(self, step: StepID) -> List[StepID]:
+        """Steps that rely on `step` directly."""
+        return self._ids(self._used_by[self.position[step]])
+
+    def ancestors(self, step: StepID) -> List[StepID]:
+        """Every step that `step` relies on, directly or not, in proof order."""
+        return self._ids(self._closure([step], self._uses))
+
+    def descendants(self, step: StepID) -> List[StepID]:
+        """Every step relying on `step`, directly or not, in proof order."""
+        return self._ids(self._closure([step], self._used_by))
+
+    def conclusions_relying_on(self, step: StepID) -> List[StepID]:
+        return self._ids(self._closure([step], self._used_by) & self._conclusions)
+
+    def unused_steps(self) -> List[StepID]:
+        """Steps that no conclusion relies on, conclusions themselves excluded."""
+        conclusions = [self.steps[i].id for i in self._conclusions]
+        used = self._closure(conclusions, self._uses) | self._conclusions
+        return self._ids(set(range(len(self.steps))) - used)
+
+    # --- Invalidation ---
+
+    def mark_dirty(self, steps: Iterable[StepID]) -> Set[StepID]:
+        """Mark edited steps and everything relying on them; returns the newly dirty steps."""
+        steps = [s for s in steps if s in self.position]
+        affected = {self.steps[i].id for i in self._closure(steps, self._used_by)}
+        affected.update(steps)
+        new = affected - self.dirty
+        self.dirty |= new
+        return new
+
+    def clear_dirty(self) -> None:
+        self.dirty.clear()
+
+def edited_steps(old: Proof, new: Proof) -> Set[StepID]:
+    """Ids of statements that were added, removed or changed between two versions of a proof.
+
+    Subproofs are compared through their contents, so only the statements that
+    actually changed are reported.
+    """
+    before = {s.id: s for s in old.scope.steps if isinstance(s, Statement)}
+    after = {s.id: s for s in new.scope.steps if isinstance(s, Statement)}
+    changed = set(before.keys() ^ after.keys())
+    changed.update(i for i in before.keys() & after.keys() if before[i] != after[i])
+    return changed
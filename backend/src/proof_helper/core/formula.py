@@ -1,194 +1,682 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Union, Dict
+import hashlib
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from threading import Lock
+from types import MappingProxyType
+from typing import Union, Dict, Tuple, FrozenSet, Mapping, Callable, List, Any, Iterable, Sequence, Set
+from weakref import WeakValueDictionary
 
 # === Base Formatting Helper ===
 
 def format_formula(formula: Formula, parent_prec: int) -> str:
     return formula._to_string(parent_prec)
 
+# === Hash Consing ===
+
+# One canonical node per structurally distinct formula. Children are interned
+# before their parents, so a key only ever holds canonical nodes and comparing
+# keys is a handful of identity checks.
+_INTERN_TABLE: WeakValueDictionary = WeakValueDictionary()
+_INTERN_LOCK = Lock()
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+# Pickle recurses once per nesting level of the constructor arguments, so
+# formulas deeper than this are pickled in their flat packed encoding instead
+_PICKLE_MAX_NESTING = 64
+
+# Pieces of a rendered formula: literal text, or a subformula with the precedence of its context
+_Parts = List[Union[str, Tuple["FormulaNode", int]]]
+
+def _unpack(code, symbols: Tuple[str, ...]) -> Formula:
+    from proof_helper.core.packed_formula import PackedFormula
+    return PackedFormula(code, symbols).to_formula()
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+class _HashConsed(type):
+    def __call__(cls, *args, **kwargs):
+        if kwargs:
+            # Let the dataclass __init__ validate keyword arguments
+            node = super().__call__(*args, **kwargs)
+            args = tuple(getattr(node, name) for name in _field_names(cls))
+        key = (cls, *args)
+        existing = _INTERN_TABLE.get(key)
+        if existing is not None:
+            return existing
+        with _INTERN_LOCK:
+            existing = _INTERN_TABLE.get(key)
+            if existing is not None:
+                return existing
+            node = super().__call__(*args)
+            object.__setattr__(node, "_hash", hash((cls.__name__, *args)))
+            _INTERN_TABLE[key] = node
+            return node
+
+class FormulaNode(metaclass=_HashConsed):
+    """Base class for interned formulas: equality is identity and the hash is cached."""
+
+    connective = ""
+
+    def children(self) -> Tuple[Formula, ...]:
+        return ()
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __ne__(self, other: object) -> bool:
+        return self is not other
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def _rebuild(self, children: Sequence[Formula]) -> Formula:
+        """Return the node of the same kind with the given children."""
+        return type(self)(*children)
+
+    def __reduce__(self):
+        # Rebuild through the constructor so copies and unpickled nodes are re-interned
+        if self.depth > _PICKLE_MAX_NESTING:
+            from proof_helper.core.packed_formula import PackedFormula
+            packed = PackedFormula.from_formula(self)
+            return (_unpack, (packed.code, packed.symbols))
+        cls = type(self)
+        return (cls, tuple(getattr(self, name) for name in _field_names(cls)))
+
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        raise NotImplementedError
+
+    # --- Traversals, all iterative so deeply nested formulas never hit the recursion limit ---
+
+    def _to_string(self, parent_prec: int) -> str:
+        out: List[str] = []
+        stack: _Parts = [(self, parent_prec)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                out.append(item)
+            else:
+                node, prec = item
+                stack.extend(reversed(node._format_parts(prec)))
+        return "".join(out)
+
+    def match(self, other: Formula, subst: Dict[str, Formula]) -> bool:
+        """Match this pattern against other, extending subst with variable bindings."""
+        stack = [(self, other)]
+        while stack:
+            pattern, target = stack.pop()
+            if isinstance(pattern, Variable):
+                bound = subst.get(pattern.name)
+                if bound is None:
+                    subst[pattern.name] = target
+                elif bound is not target:
+                    return False
+                continue
+            if type(pattern) is not type(target):
+                return False
+            pattern_children, target_children = pattern.children(), target.children()
+            if len(pattern_children) != len(target_children):
+                return False  # n-ary nodes of different widths
+            # Push right-to-left so variables are bound left-to-right
+            stack.extend(reversed(list(zip(pattern_children, target_children))))
+        return True
+
+    def substitute(self, subst: Dict[str, Formula]) -> Formula:
+        """Replace variables according to subst; shared subtrees are rebuilt once."""
+        done: Dict[Formula, Formula] = {}
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            if node in done:
+                stack.pop()
+                continue
+            if isinstance(node, Variable):
+                done[node] = subst.get(node.name, node)
+                stack.pop()
+                continue
+            kids = node.children()
+            pending = [c for c in kids if c not in done]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            done[node] = node._rebuild([done[c] for c in kids]) if kids else node
+        return done[self]
+
+    # --- Structural metadata, computed lazily and cached on the node ---
+
+    @property
+    def size(self) -> int:
+        """Number of nodes in the formula tree."""
+        return _bottom_up(self, "_size", _combine_size)
+
+    @property
+    def depth(self) -> int:
+        """Length of the longest root-to-leaf path (a leaf has depth 1)."""
+        return _bottom_up(self, "_depth", _combine_depth)
+
+    @property
+    def variables(self) -> FrozenSet[str]:
+        """Names of the variables occurring in the formula.
+
+        Computed by one walk and cached on this node only, unlike size, depth
+        and the other per-node fields, so a chain does not store a set per link.
+        """
+        names = self.__dict__.get("_variables")
+        if names is None:
+            names = frozenset(n.name for n in _distinct_nodes(self) if isinstance(n, Variable))
+            self.__dict__["_variables"] = names
+        return names
+
+    @property
+    def variable_mask(self) -> int:
+        """Bitmask of the variables occurring in the formula, see variable_bit().
+
+        A variable whose bit is missing from the mask does not occur in the formula.
+        """
+        return _bottom_up(self, "_variable_mask", _combine_variable_mask)
+
+    @property
+    def connective_counts(self) -> Mapping[str, int]:
+        """Number of nodes of each connective kind, including "var" and "bottom" leaves."""
+        return _bottom_up(self, "_connective_counts", _combine_connective_counts)
+
+    @property
+    def subformulas(self) -> FrozenSet[Formula]:
+        """Every subformula, including the formula itself. Cached on this node only, like variables."""
+        found = self.__dict__.get("_subformulas")
+        if found is None:
+            found = self.__dict__["_subformulas"] = frozenset(_distinct_nodes(self))
+        return found
+
+    @property
+    def conjuncts(self) -> FrozenSet[Formula]:
+        """Operands of the top-level ∧ chain, or just this formula if it is not a conjunction."""
+        cached = self.__dict__.get("_conjuncts")
+        if cached is None:
+            cached = self.__dict__["_conjuncts"] = frozenset(_chain_operands(self, And))
+        return cached
+
+    @property
+    def disjuncts(self) -> FrozenSet[Formula]:
+        """Operands of the top-level ∨ chain, or just this formula if it is not a disjunction."""
+        cached = self.__dict__.get("_disjuncts")
+        if cached is None:
+            cached = self.__dict__["_disjuncts"] = frozenset(_chain_operands(self, Or))
+        return cached
+
+    @property
+    def canonical(self) -> Formula:
+        """AC-canonical form: ∧ and ∨ chains flattened, sorted and rebuilt with conjunction()/disjunction().
+
+        Formulas equal up to associativity and commutativity of ∧ and ∨ share the
+        same (interned) canonical form, so comparing them is an identity check.
+        """
+        return _canonicalize(self)
+
+    @property
+    def fingerprint(self) -> int:
+        """Truth values under 64 fixed pseudo-random assignments, packed into one int.
+
+        Equivalent formulas always share a fingerprint; different fingerprints
+        prove the formulas are not equivalent.
+        """
+        return _bottom_up(self, "_fingerprint", _combine_fingerprint)
+
+    @property
+    def digest(self) -> bytes:
+        """Stable structural hash of the formula, built bottom-up from its children's digests.
+
+        Unlike hash(), it is the same in every process, and it is wide enough to
+        key persistent caches.
+        """
+        return _bottom_up(self, "_digest", _combine_digest)
+
+def interned_count() -> int:
+    """Return the number of distinct formula nodes currently alive."""
+    return len(_INTERN_TABLE)
+
+# === Structural Metadata Helpers ===
+
+VARIABLE_MASK_BITS = 64
+
+def variable_bit(name: str) -> int:
+    """Return the bit for a variable name, one of VARIABLE_MASK_BITS chosen by hashing the name.
+
+    Distinct names may share a bit, so disjoint masks mean no shared variables
+    but overlapping ones do not prove any. Nothing is stored per name.
+    """
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=1).digest()
+    return 1 << (digest[0] % VARIABLE_MASK_BITS)
+
+def _bottom_up(root: FormulaNode, attr: str, combine: Callable[[FormulaNode, List[Any]], Any]) -> Any:
+    # Explicit post-order walk that only descends into nodes missing the cached
+    # value, so deep formulas never recurse and shared subtrees are visited once.
+    cached = root.__dict__
+    if attr in cached:
+        return cached[attr]
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        if attr in node.__dict__:
+            stack.pop()
+            continue
+        pending = [c for c in node.children() if attr not in c.__dict__]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        node.__dict__[attr] = combine(node, [c.__dict__[attr] for c in node.children()])
+    return cached[attr]
+
+def _combine_size(node: FormulaNode, values: List[int]) -> int:
+    return 1 + sum(values)
+
+def _combine_depth(node: FormulaNode, values: List[int]) -> int:
+    return 1 + max(values, default=0)
+
+def _combine_variable_mask(node: FormulaNode, values: List[int]) -> int:
+    if isinstance(node, Variable):
+        return variable_bit(node.name)
+    mask = 0
+    for v in values:
+        mask |= v
+    return mask
+
+def _combine_connective_counts(node: FormulaNode, values: List[Mapping[str, int]]) -> Mapping[str, int]:
+    counts: Dict[str, int] = {}
+    for child_counts in values:
+        for kind, n in child_counts.items():
+            counts[kind] = counts.get(kind, 0) + n
+    counts[node.connective] = counts.get(node.connective, 0) + 1
+    return MappingProxyType(counts)
+
+def _distinct_nodes(root: FormulaNode) -> Set[FormulaNode]:
+    """Every node of the formula, shared subtrees once, by an iterative walk."""
+    seen = {root}
+    stack = [root]
+    while stack:
+        for child in stack.pop().children():
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+    return seen
+
+# === AC-Canonical Forms ===
+
+def _chain_operands(node: FormulaNode, cls: type) -> List[Formula]:
+    """Left-to-right operands of a chain of `cls` nodes, looking through binary and n-ary forms."""
+    kinds = _CHAIN_KINDS[cls]
+    operands: List[Formula] = []
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if type(n) in kinds:
+            stack.extend(reversed(n.children()))
+        else:
+            operands.append(n)
+    return operands
+
+def _sort_operands(operands: List[Formula]) -> List[Formula]:
+    # Any order that depends only on the operands themselves gives a unique
+    # canonical form. Order by structural hash and break the (rare) ties by text.
+    operands = sorted(operands, key=hash)
+    i = 0
+    while i < len(operands):
+        j = i + 1
+        while j < len(operands) and hash(operands[j]) == hash(operands[i]):
+            j += 1
+        if j - i > 1 and any(operands[k] is not operands[i] for k in range(i, j)):
+            operands[i:j] = sorted(operands[i:j], key=str)
+        i = j
+    return operands
+
+def _canonicalize(root: FormulaNode) -> Formula:
+    if "_canonical" in root.__dict__:
+        return root.__dict__["_canonical"]
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        if "_canonical" in node.__dict__:
+            stack.pop()
+            continue
+        chain = type(node) in _CHAIN_KINDS
+        # Inner nodes of a chain are never canonicalized on their own
+        operands = _chain_operands(node, type(node)) if chain else node.children()
+        pending = [c for c in operands if "_canonical" not in c.__dict__]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        canonical = [c.__dict__["_canonical"] for c in operands]
+        if chain:
+            result = _CHAIN_BUILDERS[type(node)](_sort_operands(canonical))
+        elif canonical:
+            result = type(node)(*canonical)
+        else:
+            result = node
+        node.__dict__["_canonical"] = result
+        result.__dict__.setdefault("_canonical", result)  # Canonical forms are fixed points
+    return root.__dict__["_canonical"]
+
+# === Semantic Fingerprints ===
+
+FINGERPRINT_BITS = 64
+FINGERPRINT_MASK = (1 << FINGERPRINT_BITS) - 1
+@lru_cache(maxsize=1 << 16)
+def variable_fingerprint(name: str) -> int:
+    """Column of a variable across the 64 sample assignments: bit k is its value in assignment k.
+
+    Derived from the name alone, so fingerprints agree across processes.
+    """
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=FINGERPRINT_BITS // 8).digest()
+    return int.from_bytes(digest, "little")
+
+def fingerprint_assignment(bit: int, names: Iterable[str]) -> Dict[str, bool]:
+    """Return sample assignment number `bit` restricted to the given variables."""
+    return {name: bool(variable_fingerprint(name) >> bit & 1) for name in sorted(names)}
+
+def fingerprints(formulas: Iterable[Formula]) -> List[int]:
+    """Fingerprint many formulas in one pass; shared subformulas are evaluated once."""
+    return [_bottom_up(f, "_fingerprint", _combine_fingerprint) for f in formulas]
+
+def _combine_fingerprint(node: FormulaNode, values: List[int]) -> int:
+    if isinstance(node, Variable):
+        return variable_fingerprint(node.name)
+    if isinstance(node, Bottom):
+        return 0
+    if isinstance(node, Not):
+        return FINGERPRINT_MASK ^ values[0]
+    if isinstance(node, Conjunction):
+        result = FINGERPRINT_MASK
+        for v in values:
+            result &= v
+        return result
+    if isinstance(node, Disjunction):
+        result = 0
+        for v in values:
+            result |= v
+        return result
+    left, right = values
+    if isinstance(node, And):
+        return left & right
+    if isinstance(node, Or):
+        return left | right
+    if isinstance(node, Implies):
+        return (FINGERPRINT_MASK ^ left) | right
+    if isinstance(node, Iff):
+        return FINGERPRINT_MASK ^ (left ^ right)
+    raise TypeError(f"Cannot fingerprint formula type: {type(node)}")
+
+DIGEST_SIZE = 16
+
+def _combine_digest(node: FormulaNode, values: List[bytes]) -> bytes:
+    # Child digests have a fixed size, so the node type and children are unambiguous
+    h = hashlib.blake2b(type(node).__name__.encode("utf-8"), digest_size=DIGEST_SIZE)
+    if isinstance(node, Variable):
+        h.update(b"\0" + node.name.encode("utf-8"))
+    else:
+        h.update(len(values).to_bytes(4, "big"))
+        for v in values:
+            h.update(v)
+    return h.digest()
+
 # === Formula Classes ===
 
-@dataclass(frozen=True)
-class Variable:
+@dataclass(frozen=True, eq=False)
+class Variable(FormulaNode):
     name: str
 
+    connective = "var"
+
     def precedence(self) -> int:
         return 100  # Highest precedence
 
-    def _to_string(self, parent_prec: int) -> str:
-        return self.name
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        return [self.name]
 
     def __str__(self) -> str:
         return self._to_string(0)
 
     def __repr__(self) -> str:
         return self._to_string(0)
-    
-    def match(self, other: Formula, subst: Dict[str, Formula]) -> bool:
-        if self.name in subst:
-            return subst[self.name] == other
-        subst[self.name] = other
-        return True
-    
-    def substitute(self, subst: dict[str, Formula]) -> Formula:
-        return subst.get(self.name, self)
 
-@dataclass(frozen=True)
-class Bottom:
+@dataclass(frozen=True, eq=False)
+class Bottom(FormulaNode):
+    connective = "bottom"
+
     def precedence(self) -> int:
         return 100
 
-    def _to_string(self, parent_prec: int) -> str:
-        return "⊥"
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        return ["⊥"]
 
     def __str__(self) -> str:
         return self._to_string(0)
 
     def __repr__(self) -> str:
         return self._to_string(0)
-    
-    def match(self, other: Formula, subst: dict[str, Formula]) -> bool:
-        return isinstance(other, Bottom)
-    
-    def substitute(self, subst: dict[str, Formula]) -> Formula:
-        return self
 
-@dataclass(frozen=True)
-class Not:
+@dataclass(frozen=True, eq=False)
+class Not(FormulaNode):
     value: Formula
 
+    connective = "not"
+
+    def children(self) -> Tuple[Formula, ...]:
+        return (self.value,)
+
     def precedence(self) -> int:
         return 5
 
-    def _to_string(self, parent_prec: int) -> str:
-        inner = format_formula(self.value, self.precedence())
-        return f"¬{inner}"
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        return ["¬", (self.value, self.precedence())]
 
     def __str__(self) -> str:
         return self._to_string(0)
 
     def __repr__(self) -> str:
         return self._to_string(0)
-    
-    def match(self, other: Formula, subst: dict[str, Formula]) -> bool:
-        return isinstance(other, Not) and \
-               self.value.match(other.value, subst)
-    
-    def substitute(self, subst: dict[str, Formula]) -> Formula:
-        return Not(self.value.substitute(subst))
 
-@dataclass(frozen=True)
-class And:
+@dataclass(frozen=True, eq=False)
+class And(FormulaNode):
     left: Formula
     right: Formula
 
+    connective = "and"
+
+    def children(self) -> Tuple[Formula, ...]:
+        return (self.left, self.right)
+
     def precedence(self) -> int:
         return 4
 
-    def _to_string(self, parent_prec: int) -> str:
-        lp = format_formula(self.left, self.precedence())
-        rp = format_formula(self.right, self.precedence() + 1)
-        s = f"{lp} ∧ {rp}"
-        return f"({s})" if self.precedence() < parent_prec else s
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        parts: _Parts = [(self.left, self.precedence()), " ∧ ", (self.right, self.precedence() + 1)]
+        return ["(", *parts, ")"] if self.precedence() < parent_prec else parts
 
     def __str__(self) -> str:
         return self._to_string(0)
 
     def __repr__(self) -> str:
         return self._to_string(0)
-    
-    def match(self, other: Formula, subst: dict[str, Formula]) -> bool:
-        return isinstance(other, And) and \
-               self.left.match(other.left, subst) and \
-               self.right.match(other.right, subst)
-
-    def substitute(self, subst: dict[str, Formula]) -> Formula:
-        return And(self.left.substitute(subst), self.right.substitute(subst))
 
-@dataclass(frozen=True)
-class Or:
+@dataclass(frozen=True, eq=False)
+class Or(FormulaNode):
     left: Formula
     right: Formula
 
+    connective = "or"
+
+    def children(self) -> Tuple[Formula, ...]:
+        return (self.left, self.right)
+
     def precedence(self) -> int:
         return 3
 
-    def _to_string(self, parent_prec: int) -> str:
-        lp = format_formula(self.left, self.precedence())
-        rp = format_formula(self.right, self.precedence() + 1)
-        s = f"{lp} ∨ {rp}"
-        return f"({s})" if self.precedence() < parent_prec else s
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        parts: _Parts = [(self.left, self.precedence()), " ∨ ", (self.right, self.precedence() + 1)]
+        return ["(", *parts, ")"] if self.precedence() < parent_prec else parts
 
     def __str__(self) -> str:
         return self._to_string(0)
 
     def __repr__(self) -> str:
         return self._to_string(0)
-    
-    def match(self, other: Formula, subst: dict[str, Formula]) -> bool:
-        return isinstance(other, Or) and \
-               self.left.match(other.left, subst) and \
-               self.right.match(other.right, subst)
-    
-    def substitute(self, subst: dict[str, Formula]) -> Formula:
-        return Or(self.left.substitute(subst), self.right.substitute(subst))
-
-@dataclass(frozen=True)
-class Implies:
+
+@dataclass(frozen=True, eq=False)
+class Implies(FormulaNode):
     left: Formula
     right: Formula
 
+    connective = "implies"
+
+    def children(self) -> Tuple[Formula, ...]:
+        return (self.left, self.right)
+
     def precedence(self) -> int:
         return 2
 
-    def _to_string(self, parent_prec: int) -> str:
-        lp = format_formula(self.left, self.precedence() + 1)
-        rp = format_formula(self.right, self.precedence())
-        s = f"{lp} → {rp}"
-        return f"({s})" if self.precedence() < parent_prec else s
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        parts: _Parts = [(self.left, self.precedence() + 1), " → ", (self.right, self.precedence())]
+        return ["(", *parts, ")"] if self.precedence() < parent_prec else parts
 
     def __str__(self) -> str:
         return self._to_string(0)
 
     def __repr__(self) -> str:
         return self._to_string(0)
-    
-    def match(self, other: Formula, subst: dict[str, Formula]) -> bool:
-        return isinstance(other, Implies) and \
-               self.left.match(other.left, subst) and \
-               self.right.match(other.right, subst)
-    
-    def substitute(self, subst: dict[str, Formula]) -> Formula:
-        return Implies(self.left.substitute(subst), self.right.substitute(subst))
-
-@dataclass(frozen=True)
-class Iff:
+
+@dataclass(frozen=True, eq=False)
+class Iff(FormulaNode):
     left: Formula
     right: Formula
 
+    connective = "iff"
+
+    def children(self) -> Tuple[Formula, ...]:
+        return (self.left, self.right)
+
     def precedence(self) -> int:
         return 1
 
-    def _to_string(self, parent_prec: int) -> str:
-        lp = format_formula(self.left, self.precedence() + 1)
-        rp = format_formula(self.right, self.precedence())
-        s = f"{lp} ↔ {rp}"
-        return f"({s})" if self.precedence() < parent_prec else s
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        parts: _Parts = [(self.left, self.precedence() + 1), " ↔ ", (self.right, self.precedence())]
+        return ["(", *parts, ")"] if self.precedence() < parent_prec else parts
 
     def __str__(self) -> str:
         return self._to_string(0)
 
     def __repr__(self) -> str:
         return self._to_string(0)
-    
-    def match(self, other: Formula, subst: dict[str, Formula]) -> bool:
-        return isinstance(other, Iff) and \
-               self.left.match(other.left, subst) and \
-               self.right.match(other.right, subst)
-    
-    def substitute(self, subst: dict[str, Formula]) -> Formula:
-        return Or(self.left.substitute(subst), self.right.substitute(subst))
+
+# === N-ary Conjunction and Disjunction ===
+# Flat alternatives to long left-nested And/Or chains: a 1000-conjunct formula is
+# one node with 1000 children instead of a tree 1000 levels deep.
+
+@dataclass(frozen=True, eq=False)
+class Conjunction(FormulaNode):
+    operands: Tuple[Formula, ...]
+
+    connective = "and"
+
+    def __post_init__(self):
+        if len(self.operands) < 2:
+            raise ValueError("Conjunction needs at least two operands")
+
+    def children(self) -> Tuple[Formula, ...]:
+        return self.operands
+
+    def _rebuild(self, children: Sequence[Formula]) -> Formula:
+        return Conjunction(tuple(children))
+
+    def precedence(self) -> int:
+        return 4
+
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        # Render like the equivalent left-nested And chain
+        parts: _Parts = [(self.operands[0], self.precedence())]
+        for operand in self.operands[1:]:
+            parts += [" ∧ ", (operand, self.precedence() + 1)]
+        return ["(", *parts, ")"] if self.precedence() < parent_prec else parts
+
+    def __str__(self) -> str:
+        return self._to_string(0)
+
+    def __repr__(self) -> str:
+        return self._to_string(0)
+
+@dataclass(frozen=True, eq=False)
+class Disjunction(FormulaNode):
+    operands: Tuple[Formula, ...]
+
+    connective = "or"
+
+    def __post_init__(self):
+        if len(self.operands) < 2:
+            raise ValueError("Disjunction needs at least two operands")
+
+    def children(self) -> Tuple[Formula, ...]:
+        return self.operands
+
+    def _rebuild(self, children: Sequence[Formula]) -> Formula:
+        return Disjunction(tuple(children))
+
+    def precedence(self) -> int:
+        return 3
+
+    def _format_parts(self, parent_prec: int) -> _Parts:
+        parts: _Parts = [(self.operands[0], self.precedence())]
+        for operand in self.operands[1:]:
+            parts += [" ∨ ", (operand, self.precedence() + 1)]
+        return ["(", *parts, ")"] if self.precedence() < parent_prec else parts
+
+    def __str__(self) -> str:
+        return self._to_string(0)
+
+    def __repr__(self) -> str:
+        return self._to_string(0)
+
+def conjunction(operands: Sequence[Formula]) -> Formula:
+    """Conjoin operands: the operand itself, a binary And, or an n-ary Conjunction."""
+    if not operands:
+        raise ValueError("Cannot build a conjunction of no operands")
+    if len(operands) == 1:
+        return operands[0]
+    if len(operands) == 2:
+        return And(operands[0], operands[1])
+    return Conjunction(tuple(operands))
+
+def disjunction(operands: Sequence[Formula]) -> Formula:
+    """Disjoin operands: the operand itself, a binary Or, or an n-ary Disjunction."""
+    if not operands:
+        raise ValueError("Cannot build a disjunction of no operands")
+    if len(operands) == 1:
+        return operands[0]
+    if len(operands) == 2:
+        return Or(operands[0], operands[1])
+    return Disjunction(tuple(operands))
+
+def conjunct_list(f: Formula) -> List[Formula]:
+    """Operands of the top-level ∧ chain in order, duplicates kept."""
+    return _chain_operands(f, And)
+
+def disjunct_list(f: Formula) -> List[Formula]:
+    """Operands of the top-level ∨ chain in order, duplicates kept."""
+    return _chain_operands(f, Or)
+
+_CHAIN_KINDS: Dict[type, Tuple[type, ...]] = {
+    And: (And, Conjunction), Conjunction: (And, Conjunction),
+    Or: (Or, Disjunction), Disjunction: (Or, Disjunction),
+}
+_CHAIN_BUILDERS: Dict[type, Callable[[Sequence[Formula]], Formula]] = {
+    And: conjunction, Conjunction: conjunction,
+    Or: disjunction, Disjunction: disjunction,
+}
 
 # Final union
-Formula = Union[Variable, Not, And, Or, Implies, Iff, Bottom]
+Formula = Union[Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction]
@@ -0,0 +1,284 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction, Formula
+
+# === Opcodes ===
+# Formulas are stored in prefix order. Connectives use non-negative opcodes and a
+# variable is stored as -(i + 1), where i indexes the symbol table. The n-ary
+# opcodes are followed by their operand count.
+
+OP_BOTTOM = 0
+OP_NOT = 1
+OP_AND = 2
+OP_OR = 3
+OP_IMPLIES = 4
+OP_IFF = 5
+OP_CONJUNCTION = 6
+OP_DISJUNCTION = 7
+
+_OPCODES = {
+    Bottom: OP_BOTTOM, Not: OP_NOT, And: OP_AND, Or: OP_OR, Implies: OP_IMPLIES, Iff: OP_IFF,
+    Conjunction: OP_CONJUNCTION, Disjunction: OP_DISJUNCTION,
+}
+_BINARY = {OP_AND: And, OP_OR: Or, OP_IMPLIES: Implies, OP_IFF: Iff}
+_NARY = {OP_CONJUNCTION: Conjunction, OP_DISJUNCTION: Disjunction}
+_ARITY = {OP_BOTTOM: 0, OP_NOT: 1, OP_AND: 2, OP_OR: 2, OP_IMPLIES: 2, OP_IFF: 2}
+
+def _subtree_end(code: Sequence[int], start: int) -> int:
+    """Return the index just past the subtree that starts at `start`."""
+    need = 1
+    i = start
+    while need:
+        op = code[i]
+        i += 1
+        if op < 0:
+            need -= 1
+        elif op in _NARY:
+            need += code[i] - 1
+            i += 1  # Skip the operand count
+        else:
+            need += _ARITY[op] - 1
+    return i
+
+def _encode(f: Formula, symbols: List[str], index: Dict[str, int], code: array) -> None:
+    stack = [f]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Variable):
+            i = index.get(node.name)
+            if i is None:
+                i = index[node.name] = len(symbols)
+                symbols.append(node.name)
+            code.append(-(i + 1))
+            continue
+        op = _OPCODES.get(type(node))
+        if op is None:
+            raise TypeError(f"Cannot pack formula type: {type(node)}")
+        code.append(op)
+        if op in _NARY:
+            code.append(len(node.operands))
+        stack.extend(reversed(node.children()))
+
+def _decode(code: Sequence[int], start: int, end: int, symbols: Sequence[str]) -> Formula:
+    # Forward scan: each open connective waits on `pending` with the number of
+    # operands it still needs, and finished operands collect on `out`
+    out: List[Formula] = []
+    pending: List[List[int]] = []  # [opcode, operands still needed, total operands]
+    i = start
+    while i < end:
+        op = code[i]
+        i += 1
+        if op < 0:
+            out.append(Variable(symbols[-op - 1]))
+        elif op == OP_BOTTOM:
+            out.append(Bottom())
+        elif op in _NARY:
+            pending.append([op, code[i], code[i]])
+            i += 1
+            continue
+        else:
+            pending.append([op, _ARITY[op], _ARITY[op]])
+            continue
+        # An operand was completed; close every connective it finishes
+        while pending:
+            frame = pending[-1]
+            frame[1] -= 1
+            if frame[1]:
+                break
+            pending.pop()
+            op, _, n = frame
+            operands = out[-n:]
+            del out[-n:]
+            if op == OP_NOT:
+                out.append(Not(operands[0]))
+            elif op in _NARY:
+                out.append(_NARY[op](tuple(operands)))
+            else:
+                out.append(_BINARY[op](*operands))
+    return out[0]
+
+def _renumber(code: Sequence[int], start: int, end: int, symbols: Sequence[str]) -> Tuple[array, Tuple[str, ...]]:
+    """Copy code[start:end] with its own first-occurrence symbol table."""
+    local: Dict[int, int] = {}
+    names: List[str] = []
+    out = array("i")
+    for i in range(start, end):
+        op = code[i]
+        if op < 0:
+            j = local.get(op)
+            if j is None:
+                j = local[op] = len(names)
+                names.append(symbols[-op - 1])
+            op = -(j + 1)
+        out.append(op)
+    return out, tuple(names)
+
+# === Packed Formula ===
+
+class PackedFormula:
+    """A formula flattened into an array('i') of prefix opcodes plus a symbol table.
+
+    Symbols are numbered by first occurrence, so structurally equal formulas have
+    identical code and symbols and equality is a single buffer comparison.
+    """
+
+    __slots__ = ("code", "symbols", "_hash")
+
+    def __init__(self, code: array, symbols: Tuple[str, ...]):
+        self.code = code
+        self.symbols = symbols
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def from_formula(cls, f: Formula) -> PackedFormula:
+        code = array("i")
+        symbols: List[str] = []
+        _encode(f, symbols, {}, code)
+        return cls(code, tuple(symbols))
+
+    def to_formula(self) -> Formula:
+        return _decode(self.code, 0, len(self.code), self.symbols)
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedFormula):
+            return NotImplemented
+        return self.code == other.code and self.symbols == other.symbols
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.code.tobytes(), self.symbols))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"PackedFormula({self.to_formula()})"
+
+    def match(self, other: PackedFormula, subst: Dict[str, PackedFormula]) -> bool:
+        """Match this pattern against other without unpacking either buffer.
+
+        Same contract as Formula.match: variables bind to whole subtrees of other
+        and subst is extended in place.
+        """
+        pcode, tcode = self.code, other.code
+        bound: Dict[int, Tuple[int, int]] = {}
+        new: Dict[str, PackedFormula] = {}
+        j = 0
+        for op in pcode:
+            if op >= 0:
+                if tcode[j] != op:
+                    return False
+                j += 1
+                continue
+            end = _subtree_end(tcode, j)
+            if op in bound:
+                start, stop = bound[op]
+                # Both spans index other's symbol table, so raw opcodes can be compared
+                if tcode[start:stop] != tcode[j:end]:
+                    return False
+            else:
+                name = self.symbols[-op - 1]
+                value = PackedFormula(*_renumber(tcode, j, end, other.symbols))
+                if name in subst and subst[name] != value:
+                    return False
+                bound[op] = (j, end)
+                new[name] = value
+            j = end
+        subst.update(new)
+        return True
+
+# === Formula Libraries ===
+
+_MAGIC = b"PFL1"
+_HEADER = struct.Struct("=4sIII")  # magic, formula count, code length, symbol bytes
+
+class PackedFormulaLibrary:
+    """Many formulas in one flat buffer with a shared symbol table.
+
+    Libraries can be saved to disk and loaded back with mmap, so large formula
+    corpora are paged in lazily instead of being rebuilt as Python objects.
+    Files are written in native byte order.
+    """
+
+    def __init__(self, formulas: Iterable[Formula] = ()):
+        self._symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._code: Sequence[int] = array("i")
+        self._offsets: Sequence[int] = array("i", [0])
+        self._mmap: Optional[mmap.mmap] = None
+        for f in formulas:
+            self.append(f)
+
+    def append(self, f: Formula) -> int:
+        if self._mmap is not None:
+            raise ValueError("Memory-mapped libraries are read-only")
+        _encode(f, self._symbols, self._index, self._code)
+        self._offsets.append(len(self._code))
+        return len(self._offsets) - 2
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> Formula:
+        start, end = self._span(i)
+        return _decode(self._code, start, end, self._symbols)
+
+    def __iter__(self) -> Iterator[Formula]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def packed(self, i: int) -> PackedFormula:
+        start, end = self._span(i)
+        return PackedFormula(*_renumber(self._code, start, end, self._symbols))
+
+    def _span(self, i: int) -> Tuple[int, int]:
+        if not 0 <= i < len(self):
+            raise IndexError("formula index out of range")
+        return self._offsets[i], self._offsets[i + 1]
+
+    def save(self, path: str) -> None:
+        symbols = "\0".join(self._symbols).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self), len(self._code), len(symbols)))
+            f.write(array("i", self._offsets).tobytes())
+            f.write(array("i", self._code).tobytes())
+            f.write(symbols)
+
+    @classmethod
+    def load(cls, path: str) -> PackedFormulaLibrary:
+        library = cls()
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"Not a formula library: {path}")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, code_len, symbol_len = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC:
+            mapped.close()
+            raise ValueError(f"Not a formula library: {path}")
+        view = memoryview(mapped)
+        pos = _HEADER.size
+        library._offsets = view[pos:pos + 4 * (count + 1)].cast("i")
+        pos += 4 * (count + 1)
+        library._code = view[pos:pos + 4 * code_len].cast("i")
+        pos += 4 * code_len
+        symbols = bytes(view[pos:pos + symbol_len]).decode("utf-8")
+        library._symbols = symbols.split("\0") if symbols else []
+        library._index = {name: i for i, name in enumerate(library._symbols)}
+        library._mmap = mapped
+        return library
+
+    def close(self) -> None:
+        """Release the memory map of a loaded library."""
+        if self._mmap is None:
+            return
+        self._offsets.release()
+        self._code.release()
+        self._mmap.close()
+        self._mmap = None
+        self._offsets = array("i", [0])
+        self._code = array("i")
@@ -1,75 +1,258 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple, Optional, Union, TYPE_CHECKING
 from proof_helper.core.formula import Formula
 from abc import ABC, abstractmethod
 
-@dataclass(frozen=True)
+if TYPE_CHECKING:
+    from proof_helper.core.dependencies import DependencyGraph
+    from proof_helper.core.scope import ScopeTable
+
+# Each path component is packed as a 4-byte big-endian word, offset so negative
+# numbers still sort first. Comparing keys as bytes then orders ids exactly like
+# comparing their paths, and one id contains another iff its key is a prefix.
+# Components must therefore fit in 32 bits.
+_KEY_OFFSET = 1 << 31
+
 class StepID:
+    """A step number such as 3.2.1, stored with a packed, natively comparable key."""
+
+    __slots__ = ("path", "key", "_str", "_hash")
+
     path: Tuple[int, ...]
+    key: bytes
+
+    def __init__(self, path: Iterable[int]):
+        path = tuple(path)
+        for x in path:
+            if not -_KEY_OFFSET <= x < _KEY_OFFSET:
+                raise ValueError(f"Step number {x} is out of range")
+        key = b"".join((x + _KEY_OFFSET).to_bytes(4, "big") for x in path)
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "key", key)
+        object.__setattr__(self, "_str", None)
+        object.__setattr__(self, "_hash", hash(key))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (StepID, (self.path,))
 
     def __str__(self):
-        return ".".join(str(x) for x in self.path)
+        if self._str is None:
+            object.__setattr__(self, "_str", ".".join(str(x) for x in self.path))
+        return self._str
+
+    def __repr__(self):
+        return f"StepID(path={self.path!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StepID):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __lt__(self, other: StepID) -> bool:
+        return self.key < other.key
+
+    def __le__(self, other: StepID) -> bool:
+        return self.key <= other.key
+
+    def __gt__(self, other: StepID) -> bool:
+        return self.key > other.key
+
+    def __ge__(self, other: StepID) -> bool:
+        return self.key >= other.key
     
     @classmethod
     def from_string(cls, s: str) -> StepID:
-        return cls(tuple(int(x) for x in s.split('.')))
+        return _parse_step_id(s)
     
     def contains(self, other: StepID) -> bool:
-        return len(self.path) <= len(other.path) and self.path == other.path[:len(self.path)]
+        return other.key.startswith(self.key)
     
     def equals(self, other: StepID) -> bool:
-        return self.path == other.path
+        return self.key == other.key
     
     def is_before(self, other: StepID) -> bool:
-        for x, y in zip(self.path, other.path):
-            if x < y:
-                return True
-            if x > y:
-                return False
-        return len(self.path) < len(other.path)
+        return self.key < other.key
     
     def is_given_for(self, other: StepID) -> bool:
-        return self.is_before(other) and len(self.path) <= len(other.path)
+        return self.key < other.key and len(self.key) <= len(other.key)
+
+@lru_cache(maxsize=1 << 16)
+def _parse_step_id(s: str) -> StepID:
+    # StepIDs are immutable, so every request citing "3.2" can share one instance
+    return StepID(int(x) for x in s.split('.'))
     
-@dataclass(frozen=True)
+# Steps are slotted, so a step carries no per-instance __dict__. Their sequence
+# fields are lists, as before; constructors accept any iterable and copy it
+# into an exactly sized list. The classes are frozen, so __init__ writes
+# through object.__setattr__ and copies are rebuilt via __reduce__.
+
+@dataclass(frozen=True, init=False)
 class Step(ABC):
+    __slots__ = ("id", "_content_hash")
+
     id: StepID
 
+    @property
+    def content_hash(self) -> bytes:
+        """Merkle hash of the step's content, invariant under moving it; see core/content_hash.py."""
+        digest = self._content_hash
+        if digest is None:
+            from proof_helper.core.content_hash import step_hash
+            digest = step_hash(self)
+        return digest
+
     @abstractmethod
     def get_step(self, id: StepID) -> Optional[Step]:
         pass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False)
 class Statement(Step):
+    __slots__ = ("formula", "rule", "premises")
+
     formula: Formula
-    rule: Optional[str] = None
-    premises: List[StepID] = ()
+    rule: Optional[str]
+    premises: List[StepID]
+
+    def __init__(self, id: StepID, formula: Formula, rule: Optional[str] = None, premises: Iterable[StepID] = ()):
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "formula", formula)
+        object.__setattr__(self, "rule", rule)
+        object.__setattr__(self, "premises", list(premises))
+        object.__setattr__(self, "_content_hash", None)
+
+    def __reduce__(self):
+        return (Statement, (self.id, self.formula, self.rule, self.premises))
     
     def get_step(self, step: StepID) -> Optional[Step]:
         return self if self.id.equals(step) else None
 
-@dataclass(frozen=True)
+def _index_steps(steps: Iterable[Step]) -> Dict[StepID, Step]:
+    """Map the id of every step, including those nested in subproofs, to its step.
+
+    Steps are visited in proof order and the first step with a given id wins.
+    """
+    index: Dict[StepID, Step] = {}
+    stack = list(steps)
+    stack.reverse()
+    while stack:
+        step = stack.pop()
+        index.setdefault(step.id, step)
+        if isinstance(step, Subproof):
+            stack.extend(reversed(step.steps))
+            stack.append(step.assumption)
+    return index
+
+def _cached_index(owner: Union[Subproof, Proof]) -> Dict[StepID, Step]:
+    # Kept in a slot outside the dataclass fields so equality and repr are unaffected
+    index = owner._step_index
+    if index is None:
+        index = _index_steps(owner._indexed_steps())
+        object.__setattr__(owner, "_step_index", index)
+    return index
+
+@dataclass(frozen=True, init=False)
 class Subproof(Step):
+    __slots__ = ("assumption", "steps", "_step_index")
+
     assumption: Statement
     steps: List[Step]
+
+    def __init__(self, id: StepID, assumption: Statement, steps: Iterable[Step]):
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "assumption", assumption)
+        object.__setattr__(self, "steps", list(steps))
+        object.__setattr__(self, "_step_index", None)
+        object.__setattr__(self, "_content_hash", None)
+
+    def __reduce__(self):
+        return (Subproof, (self.id, self.assumption, self.steps))
+
+    @property
+    def step_index(self) -> Mapping[StepID, Step]:
+        """Read-only map from the id of every step inside this subproof to the step."""
+        return MappingProxyType(_cached_index(self))
+
+    def _indexed_steps(self) -> List[Step]:
+        return [self.assumption, *self.steps]
     
     def get_step(self, step: StepID) -> Optional[Step]:
         if self.id.equals(step):
             return self
-        for x in [self.assumption] + self.steps:
-            if x.id.contains(step):
-                return x.get_step(step)
-        return None
+        return _cached_index(self).get(step)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False)
 class Proof:
+    __slots__ = ("premises", "steps", "conclusions", "_step_index", "_scope", "_dependencies", "_content_hash")
+
     premises: List[Statement]
     steps: List[Step]
     conclusions: List[Statement]
+
+    def __init__(self, premises: Iterable[Statement], steps: Iterable[Step], conclusions: Iterable[Statement]):
+        object.__setattr__(self, "premises", list(premises))
+        object.__setattr__(self, "steps", list(steps))
+        object.__setattr__(self, "conclusions", list(conclusions))
+        object.__setattr__(self, "_step_index", None)
+        object.__setattr__(self, "_scope", None)
+        object.__setattr__(self, "_dependencies", None)
+        object.__setattr__(self, "_content_hash", None)
+
+    def __reduce__(self):
+        return (Proof, (self.premises, self.steps, self.conclusions))
+
+    @property
+    def step_index(self) -> Mapping[StepID, Step]:
+        """Read-only map from every StepID in the proof to its step.
+
+        Built on first use and kept for the life of the proof, so a proof must
+        not be edited in place once it has been indexed.
+        """
+        return MappingProxyType(_cached_index(self))
+
+    @property
+    def scope(self) -> ScopeTable:
+        """Citation visibility for every step, built on first use like step_index."""
+        table = self._scope
+        if table is None:
+            from proof_helper.core.scope import ScopeTable
+            table = ScopeTable(self)
+            object.__setattr__(self, "_scope", table)
+        return table
+
+    @property
+    def dependencies(self) -> DependencyGraph:
+        """Which steps rely on which, built on first use like step_index."""
+        graph = self._dependencies
+        if graph is None:
+            from proof_helper.core.dependencies import DependencyGraph
+            graph = DependencyGraph(self)
+            object.__setattr__(self, "_dependencies", graph)
+        return graph
+
+    @property
+    def content_hash(self) -> bytes:
+        """Merkle hash of the whole proof, covering every step; see core/content_hash.py."""
+        digest = self._content_hash
+        if digest is None:
+            from proof_helper.core.content_hash import proof_hash
+            digest = proof_hash(self)
+            object.__setattr__(self, "_content_hash", digest)
+        return digest
+
+    def _indexed_steps(self) -> List[Step]:
+        return [*self.premises, *self.steps, *self.conclusions]
     
     def get_step(self, step: StepID) -> Optional[Step]:
-        for x in self.premises + self.steps + self.conclusions:
-            if x.id.contains(step):
-                return x.get_step(step)
-        return None
\ No newline at end of file
+        return _cached_index(self).get(step)
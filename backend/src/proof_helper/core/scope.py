@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, TYPE_CHECKING
+from proof_helper.core.proof import StepID, Step, Subproof
+
+if TYPE_CHECKING:
+    from proof_helper.core.proof import Proof
+
+# Steps are numbered in proof order (premises, steps, conclusions, with each
+# subproof followed by its assumption and body). A subproof then owns the
+# interval [position, end) and every step lies inside the interval of each
+# subproof enclosing it. Step c is visible from step s exactly when
+#
+#     end(c) <= position(s) < scope_end(c)
+#
+# where scope_end(c) is the end of the subproof enclosing c (or of the whole
+# proof). The left inequality says c is finished before s: for a subproof, that
+# means closed. The right one says s has not left c's scope.
+
+class ScopeTable:
+    """Which earlier steps each step of a proof may cite, from one pass over the proof."""
+
+    def __init__(self, proof: Proof):
+        self.steps: List[Step] = []
+        self.position: Dict[StepID, int] = {}
+        self._end: List[int] = []
+        self._scope_end: List[int] = []
+        self.conclusions_start = 0
+
+        # Each frame is (step, is_exit): subproofs are revisited on exit to record their end
+        top: List[Step] = [*proof.premises, *proof.steps]
+        open_scopes: List[int] = []
+        stack = [(s, False) for s in reversed(top)]
+        while stack:
+            step, is_exit = stack.pop()
+            if is_exit:
+                i = open_scopes.pop()
+                self._end[i] = len(self.steps)
+                continue
+            self._add(step)
+            if isinstance(step, Subproof):
+                open_scopes.append(len(self.steps) - 1)
+                stack.append((step, True))
+                stack.extend((s, False) for s in reversed([step.assumption, *step.steps]))
+        self.conclusions_start = len(self.steps)
+        for conclusion in proof.conclusions:
+            self._add(conclusion)
+
+        # Scope ends: a step's scope closes where its innermost enclosing subproof ends
+        total = len(self.steps)
+        self._scope_end = [total] * total
+        enclosing: List[int] = []
+        for i in range(total):
+            while enclosing and self._end[enclosing[-1]] <= i:
+                enclosing.pop()
+            if enclosing:
+                self._scope_end[i] = self._end[enclosing[-1]]
+            if isinstance(self.steps[i], Subproof):
+                enclosing.append(i)
+
+    def _add(self, step: Step) -> None:
+        self.position.setdefault(step.id, len(self.steps))
+        self.steps.append(step)
+        self._end.append(len(self.steps))
+
+    def is_visible(self, cited: StepID, at: StepID) -> bool:
+        """Whether the step at `at` may cite `cited`. Unknown ids are never visible."""
+        c = self.position.get(cited)
+        s = self.position.get(at)
+        if c is None or s is None:
+            return False
+        return self._end[c] <= s < self._scope_end[c]
+
+    def visible_steps(self, at: Optional[StepID] = None) -> List[Step]:
+        """The steps `at` may cite, in proof order.
+
+        With no step given, returns what a new step appended after the proof's
+        last step (and before its conclusions) could cite.
+        """
+        s = self.conclusions_start if at is None else self.position[at]
+        # Walk forward, skipping over the bodies of closed subproofs and entering
+        # the enclosing ones, so the cost is proportional to the result
+        visible: List[Step] = []
+        i = 0
+        while i < s:
+            if self._end[i] <= s:
+                visible.append(self.steps[i])
+                i = self._end[i]
+            else:
+                i += 1  # A subproof enclosing s: its steps may still be visible
+        return visible
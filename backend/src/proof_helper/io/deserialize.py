@@ -1,23 +1,50 @@
-from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom, Formula
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction, Formula
 from proof_helper.core.proof import StepID, Proof, Statement, Subproof, Step
 
+_BINARY_TYPES = {"and": And, "or": Or, "implies": Implies, "iff": Iff}
+_NARY_TYPES = {"and": Conjunction, "or": Disjunction}
+
 def parse_formula(data: dict) -> Formula:
-    t = data["type"]
-    if t == "var":
-        return Variable(data["name"])
-    if t == "not":
-        return Not(parse_formula(data["value"]))
-    if t == "and":
-        return And(parse_formula(data["left"]), parse_formula(data["right"]))
-    if t == "or":
-        return Or(parse_formula(data["left"]), parse_formula(data["right"]))
-    if t == "implies":
-        return Implies(parse_formula(data["left"]), parse_formula(data["right"]))
-    if t == "iff":
-        return Iff(parse_formula(data["left"]), parse_formula(data["right"]))
-    if t == "bottom":
-        return Bottom()
-    raise ValueError(f"Unknown formula type: {t}")
+    # Post-order walk with an explicit stack; finished children wait on `out`
+    out: list[Formula] = []
+    stack = [(data, False)]
+    while stack:
+        node, ready = stack.pop()
+        t = node["type"]
+        if t == "var":
+            out.append(Variable(node["name"]))
+        elif t == "bottom":
+            out.append(Bottom())
+        elif t == "not":
+            if ready:
+                out.append(Not(out.pop()))
+            else:
+                stack.append((node, True))
+                stack.append((node["value"], False))
+        elif t in _NARY_TYPES and "operands" in node:
+            # {"type": "and", "operands": [...]} is the n-ary form of a left/right node
+            operands = node["operands"]
+            if len(operands) < 2:
+                raise ValueError(f"Formula type {t} needs at least two operands")
+            if ready:
+                values = tuple(out[-len(operands):])
+                del out[-len(operands):]
+                out.append(_NARY_TYPES[t](values))
+            else:
+                stack.append((node, True))
+                stack.extend((operand, False) for operand in reversed(operands))
+        elif t in _BINARY_TYPES:
+            if ready:
+                right = out.pop()
+                left = out.pop()
+                out.append(_BINARY_TYPES[t](left, right))
+            else:
+                stack.append((node, True))
+                stack.append((node["right"], False))
+                stack.append((node["left"], False))
+        else:
+            raise ValueError(f"Unknown formula type: {t}")
+    return out[0]
 
 def parse_statement(data: dict) -> Statement:
     return Statement(
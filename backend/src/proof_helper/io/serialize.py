@@ -1,22 +1,34 @@
-from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom, Formula
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction, Formula
 from proof_helper.core.proof import StepID, Statement, Subproof, Step, Proof
 
 def dump_formula(f: Formula) -> dict:
-    if isinstance(f, Variable):
-        return {"type": "var", "name": f.name}
-    if isinstance(f, Not):
-        return {"type": "not", "value": dump_formula(f.value)}
-    if isinstance(f, And):
-        return {"type": "and", "left": dump_formula(f.left), "right": dump_formula(f.right)}
-    if isinstance(f, Or):
-        return {"type": "or", "left": dump_formula(f.left), "right": dump_formula(f.right)}
-    if isinstance(f, Implies):
-        return {"type": "implies", "left": dump_formula(f.left), "right": dump_formula(f.right)}
-    if isinstance(f, Iff):
-        return {"type": "iff", "left": dump_formula(f.left), "right": dump_formula(f.right)}
-    if isinstance(f, Bottom):
-        return {"type": "bottom"}
-    raise TypeError(f"Cannot serialize formula type: {type(f)}")
+    # Post-order walk with an explicit stack; finished children wait on `out`
+    out: list[dict] = []
+    stack = [(f, False)]
+    while stack:
+        node, ready = stack.pop()
+        if isinstance(node, Variable):
+            out.append({"type": "var", "name": node.name})
+        elif isinstance(node, Bottom):
+            out.append({"type": "bottom"})
+        elif not isinstance(node, (Not, And, Or, Implies, Iff, Conjunction, Disjunction)):
+            raise TypeError(f"Cannot serialize formula type: {type(node)}")
+        elif not ready:
+            stack.append((node, True))
+            stack.extend((c, False) for c in reversed(node.children()))
+        elif isinstance(node, Not):
+            out.append({"type": "not", "value": out.pop()})
+        elif isinstance(node, (Conjunction, Disjunction)):
+            # n-ary nodes use an operand list; binary nodes keep left/right
+            n = len(node.operands)
+            operands = out[-n:]
+            del out[-n:]
+            out.append({"type": node.connective, "operands": operands})
+        else:
+            right = out.pop()
+            left = out.pop()
+            out.append({"type": node.connective, "left": left, "right": right})
+    return out[0]
 
 def dump_statement(s: Statement) -> dict:
     return {
@@ -0,0 +1,235 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+from proof_helper.core.formula import Formula, Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction
+
+# Reduced ordered binary decision diagrams. Nodes are plain ints indexing the
+# manager's node arrays; FALSE and TRUE are the two terminals. Because every
+# node is unique, two formulas are equivalent iff they build the same node.
+
+FALSE = 0
+TRUE = 1
+
+BDDNode = int
+
+class BDDTooLarge(RuntimeError):
+    """Raised when a manager would grow past its max_nodes."""
+
+class BDDManager:
+    def __init__(self, order: Sequence[str] = (), cache_size: int = 1 << 16, max_nodes: Optional[int] = None):
+        # Terminals sit below every variable level
+        self._level: List[int] = [1 << 30, 1 << 30]
+        self._low: List[BDDNode] = [FALSE, TRUE]
+        self._high: List[BDDNode] = [FALSE, TRUE]
+        self._unique: Dict[Tuple[int, BDDNode, BDDNode], BDDNode] = {}
+        self._computed: "OrderedDict[Tuple[BDDNode, BDDNode, BDDNode], BDDNode]" = OrderedDict()
+        self._formulas: Dict[Formula, BDDNode] = {}
+        self.cache_size = cache_size
+        self.max_nodes = max_nodes
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.order: List[str] = []
+        self._levels: Dict[str, int] = {}
+        for name in order:
+            self.level_of(name)
+
+    # --- Variables and nodes ---
+
+    def level_of(self, name: str) -> int:
+        """Return the level of a variable, appending it to the order if unseen."""
+        level = self._levels.get(name)
+        if level is None:
+            level = self._levels[name] = len(self.order)
+            self.order.append(name)
+        return level
+
+    def var(self, name: str) -> BDDNode:
+        return self._make(self.level_of(name), FALSE, TRUE)
+
+    def _make(self, level: int, low: BDDNode, high: BDDNode) -> BDDNode:
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            if self.max_nodes is not None and len(self._unique) >= self.max_nodes:
+                raise BDDTooLarge(f"BDD exceeded {self.max_nodes} nodes")
+            node = self._unique[key] = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+        return node
+
+    @property
+    def node_count(self) -> int:
+        """Number of internal nodes created so far (terminals excluded)."""
+        return len(self._unique)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "nodes": self.node_count,
+            "cache_entries": len(self._computed),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+    # --- Operations ---
+
+    def ite(self, f: BDDNode, g: BDDNode, h: BDDNode) -> BDDNode:
+        """If-then-else: the node for (f ∧ g) ∨ (¬f ∧ h).
+
+        Runs on an explicit stack, so problems with thousands of variables
+        do not hit the recursion limit.
+        """
+        computed = self._computed
+        # A task with a level combines the two cofactor results on top of values
+        tasks: List[Tuple[BDDNode, BDDNode, BDDNode, Optional[int]]] = [(f, g, h, None)]
+        values: List[BDDNode] = []
+        while tasks:
+            f, g, h, level = tasks.pop()
+            if level is not None:
+                high = values.pop()
+                low = values.pop()
+                result = self._make(level, low, high)
+                computed[(f, g, h)] = result
+                if len(computed) > self.cache_size:
+                    computed.popitem(last=False)
+                values.append(result)
+                continue
+
+            if f == TRUE or g == h:
+                values.append(g)
+                continue
+            if f == FALSE:
+                values.append(h)
+                continue
+            if g == TRUE and h == FALSE:
+                values.append(f)
+                continue
+
+            key = (f, g, h)
+            result = computed.get(key)
+            if result is not None:
+                self.cache_hits += 1
+                computed.move_to_end(key)
+                values.append(result)
+                continue
+            self.cache_misses += 1
+
+            level = min(self._level[f], self._level[g], self._level[h])
+            f0, f1 = self._cofactors(f, level)
+            g0, g1 = self._cofactors(g, level)
+            h0, h1 = self._cofactors(h, level)
+            tasks.append((f, g, h, level))
+            tasks.append((f1, g1, h1, None))
+            tasks.append((f0, g0, h0, None))
+        return values.pop()
+
+    def _cofactors(self, node: BDDNode, level: int) -> Tuple[BDDNode, BDDNode]:
+        if self._level[node] != level:
+            return node, node
+        return self._low[node], self._high[node]
+
+    def negate(self, f: BDDNode) -> BDDNode:
+        return self.ite(f, FALSE, TRUE)
+
+    def conjoin(self, f: BDDNode, g: BDDNode) -> BDDNode:
+        return self.ite(f, g, FALSE)
+
+    def disjoin(self, f: BDDNode, g: BDDNode) -> BDDNode:
+        return self.ite(f, TRUE, g)
+
+    def implies(self, f: BDDNode, g: BDDNode) -> BDDNode:
+        return self.ite(f, g, TRUE)
+
+    def iff(self, f: BDDNode, g: BDDNode) -> BDDNode:
+        return self.ite(f, g, self.negate(g))
+
+    # --- Formulas ---
+
+    def from_formula(self, formula: Formula) -> BDDNode:
+        """Build (or look up) the BDD for a formula, bottom-up without recursion."""
+        built = self._formulas
+        stack = [formula]
+        while stack:
+            node = stack[-1]
+            if node in built:
+                stack.pop()
+                continue
+            pending = [c for c in node.children() if c not in built]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            built[node] = self._combine(node)
+        return built[formula]
+
+    def _combine(self, node: Formula) -> BDDNode:
+        built = self._formulas
+        if isinstance(node, Variable):
+            return self.var(node.name)
+        if isinstance(node, Bottom):
+            return FALSE
+        if isinstance(node, Not):
+            return self.negate(built[node.value])
+        if isinstance(node, Conjunction):
+            result = TRUE
+            for operand in node.operands:
+                result = self.conjoin(result, built[operand])
+            return result
+        if isinstance(node, Disjunction):
+            result = FALSE
+            for operand in node.operands:
+                result = self.disjoin(result, built[operand])
+            return result
+        left, right = built[node.left], built[node.right]
+        if isinstance(node, And):
+            return self.conjoin(left, right)
+        if isinstance(node, Or):
+            return self.disjoin(left, right)
+        if isinstance(node, Implies):
+            return self.implies(left, right)
+        if isinstance(node, Iff):
+            return self.iff(left, right)
+        raise TypeError(f"Cannot build a BDD for formula type: {type(node)}")
+
+    def satisfying_assignment(self, f: BDDNode) -> Optional[Dict[str, bool]]:
+        """Return one assignment making f true; unmentioned variables may take any value."""
+        if f == FALSE:
+            return None
+        assignment: Dict[str, bool] = {}
+        while f != TRUE:
+            name = self.order[self._level[f]]
+            if self._low[f] != FALSE:
+                assignment[name] = False
+                f = self._low[f]
+            else:
+                assignment[name] = True
+                f = self._high[f]
+        return assignment
+
+    # --- Semantic queries ---
+
+    def equivalent(self, a: Formula, b: Formula) -> bool:
+        return self.from_formula(a) == self.from_formula(b)
+
+    def is_tautology(self, formula: Formula) -> bool:
+        return self.from_formula(formula) == TRUE
+
+    def is_satisfiable(self, formula: Formula) -> bool:
+        return self.from_formula(formula) != FALSE
+
+    def countermodel(self, premises: List[Formula], conclusion: Formula) -> Optional[Dict[str, bool]]:
+        """Return an assignment making every premise true and the conclusion false, if one exists."""
+        premise = TRUE
+        for p in premises:
+            premise = self.conjoin(premise, self.from_formula(p))
+        counter = self.conjoin(premise, self.negate(self.from_formula(conclusion)))
+        model = self.satisfying_assignment(counter)
+        if model is None:
+            return None
+        # Fill in don't-care variables so the model is a complete assignment
+        names = set().union(conclusion.variables, *(p.variables for p in premises))
+        return {name: model.get(name, False) for name in sorted(names)}
+
+    def entails(self, premises: List[Formula], conclusion: Formula) -> bool:
+        return self.countermodel(premises, conclusion) is None
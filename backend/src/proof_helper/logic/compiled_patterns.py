@@ -0,0 +1,127 @@
+from typing import Callable, Dict, List
+from proof_helper.core.formula import Formula, Variable, Conjunction, Disjunction
+
+# Custom rule patterns are fixed once a rule is registered, so each is compiled
+# into a tree of closures mirroring its shape. A matcher checks a node's type
+# and hands each child to the closure for the matching child pattern; a
+# variable's closure binds or compares directly. Subtrees without variables
+# compare by identity, since formulas are interned. Builders instantiate
+# conclusions the same way, without the memo table substitute() keeps.
+#
+# Closures call each other recursively, so patterns deeper than
+# MAX_COMPILED_DEPTH keep the iterative interpreted path.
+
+Subst = Dict[str, Formula]
+# matcher(target, subst, trail) -> matched; newly bound variables are appended to trail
+Matcher = Callable[[Formula, Subst, List[str]], bool]
+Builder = Callable[[Subst], Formula]
+
+MAX_COMPILED_DEPTH = 200
+
+def match_bind(pattern: Formula, target: Formula, subst: Subst, trail: List[str]) -> bool:
+    """Like Formula.match, also recording each newly bound variable on the trail."""
+    stack = [(pattern, target)]
+    while stack:
+        pattern, target = stack.pop()
+        if isinstance(pattern, Variable):
+            bound = subst.get(pattern.name)
+            if bound is None:
+                subst[pattern.name] = target
+                trail.append(pattern.name)
+            elif bound is not target:
+                return False
+            continue
+        if type(pattern) is not type(target):
+            return False
+        pattern_children, target_children = pattern.children(), target.children()
+        if len(pattern_children) != len(target_children):
+            return False
+        stack.extend(reversed(list(zip(pattern_children, target_children))))
+    return True
+
+def interpreted_matcher(pattern: Formula) -> Matcher:
+    return lambda target, subst, trail: match_bind(pattern, target, subst, trail)
+
+def interpreted_builder(pattern: Formula) -> Builder:
+    return pattern.substitute
+
+def compile_matcher(pattern: Formula) -> Matcher:
+    """Return a matcher specialized to the pattern's shape."""
+    if pattern.depth > MAX_COMPILED_DEPTH:
+        return interpreted_matcher(pattern)
+    return _compile_matcher(pattern)
+
+def compile_builder(pattern: Formula) -> Builder:
+    """Return a function instantiating the pattern under a substitution, like pattern.substitute."""
+    if pattern.depth > MAX_COMPILED_DEPTH:
+        return interpreted_builder(pattern)
+    return _compile_builder(pattern)
+
+def _compile_matcher(pattern: Formula) -> Matcher:
+    if isinstance(pattern, Variable):
+        name = pattern.name
+
+        def match_variable(target: Formula, subst: Subst, trail: List[str]) -> bool:
+            bound = subst.get(name)
+            if bound is None:
+                subst[name] = target
+                trail.append(name)
+                return True
+            return bound is target
+        return match_variable
+
+    if not pattern.variable_mask:
+        return lambda target, subst, trail: target is pattern
+
+    cls = type(pattern)
+    parts = [_compile_matcher(c) for c in pattern.children()]
+    width = len(parts)
+    # Only n-ary nodes can differ in width from a pattern of the same type
+    variadic = isinstance(pattern, (Conjunction, Disjunction))
+
+    if width == 1:
+        (first,) = parts
+
+        def match_unary(target: Formula, subst: Subst, trail: List[str]) -> bool:
+            return type(target) is cls and first(target.children()[0], subst, trail)
+        return match_unary
+
+    if width == 2 and not variadic:
+        left, right = parts
+
+        def match_binary(target: Formula, subst: Subst, trail: List[str]) -> bool:
+            if type(target) is not cls:
+                return False
+            children = target.children()
+            return left(children[0], subst, trail) and right(children[1], subst, trail)
+        return match_binary
+
+    def match_nary(target: Formula, subst: Subst, trail: List[str]) -> bool:
+        if type(target) is not cls:
+            return False
+        children = target.children()
+        if len(children) != width:
+            return False
+        for part, child in zip(parts, children):
+            if not part(child, subst, trail):
+                return False
+        return True
+    return match_nary
+
+def _compile_builder(pattern: Formula) -> Builder:
+    if isinstance(pattern, Variable):
+        name = pattern.name
+        return lambda subst: subst.get(name, pattern)
+
+    if not pattern.variable_mask:
+        return lambda subst: pattern
+
+    cls = type(pattern)
+    parts = [_compile_builder(c) for c in pattern.children()]
+    if len(parts) == 1:
+        (first,) = parts
+        return lambda subst: cls(first(subst))
+    if len(parts) == 2 and not isinstance(pattern, (Conjunction, Disjunction)):
+        left, right = parts
+        return lambda subst: cls(left(subst), right(subst))
+    return lambda subst: pattern._rebuild([part(subst) for part in parts])
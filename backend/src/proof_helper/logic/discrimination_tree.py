@@ -0,0 +1,93 @@
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+from proof_helper.core.formula import Formula, Variable
+
+# A discrimination tree is a trie over patterns written out in preorder, one
+# symbol per node: the node's type and width, or a wildcard for a pattern
+# variable. Looking up a formula walks the trie alongside the formula's
+# preorder. At each step it follows the edge for the formula's symbol, and
+# also the wildcard edge, which skips the formula's whole subtree. Every
+# pattern that could match the formula is found without trying the others.
+#
+# Repeated variables are treated as independent wildcards, so a lookup may
+# return patterns that do not actually match (A ∨ A for P ∨ Q), but never
+# misses one that does.
+
+Symbol = Hashable
+WILDCARD: Symbol = "*"
+
+def _symbol(node: Formula) -> Symbol:
+    return (type(node), len(node.children()))
+
+def _preorder(formula: Formula) -> Tuple[List[Symbol], List[int]]:
+    """Symbols of a formula in preorder, and for each the index just past its subtree."""
+    symbols: List[Symbol] = []
+    ends: List[int] = []
+    stack: List[Tuple[Formula, int]] = [(formula, -1)]
+    while stack:
+        node, start = stack.pop()
+        if start >= 0:
+            ends[start] = len(symbols)
+            continue
+        start = len(symbols)
+        symbols.append(_symbol(node))
+        ends.append(0)
+        stack.append((node, start))
+        stack.extend((c, -1) for c in reversed(node.children()))
+    return symbols, ends
+
+class _Node:
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children: Dict[Symbol, _Node] = {}
+        self.values: List[Any] = []
+
+class DiscriminationTree:
+    """Index of formula patterns, returning those that could match a given formula."""
+
+    def __init__(self):
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, pattern: Formula, value: Any) -> None:
+        node = self._root
+        stack = [pattern]
+        while stack:
+            p = stack.pop()
+            if isinstance(p, Variable):
+                symbol = WILDCARD
+            else:
+                symbol = _symbol(p)
+                stack.extend(reversed(p.children()))
+            node = node.children.setdefault(symbol, _Node())
+        node.values.append(value)
+        self._size += 1
+
+    def generalizations(self, formula: Formula) -> List[Any]:
+        """Values of every pattern that could match formula, in no particular order."""
+        symbols, ends = _preorder(formula)
+        found: List[Any] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, pos = stack.pop()
+            if pos == len(symbols):
+                found.extend(node.values)
+                continue
+            wildcard = node.children.get(WILDCARD)
+            if wildcard is not None:
+                stack.append((wildcard, ends[pos]))
+            exact = node.children.get(symbols[pos])
+            if exact is not None:
+                stack.append((exact, pos + 1))
+        return found
+
+    def generalizations_of_any(self, formulas: Iterable[Formula]) -> Dict[Any, List[Formula]]:
+        """Map each value to the formulas its pattern could match, for values matching at least one."""
+        matches: Dict[Any, List[Formula]] = {}
+        for formula in dict.fromkeys(formulas):
+            for value in self.generalizations(formula):
+                matches.setdefault(value, []).append(formula)
+        return matches
@@ -1,6 +1,8 @@
-from proof_helper.core.formula import Formula, Variable, Not, And, Or, Implies, Iff, Bottom
+from typing import Dict, List, Optional, Tuple
+from proof_helper.core.formula import Formula, Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction
 
-def score_similarity(f1: Formula, f2: Formula) -> float:
+def _leaf_score(f1: Formula, f2: Formula) -> Optional[float]:
+    """Score pairs that need no recursion, or None if the children must be scored first."""
     if type(f1) != type(f2):
         return 0.0
 
@@ -10,18 +12,61 @@ def score_similarity(f1: Formula, f2: Formula) -> float:
     if isinstance(f1, Bottom):
         return 1.0  # All bottoms are the same
 
-    if isinstance(f1, Not):
-        return 0.9 * score_similarity(f1.value, f2.value)
+    # A non-zero score needs a pair of matching leaves: a shared variable or ⊥ on both sides
+    if not f1.variable_mask & f2.variable_mask and \
+       not ("bottom" in f1.connective_counts and "bottom" in f2.connective_counts):
+        return 0.0
+
+    if not isinstance(f1, (Not, And, Or, Implies, Iff, Conjunction, Disjunction)):
+        return 0.0
 
+    # n-ary nodes are compared operand by operand, so their widths must agree
+    if len(f1.children()) != len(f2.children()):
+        return 0.0
+
+    return None
+
+def _child_pairs(f1: Formula, f2: Formula) -> List[Tuple[Formula, Formula]]:
+    if isinstance(f1, Not):
+        return [(f1.value, f2.value)]
     if isinstance(f1, And) or isinstance(f1, Or):
-        # commutative — take best matching
-        scores = [
-            (score_similarity(f1.left, f2.left) + score_similarity(f1.right, f2.right)) / 2,
-            (score_similarity(f1.left, f2.right) + score_similarity(f1.right, f2.left)) / 2
-        ]
-        return 0.9 * max(scores)
+        # commutative — both pairings are scored
+        return [(f1.left, f2.left), (f1.right, f2.right), (f1.left, f2.right), (f1.right, f2.left)]
+    return list(zip(f1.children(), f2.children()))
 
-    if isinstance(f1, Implies) or isinstance(f1, Iff):
-        return 0.9 * ((score_similarity(f1.left, f2.left) + score_similarity(f1.right, f2.right)) / 2)
+def score_similarity(f1: Formula, f2: Formula) -> float:
+    # Formulas equal up to reordering ∧/∨ operands score as if identical
+    if f1.canonical is f2.canonical:
+        f2 = f1
 
-    return 0.0
+    # Explicit-stack evaluation; pairs of interned nodes are memoized so shared
+    # subtrees are scored once.
+    scores: Dict[Tuple[Formula, Formula], float] = {}
+    stack = [(f1, f2)]
+    while stack:
+        pair = stack[-1]
+        if pair in scores:
+            stack.pop()
+            continue
+        a, b = pair
+        leaf = _leaf_score(a, b)
+        if leaf is not None:
+            scores[pair] = leaf
+            stack.pop()
+            continue
+        children = _child_pairs(a, b)
+        pending = [p for p in children if p not in scores]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        child_scores = [scores[p] for p in children]
+        if isinstance(a, Not):
+            scores[pair] = 0.9 * child_scores[0]
+        elif isinstance(a, And) or isinstance(a, Or):
+            straight = (child_scores[0] + child_scores[1]) / 2
+            crossed = (child_scores[2] + child_scores[3]) / 2
+            scores[pair] = 0.9 * max(straight, crossed)
+        else:
+            scores[pair] = 0.9 * (sum(child_scores) / len(child_scores))
+    return scores[(f1, f2)]
@@ -0,0 +1,171 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Iterator, List, Set, Tuple
+from proof_helper.core.proof import Proof, Statement, Step, Subproof
+from proof_helper.logic.rule_registry import RuleRegistry, VerdictCache
+from proof_helper.logic.verify import (
+    VerificationError, VerificationResult, proof_errors, support_content, verify_statement,
+)
+
+def _statements(subproof: Subproof) -> List[Statement]:
+    """Every statement inside a subproof, nested ones included."""
+    found: List[Statement] = []
+    stack: List[Step] = [subproof]
+    while stack:
+        step = stack.pop()
+        if isinstance(step, Subproof):
+            stack.append(step.assumption)
+            stack.extend(step.steps)
+        elif isinstance(step, Statement):
+            found.append(step)
+    return found
+
+class IncrementalVerifier:
+    """Verify successive versions of a proof, re-checking only statements whose inputs changed.
+
+    Each statement's result is cached under a key built from everything
+    verify_statement looks at: the statement's formula and rule, the content of
+    each cited step and whether that citation comes before it and is in scope.
+    Ids are not part of the key, so an edit re-checks the edited step and the
+    steps citing it, and every other step is a cache hit even if renumbered.
+    The cache is bounded and is dropped whenever the registry's rules change.
+
+    Proofs and subproofs that verify are also remembered by content hash (see
+    core/content_hash.py). A proof seen before is accepted without looking at
+    its steps, and a valid subproof pasted at another position is not checked
+    again, as long as the steps it cites from outside are unchanged.
+    """
+
+    def __init__(self, registry: RuleRegistry, max_entries: int = 1 << 16):
+        self.registry = registry
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._results: "OrderedDict[Tuple, VerificationResult]" = OrderedDict()
+        self._valid = VerdictCache(max_entries)
+        self._version = registry.version
+        self._lock = Lock()
+
+    def verify_proof(self, proof: Proof) -> VerificationResult:
+        errors = self.proof_errors(proof)
+        try:
+            return next(errors, True)
+        finally:
+            errors.close()
+
+    def proof_errors(self, proof: Proof) -> Iterator[VerificationError]:
+        """Every error in the proof, in proof order, like verify.proof_errors."""
+        if self.registry.version != self._version:
+            self.clear()
+        key = ("proof", proof.content_hash)
+        if self._valid.get(key):
+            return
+
+        memo: Dict[int, Hashable] = {}
+        trusted: Set[int] = set()  # id() of statements inside subproofs known to be valid
+        checked: Dict[int, bool] = {}
+        unverified = self._match_subproofs(proof, memo, trusted)
+
+        def check(statement: Statement, p: Proof, checker: RuleRegistry) -> VerificationResult:
+            if id(statement) in trusted:
+                return True
+            result = self._verify_statement(statement, p, checker, memo)
+            checked[id(statement)] = result is True
+            return result
+
+        valid = True
+        try:
+            for error in proof_errors(proof, self.registry, check):
+                valid = False
+                yield error
+            if valid:
+                self._valid.put(key, True)
+        finally:
+            # Also runs when the caller stops early: subproofs fully checked by then still count
+            for subproof, subproof_key in unverified:
+                if all(checked.get(id(s), False) for s in _statements(subproof)):
+                    self._valid.put(subproof_key, True)
+
+    def _match_subproofs(self, proof: Proof, memo: Dict[int, Hashable],
+                         trusted: Set[int]) -> List[Tuple[Subproof, Tuple]]:
+        """Trust the statements of subproofs known to be valid; return the other subproofs with their keys."""
+        scope = proof.scope
+        if len(scope.position) != len(scope.steps):
+            return []  # With duplicate ids, a citation may resolve outside the subproof it is in
+        unverified = []
+        stack = [s for s in proof.steps if isinstance(s, Subproof)]
+        while stack:
+            subproof = stack.pop()
+            key = self._subproof_key(subproof, proof, memo)
+            if self._valid.get(key):
+                trusted.update(id(s) for s in _statements(subproof))
+                continue
+            unverified.append((subproof, key))
+            stack.extend(s for s in subproof.steps if isinstance(s, Subproof))
+        return unverified
+
+    def _subproof_key(self, subproof: Subproof, proof: Proof, memo: Dict[int, Hashable]) -> Tuple:
+        # The content hash fixes everything inside the subproof relative to its
+        # id. What else its statements see is the steps they cite from outside:
+        # their content, and whether they come before and are in scope. For an
+        # outside step both are the same from any step inside the subproof.
+        scope = proof.scope
+        outside = []
+        for statement in _statements(subproof):
+            for pid in statement.premises:
+                if subproof.id.contains(pid):
+                    continue
+                step = proof.get_step(pid)
+                content = None if step is None else support_content(step, memo)
+                outside.append((content, pid.is_before(subproof.id), scope.is_visible(pid, subproof.id)))
+        return ("subproof", subproof.content_hash, tuple(outside))
+
+    def _verify_statement(self, statement: Statement, proof: Proof, checker: RuleRegistry,
+                          memo: Dict[int, Hashable]) -> VerificationResult:
+        key = self._key(statement, proof, memo)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self.hits += 1
+                self._results.move_to_end(key)
+        if result is True:
+            return result
+        if result is not None:
+            # Error messages name ids, which the key leaves out; the rule's
+            # verdict is still in the registry's cache
+            return verify_statement(statement, proof, checker)
+        with self._lock:
+            self.misses += 1
+        result = verify_statement(statement, proof, checker)
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return result
+
+    def _key(self, statement: Statement, proof: Proof, memo: Dict[int, Hashable]) -> Tuple:
+        # Ids are left out so renumbering steps does not miss: a citation is
+        # keyed by its content and the outcome of each id-based check on it
+        scope = proof.scope
+        in_proof = statement.id in scope.position
+        cited = []
+        found = set()
+        for pid in statement.premises:
+            step = proof.get_step(pid)
+            if step is None:
+                cited.append(None)
+                continue
+            found.add(step.id)
+            cited.append((support_content(step, memo), step.id.is_before(statement.id),
+                          not in_proof or scope.is_visible(step.id, statement.id)))
+        return (statement.formula, statement.rule, tuple(cited), found == set(statement.premises))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._valid.clear()
+            self._version = self.registry.version
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._results), "hits": self.hits, "misses": self.misses,
+                "valid_entries": len(self._valid), "valid_hits": self._valid.hits}
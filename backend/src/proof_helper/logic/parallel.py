@@ -0,0 +1,84 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple, Union
+from proof_helper.core.proof import Proof, Statement, Step
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.rules_base import Rule
+from proof_helper.logic.verify import (
+    VerificationError, VerificationResult, proof_errors, resolve_supports, rule_check_key, rule_verdict,
+)
+
+# Rule checks are the only part of verification that is expensive and
+# independent between steps. Verification runs in two phases: a sequential pass
+# does the structural checks and records each rule check it would make, then
+# the rule checks run in chunks on an executor. Results are merged back in
+# proof order, so errors are exactly those of the sequential verifier.
+
+RuleCheck = Tuple[Rule, List[Step], Statement]
+
+DEFAULT_CHUNK_SIZE = 64
+
+def _run_chunk(checks: List[RuleCheck]) -> List[bool]:
+    # Runs in a worker process. Each chunk is pickled once, so a rule shared by
+    # many checks in the chunk is only sent once.
+    return [rule.verify(supports, statement) for rule, supports, statement in checks]
+
+def parallel_proof_errors(proof: Proof, rule_checker: RuleRegistry, executor: Optional[Executor] = None,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[VerificationError]:
+    """Like verify.proof_errors, with rule checks fanned out to an executor.
+
+    Without an executor, a ProcessPoolExecutor is started for the call. Proofs
+    with no more than one chunk of rule checks are checked in this process.
+    """
+    # Phase 1: structural checks, in proof order. Each event is either an error
+    # or the index of a rule application in `applications`. Applications found
+    # in the registry's verdict cache are not checked again.
+    events: List[Union[VerificationError, int]] = []
+    applications: List[Tuple[Statement, Tuple, Optional[bool]]] = []
+    checks: List[RuleCheck] = []
+    unchecked: List[int] = []
+
+    def defer(statement: Statement, p: Proof, checker: RuleRegistry) -> VerificationResult:
+        supports = resolve_supports(statement, p, checker)
+        if isinstance(supports, VerificationError):
+            return supports
+        key = rule_check_key(statement, supports)
+        verdict = checker.verdicts.get(key)
+        events.append(len(applications))
+        if verdict is None:
+            unchecked.append(len(applications))
+            checks.append((checker.get(statement.rule), supports, statement))
+        applications.append((statement, key, verdict))
+        return True
+
+    for error in proof_errors(proof, rule_checker, defer):
+        events.append(error)
+
+    # Phase 2: rule checks
+    if len(checks) <= chunk_size:
+        verdicts = _run_chunk(checks)
+    else:
+        chunks = [checks[i:i + chunk_size] for i in range(0, len(checks), chunk_size)]
+        if executor is None:
+            with ProcessPoolExecutor() as pool:
+                verdicts = [v for chunk in pool.map(_run_chunk, chunks) for v in chunk]
+        else:
+            verdicts = [v for chunk in executor.map(_run_chunk, chunks) for v in chunk]
+
+    for i, verdict in zip(unchecked, verdicts):
+        statement, key, _ = applications[i]
+        applications[i] = (statement, key, verdict)
+        rule_checker.verdicts.put(key, verdict)
+
+    for event in events:
+        if isinstance(event, VerificationError):
+            yield event
+            continue
+        statement, _, verdict = applications[event]
+        result = rule_verdict(statement, verdict)
+        if result is not True:
+            yield result
+
+def parallel_verify_proof(proof: Proof, rule_checker: RuleRegistry, executor: Optional[Executor] = None,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> VerificationResult:
+    """Like verify.verify_proof, with rule checks fanned out to an executor."""
+    return next(parallel_proof_errors(proof, rule_checker, executor, chunk_size), True)
@@ -1,11 +1,57 @@
-from typing import Dict, Optional, List
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Iterable, Optional, List, Set
+from proof_helper.core.formula import Formula
 from proof_helper.core.proof import Step, Statement, Proof
+from proof_helper.logic.discrimination_tree import DiscriminationTree
+from proof_helper.logic.rule_schema import SchemaKey, schema_key
 from proof_helper.logic.rules_base import Rule
 from proof_helper.logic.rules_builtin import BUILTIN_RULES
 from proof_helper.logic.rules_custom import CustomRule
 from proof_helper.io.rule_storage import CustomRuleStore
 
 
+class VerdictCache:
+    """Bounded LRU map from a rule application to whether the rule applies.
+
+    Shared by every request verified against a registry, so the same exercise
+    submitted again (or re-sent after an unrelated edit) skips its rule checks.
+    """
+
+    def __init__(self, max_entries: int = 1 << 16):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, bool]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[bool]:
+        with self._lock:
+            verdict = self._entries.get(key)
+            if verdict is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return verdict
+
+    def put(self, key: Hashable, verdict: bool) -> None:
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "max_entries": self.max_entries, "hits": self.hits, "misses": self.misses}
+
 class RuleRegistry:
     def __init__(self, custom_rule_store: Optional[CustomRuleStore] = None):
         self.rules: Dict[str, Rule] = {
@@ -13,14 +59,81 @@ class RuleRegistry:
         }
 
         self.custom_rules: Dict[str, CustomRule] = {}
+        # Bumped whenever the set of rules changes, so cached verdicts can be dropped
+        self.version = 0
+        self.verdicts = VerdictCache()
+        # Custom rule premises, indexed by pattern; values are (rule name, premise index)
+        self.premise_index = DiscriminationTree()
+        # Custom rule conclusions, indexed by pattern; values are (registration order, rule name)
+        self.conclusion_index = DiscriminationTree()
+        # One representative per set of rules equal up to renaming variables;
+        # only representatives are indexed, so lookups try each such set once
+        self.schemas: Dict[SchemaKey, str] = {}
+        self.duplicates: Dict[str, str] = {}
         if custom_rule_store:
             for name, proof in custom_rule_store.list_rules().items():
-                self.custom_rules[name] = CustomRule(name, proof)
+                self._add(CustomRule(name, proof))
+
+    def _add(self, rule: CustomRule) -> None:
+        order = len(self.custom_rules)
+        self.custom_rules[rule.name()] = rule
+        representative = self.schemas.setdefault(rule.schema, rule.name())
+        if representative != rule.name():
+            self.duplicates[rule.name()] = representative
+            return
+        for i, premise in enumerate(rule.premises):
+            self.premise_index.insert(premise.formula, (rule.name(), i))
+        for conclusion in rule.conclusions:
+            self.conclusion_index.insert(conclusion.formula, (order, rule.name()))
 
     def add_custom_rule(self, name: str, proof: Proof):
         if name in self.rules or name in self.custom_rules:
             raise ValueError(f"Rule '{name}' already exists")
-        self.custom_rules[name] = CustomRule(name, proof)
+        self._add(CustomRule(name, proof))
+        self.version += 1
+        self.verdicts.clear()
+
+    def custom_rule_candidates(self, formulas: Iterable[Formula]) -> Dict[str, Set[Formula]]:
+        """Custom rules that could apply to supports with the given formulas.
+
+        Maps each rule's name to the formulas that could fill at least one of
+        its premises. Rules with a premise no formula could fill are left out;
+        rules without premises are always included.
+        """
+        matches = self.premise_index.generalizations_of_any(formulas)
+        candidates: Dict[str, Set[Formula]] = {}
+        for name, rule in self.custom_rules.items():
+            if name in self.duplicates:
+                continue
+            fillers = [matches.get((name, i)) for i in range(len(rule.premises))]
+            if all(fillers):
+                candidates[name] = set().union(*fillers)
+        return candidates
+
+    def rules_concluding(self, formula: Formula) -> List[CustomRule]:
+        """Custom rules with a conclusion that could be instantiated to formula, in registration order."""
+        found = sorted(set(self.conclusion_index.generalizations(formula)))
+        return [self.custom_rules[name] for _, name in found]
+
+    def equivalent_rule(self, proof: Proof) -> Optional[str]:
+        """Name of a custom rule equal to the one the proof would define, up to renaming variables."""
+        return self.schemas.get(schema_key([p.formula for p in proof.premises], [c.formula for c in proof.conclusions]))
+
+    def subsuming_rules(self, proof: Proof) -> List[str]:
+        """Custom rules that already conclude everything the proof does, in one step from its premises.
+
+        Anything the proof would add as a rule is then an instance of each of
+        these, possibly with premises to spare.
+        """
+        if not proof.conclusions:
+            return []
+        premises = list(proof.premises)
+        found: Optional[List[str]] = None
+        for conclusion in proof.conclusions:
+            names = [r.name() for r in self.rules_concluding(conclusion.formula)
+                     if r.supports_for(conclusion.formula, premises) is not None]
+            found = names if found is None else [n for n in found if n in names]
+        return found
 
     def get(self, name: str) -> Rule:
         if name in self.rules:
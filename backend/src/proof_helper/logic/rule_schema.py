@@ -0,0 +1,41 @@
+from typing import Dict, List, Sequence, Tuple
+from proof_helper.core.formula import Formula, Variable
+
+# A custom rule is a schema: the variables its premises bind stand for
+# arbitrary formulas, so two rules that differ only in those names (P ⊢ P ∨ ¬P
+# and Q ⊢ Q ∨ ¬Q) are the same rule. schema_key renames them canonically so
+# such rules get equal keys. Variables that only occur in conclusions are
+# literal (P ⊢ P ∨ Q concludes X ∨ Q, not X ∨ B), so they keep their names.
+#
+# Premises (and conclusions) are first ordered by their shape with every
+# variable replaced by the same placeholder, which does not depend on names.
+# Bound variables are then renamed in order of first occurrence. Formulas with equal
+# shapes keep their given order, so listing such premises differently can give
+# different keys: the key may miss an equivalence, but never reports a false one.
+
+SchemaKey = Tuple[Tuple[Formula, ...], Tuple[Formula, ...]]
+
+_HOLE = Variable("?")
+
+def _shape(formula: Formula) -> bytes:
+    return formula.substitute({name: _HOLE for name in formula.variables}).digest
+
+def _first_occurrences(formula: Formula, order: Dict[str, int]) -> None:
+    stack = [formula]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Variable):
+            order.setdefault(node.name, len(order))
+        else:
+            stack.extend(reversed(node.children()))
+
+def schema_key(premises: Sequence[Formula], conclusions: Sequence[Formula]) -> SchemaKey:
+    """Key equal for rules that are the same up to renaming the variables their premises bind."""
+    ordered: List[List[Formula]] = [sorted(fs, key=_shape) for fs in (premises, conclusions)]
+    # Every bound variable occurs in a premise; conclusion-only ones are not renamed
+    order: Dict[str, int] = {}
+    for f in ordered[0]:
+        _first_occurrences(f, order)
+    renaming = {name: Variable(f"?{i}") for name, i in order.items()}
+    return (tuple(f.substitute(renaming) for f in ordered[0]),
+            tuple(f.substitute(renaming) for f in ordered[1]))
@@ -1,7 +1,7 @@
 from functools import wraps
 from typing import Callable, Dict, List, Set, Optional
 from proof_helper.core.proof import Step, Statement, Subproof, Proof
-from proof_helper.core.formula import Formula, And, Or, Not, Bottom, Implies, Iff, Variable
+from proof_helper.core.formula import Formula, And, Or, Not, Bottom, Implies, Iff, Variable, Conjunction, conjunct_list, disjunct_list
 from proof_helper.logic.rules_custom import CustomRule
 from proof_helper.logic.rules_base import Rule
 
@@ -58,24 +58,20 @@ class AndIntroductionRule(Rule):
         if not self.is_applicable(supports):
             return False
 
-        def collect_conjuncts(formula: Formula) -> Set[Formula]:
-            if isinstance(formula, And):
-                return collect_conjuncts(formula.left) | collect_conjuncts(formula.right)
-            return {formula}
-
-        statement_conjuncts = collect_conjuncts(statement.formula)
-
+        # Conjunct sets are cached on the interned formulas
         support_conjuncts: Set[Formula] = set()
         for support in supports:
-            support_conjuncts |= collect_conjuncts(support.formula)
+            support_conjuncts |= support.formula.conjuncts
 
-        return statement_conjuncts == support_conjuncts
+        return statement.formula.conjuncts == support_conjuncts
 
     def conclude(self, supports: list[Step]) -> list[Formula]:
         if not self.is_applicable(supports):
             return []
         
-        # Generate a single top-level conjunction, nesting left-to-right
+        # Generate a single top-level conjunction, nesting left-to-right. The
+        # nested chain is what clients send and render, and it is not equal to
+        # the flat Conjunction, so conclusions stay binary
         formulas = [s.formula for s in supports]
         if not formulas:
             return []
@@ -99,13 +95,7 @@ class OrIntroductionRule(Rule):
         if not self.is_applicable(supports):
             return False
 
-        def collect_disjuncts(formula: Formula) -> Set[Formula]:
-            if isinstance(formula, Or):
-                return collect_disjuncts(formula.left) | collect_disjuncts(formula.right)
-            return {formula}
-
-        disjuncts = collect_disjuncts(statement.formula)
-        return supports[0].formula in disjuncts
+        return supports[0].formula in statement.formula.disjuncts
     
     def conclude(self, supports: list[Step], goals: Optional[list[Formula]] = None) -> list[Formula]:
         if not self.is_applicable(supports):
@@ -122,12 +112,7 @@ class OrIntroductionRule(Rule):
 
         suggested = []
         for goal in goals:
-            def collect_disjuncts(f: Formula) -> list[Formula]:
-                if isinstance(f, Or):
-                    return collect_disjuncts(f.left) + collect_disjuncts(f.right)
-                return [f]
-
-            disjuncts = collect_disjuncts(goal)
+            disjuncts = disjunct_list(goal)
 
             # If the support formula is already part of a disjunction, suggest the whole goal
             if support_formula in disjuncts:
@@ -294,32 +279,23 @@ class AndEliminationRule(Rule):
         return (
             len(supports) == 1 and
             isinstance(supports[0], Statement) and
-            isinstance(supports[0].formula, And)
+            isinstance(supports[0].formula, (And, Conjunction))
         )
 
     def verify(self, supports: list[Step], statement: Statement) -> bool:
         if not self.is_applicable(supports):
             return False
 
-        def collect_conjuncts(formula: Formula) -> Set[Formula]:
-            if isinstance(formula, And):
-                return collect_conjuncts(formula.left) | collect_conjuncts(formula.right)
-            return {formula}
+        # Every conjunct of the statement must come from the support, so its variables must too
+        if statement.formula.variable_mask & ~supports[0].formula.variable_mask:
+            return False
 
-        support_conjuncts = collect_conjuncts(supports[0].formula)
-        stmt_conjuncts = collect_conjuncts(statement.formula)
-        return stmt_conjuncts <= support_conjuncts
+        return statement.formula.conjuncts <= supports[0].formula.conjuncts
     
     def conclude(self, supports: List[Step]) -> List[Formula]:
         if not self.is_applicable(supports):
             return []
-        formula = supports[0].formula
-        def collect(f: Formula) -> List[Formula]:
-            if isinstance(f, And):
-                return collect(f.left) + collect(f.right)
-            return [f]
-
-        return collect(formula)
+        return conjunct_list(supports[0].formula)
 
 
 class OrEliminationRule(Rule):
@@ -345,12 +321,7 @@ class OrEliminationRule(Rule):
         disj = supports[0]
         subproofs = supports[1:]
 
-        def collect_disjuncts(formula: Formula) -> list[Formula]:
-            if isinstance(formula, Or):
-                return collect_disjuncts(formula.left) + collect_disjuncts(formula.right)
-            return [formula]
-
-        disjuncts = collect_disjuncts(disj.formula)
+        disjuncts = disjunct_list(disj.formula)
         if len(disjuncts) != len(subproofs):
             return False
 
@@ -1,8 +1,52 @@
 from proof_helper.core.proof import Proof, Step, Statement
-from proof_helper.core.formula import Formula
+from proof_helper.core.formula import Formula, Variable
 from proof_helper.logic.rules_base import Rule
-from typing import List, Optional
-from itertools import permutations
+from proof_helper.logic.compiled_patterns import compile_builder, compile_matcher
+from proof_helper.logic.rule_schema import schema_key
+from typing import Dict, FrozenSet, Hashable, Iterator, List, Optional, Tuple
+
+# Premises are matched against supports by backtracking search instead of
+# trying every permutation of the supports. Premises are assigned most
+# specific first, preferring those whose variables are already bound, and
+# each only to supports with the same head symbol. The variable bindings made
+# by a failed branch are undone from a trail, so bindings shared by many
+# assignments are made once. Patterns are compiled into matchers and builders
+# when the rule is created, which is when it is registered (see
+# compiled_patterns.py), so every later request reuses them.
+
+def _head(formula: Formula) -> Optional[Hashable]:
+    """Outermost connective (and width) of a formula, or None for a variable pattern."""
+    if isinstance(formula, Variable):
+        return None
+    return (type(formula), len(formula.children()))
+
+def _specificity(pattern: Formula) -> int:
+    """Number of connectives in a pattern: the more it has, the fewer formulas it matches."""
+    count = 0
+    stack = [pattern]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, Variable):
+            count += 1
+            stack.extend(node.children())
+    return count
+
+def _plan(patterns: List[Formula], bound: FrozenSet[str]) -> List[int]:
+    """Order in which to assign premises, given the variables bound before the search."""
+    order: List[int] = []
+    remaining = list(range(len(patterns)))
+    bound = set(bound)
+    while remaining:
+        # Most bound variables first, then most specific; stable on premise order
+        best = max(remaining, key=lambda i: (len(patterns[i].variables & bound), _specificity(patterns[i])))
+        remaining.remove(best)
+        order.append(best)
+        bound |= patterns[best].variables
+    return order
+
+def _undo(subst: Dict[str, Formula], trail: List[str], mark: int) -> None:
+    while len(trail) > mark:
+        del subst[trail.pop()]
 
 class CustomRule(Rule):
     def __init__(self, name: str, proof: Proof):
@@ -11,6 +55,24 @@ class CustomRule(Rule):
         self.premises = proof.premises
         self.conclusions = proof.conclusions
 
+        patterns = [p.formula for p in self.premises]
+        self._premise_heads = [_head(p) for p in patterns]
+        self._premise_matchers = [compile_matcher(p) for p in patterns]
+        self._conclusion_matchers = [compile_matcher(c.formula) for c in self.conclusions]
+        self._conclusion_builders = [compile_builder(c.formula) for c in self.conclusions]
+        self._premise_order = _plan(patterns, frozenset())
+        premise_vars: FrozenSet[str] = frozenset().union(*(p.variables for p in patterns))
+        # Conclusion variables no premise binds must appear literally in the conclusion
+        self._unbound_vars = [c.formula.variables - premise_vars for c in self.conclusions]
+        # verify() binds a conclusion's variables before assigning premises
+        self._verify_orders = [_plan(patterns, c.formula.variables) for c in self.conclusions]
+        # Equal for rules that differ only in variable names
+        self.schema = schema_key(patterns, [c.formula for c in self.conclusions])
+
+    def __reduce__(self):
+        # Compiled closures cannot be pickled; a copy (e.g. in a worker process) recompiles them
+        return (CustomRule, (self._name, self.proof))
+
     def name(self) -> str:
         return self._name
 
@@ -22,33 +84,98 @@ class CustomRule(Rule):
             return False
         return all(isinstance(s, Statement) for s in supports)
 
+    def _assignments(self, supports: List[Step], subst: Dict[str, Formula], order: List[int],
+                     chosen: Optional[List[int]] = None) -> Iterator[Dict[str, Formula]]:
+        """Extend subst so each premise matches a different support; yields once per assignment.
+
+        The yielded dict is subst itself, valid until the iteration resumes.
+        There may be more supports than premises. If given, chosen[i] is set
+        to the index of the support assigned to premise i.
+        """
+        formulas = [s.formula for s in supports]
+        by_head: Dict[Hashable, List[int]] = {}
+        for j, f in enumerate(formulas):
+            by_head.setdefault(_head(f), []).append(j)
+        everything = list(range(len(formulas)))
+        candidates = [everything if h is None else by_head.get(h, []) for h in self._premise_heads]
+        if not all(candidates):
+            return
+
+        matchers = self._premise_matchers
+        used = [False] * len(formulas)
+        trail: List[str] = []
+
+        def search(depth: int) -> Iterator[Dict[str, Formula]]:
+            if depth == len(order):
+                yield subst
+                return
+            i = order[depth]
+            for j in candidates[i]:
+                if used[j]:
+                    continue
+                mark = len(trail)
+                if matchers[i](formulas[j], subst, trail):
+                    if chosen is not None:
+                        chosen[i] = j
+                    used[j] = True
+                    yield from search(depth + 1)
+                    used[j] = False
+                _undo(subst, trail, mark)
+
+        yield from search(0)
+
     def verify(self, supports: List[Step], statement: Statement) -> bool:
         if not self.is_applicable(supports):
             return False
-        
+
         # Special case: no-premise rule (supports must be empty)
         if not self.premises and not supports:
             return any(statement.formula.match(c.formula, {}) for c in self.conclusions)
 
-        # Try all permutations of supports matched to premises
-        for perm in permutations(supports, len(self.premises)):
-            subst: dict[str, Formula] = {}
-            if all(prem.formula.match(sup.formula, subst) for prem, sup in zip(self.premises, perm)):
-                for concl in self.conclusions:
-                    if concl.formula.substitute(subst) == statement.formula:
-                        return True
+        for subst, order in self._goal_bindings(statement.formula):
+            for _ in self._assignments(supports, subst, order):
+                return True
         return False
-    
+
+    def _goal_bindings(self, goal: Formula) -> Iterator[Tuple[Dict[str, Formula], List[int]]]:
+        """For each conclusion that can be instantiated to goal, its bindings and the premise order to use."""
+        for match, unbound, order in zip(self._conclusion_matchers, self._unbound_vars, self._verify_orders):
+            # Matching the conclusion first binds its variables, which prunes the premise search
+            subst: Dict[str, Formula] = {}
+            if not match(goal, subst, []):
+                continue
+            if any(subst[v] is not Variable(v) for v in unbound):
+                continue
+            yield subst, order
+
+    def supports_for(self, goal: Formula, steps: List[Step]) -> Optional[List[Step]]:
+        """Steps from which this rule concludes goal, one per premise in premise order, or None."""
+        if not self.premises:
+            return [] if self.verify([], Statement(id=None, formula=goal)) else None
+        statements = [s for s in steps if isinstance(s, Statement)]
+        chosen = [0] * len(self.premises)
+        for subst, order in self._goal_bindings(goal):
+            for _ in self._assignments(statements, subst, order, chosen):
+                return [statements[j] for j in chosen]
+        return None
+
+    def subgoals(self, goal: Formula) -> List[Formula]:
+        """Premises fully determined by concluding goal, instantiated: proving them is a step towards goal."""
+        found: List[Formula] = []
+        for subst, _ in self._goal_bindings(goal):
+            for premise in self.premises:
+                if premise.formula.variables <= subst.keys():
+                    found.append(premise.formula.substitute(subst))
+        return list(dict.fromkeys(found))
+
     def conclude(self, supports: list[Step]) -> list[Formula]:
         if not self.is_applicable(supports):
             return []
-        
+
         # Special case: no-premise rule (supports must be empty)
         if not self.premises and not supports:
             return [c.formula for c in self.conclusions]
 
-        for perm in permutations(supports, len(self.premises)):
-            subst: dict[str, Formula] = {}
-            if all(prem.formula.match(sup.formula, subst) for prem, sup in zip(self.premises, perm)):
-                return [concl.formula.substitute(subst) for concl in self.conclusions]
+        for subst in self._assignments(supports, {}, self._premise_order):
+            return [build(subst) for build in self._conclusion_builders]
         return []
@@ -0,0 +1,354 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+from proof_helper.core.formula import Formula, Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction
+
+# Literals use the DIMACS convention: variable v is the int v > 0 and its
+# negation is -v. Clauses are lists of literals.
+
+Clause = List[int]
+
+def _luby(i: int) -> int:
+    """The i-th element (1-based) of the Luby restart sequence 1, 1, 2, 1, 1, 2, 4, ..."""
+    size, seq = 1, 0
+    while size < i + 1:
+        seq += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        seq -= 1
+        i %= size
+    return 1 << seq
+
+class SATSolver:
+    """A small conflict-driven clause-learning SAT solver.
+
+    Uses two watched literals per clause, first-UIP learning with
+    non-chronological backjumping, VSIDS-style variable activities with phase
+    saving, and Luby restarts.
+    """
+
+    RESTART_UNIT = 100
+    ACTIVITY_DECAY = 0.95
+
+    def __init__(self, num_vars: int = 0):
+        self.num_vars = 0
+        self.clauses: List[Clause] = []
+        self.watches: Dict[int, List[int]] = {}
+        self.values: List[int] = [0]        # per variable: 1 true, -1 false, 0 unassigned
+        self.levels: List[int] = [0]
+        self.reasons: List[Optional[int]] = [None]
+        self.activity: List[float] = [0.0]
+        self.phase: List[int] = [-1]
+        self.trail: List[int] = []
+        self.trail_lim: List[int] = []
+        self.qhead = 0
+        self.var_inc = 1.0
+        self.heap: List[Tuple[float, int]] = []
+        self.ok = True
+        self.conflicts = 0
+        self.decisions = 0
+        for _ in range(num_vars):
+            self.new_var()
+
+    def new_var(self) -> int:
+        self.num_vars += 1
+        v = self.num_vars
+        self.watches[v] = []
+        self.watches[-v] = []
+        self.values.append(0)
+        self.levels.append(0)
+        self.reasons.append(None)
+        self.activity.append(0.0)
+        self.phase.append(-1)
+        heapq.heappush(self.heap, (0.0, v))
+        return v
+
+    # --- Clauses ---
+
+    def _value(self, lit: int) -> int:
+        v = self.values[abs(lit)]
+        return v if lit > 0 else -v
+
+    def add_clause(self, lits: Clause) -> bool:
+        """Add a clause before solving. Returns False once the formula is known unsatisfiable."""
+        if not self.ok:
+            return False
+        clause: Clause = []
+        for lit in lits:
+            while abs(lit) > self.num_vars:
+                self.new_var()
+            if -lit in clause:
+                return True  # Tautology
+            value = self._value(lit)
+            if value == 1:
+                return True  # Already satisfied at level 0
+            if value == 0 and lit not in clause:
+                clause.append(lit)
+        if not clause:
+            self.ok = False
+        elif len(clause) == 1:
+            self._enqueue(clause[0], None)
+            self.ok = self._propagate() is None
+        else:
+            self._attach(clause)
+        return self.ok
+
+    def _attach(self, clause: Clause) -> int:
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        self.watches[clause[0]].append(index)
+        self.watches[clause[1]].append(index)
+        return index
+
+    # --- Search ---
+
+    def _enqueue(self, lit: int, reason: Optional[int]) -> None:
+        v = abs(lit)
+        self.values[v] = 1 if lit > 0 else -1
+        self.levels[v] = len(self.trail_lim)
+        self.reasons[v] = reason
+        self.trail.append(lit)
+
+    def _propagate(self) -> Optional[int]:
+        """Unit propagation over the watch lists; returns a conflicting clause index if any."""
+        values, clauses, watches = self.values, self.clauses, self.watches
+        while self.qhead < len(self.trail):
+            false_lit = -self.trail[self.qhead]
+            self.qhead += 1
+            watching = watches[false_lit]
+            i = j = 0
+            n = len(watching)
+            while i < n:
+                ci = watching[i]
+                i += 1
+                c = clauses[ci]
+                if c[0] == false_lit:
+                    c[0], c[1] = c[1], c[0]
+                first = c[0]
+                first_value = values[abs(first)] if first > 0 else -values[abs(first)]
+                if first_value == 1:
+                    watching[j] = ci
+                    j += 1
+                    continue
+                for k in range(2, len(c)):
+                    lit = c[k]
+                    if (values[abs(lit)] if lit > 0 else -values[abs(lit)]) != -1:
+                        c[1], c[k] = lit, c[1]
+                        watches[lit].append(ci)
+                        break
+                else:
+                    watching[j] = ci
+                    j += 1
+                    if first_value == -1:
+                        while i < n:
+                            watching[j] = watching[i]
+                            j += 1
+                            i += 1
+                        del watching[j:]
+                        return ci
+                    self._enqueue(first, ci)
+            del watching[j:]
+        return None
+
+    def _analyze(self, conflict: int) -> Tuple[Clause, int]:
+        """First-UIP conflict analysis; returns the learnt clause and the backjump level."""
+        level = len(self.trail_lim)
+        learnt: Clause = [0]
+        seen = set()
+        counter = 0
+        lit = 0
+        index = len(self.trail) - 1
+        clause = self.clauses[conflict]
+        while True:
+            for q in (clause if lit == 0 else clause[1:]):
+                v = abs(q)
+                if v not in seen and self.levels[v] > 0:
+                    seen.add(v)
+                    self._bump(v)
+                    if self.levels[v] == level:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            lit = self.trail[index]
+            index -= 1
+            counter -= 1
+            if counter == 0:
+                break
+            clause = self.clauses[self.reasons[abs(lit)]]
+        learnt[0] = -lit
+
+        if len(learnt) == 1:
+            return learnt, 0
+        # Watch the literal from the highest remaining level second
+        best = max(range(1, len(learnt)), key=lambda k: self.levels[abs(learnt[k])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.levels[abs(learnt[1])]
+
+    def _bump(self, v: int) -> None:
+        self.activity[v] += self.var_inc
+        if self.activity[v] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[u], u) for u in range(1, self.num_vars + 1) if not self.values[u]]
+            heapq.heapify(self.heap)
+        elif not self.values[v]:
+            heapq.heappush(self.heap, (-self.activity[v], v))
+
+    def _backtrack(self, level: int) -> None:
+        if len(self.trail_lim) <= level:
+            return
+        start = self.trail_lim[level]
+        for lit in self.trail[start:]:
+            v = abs(lit)
+            self.phase[v] = self.values[v]
+            self.values[v] = 0
+            self.reasons[v] = None
+            heapq.heappush(self.heap, (-self.activity[v], v))
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    def _pick_branch(self) -> int:
+        while self.heap:
+            neg_activity, v = heapq.heappop(self.heap)
+            # Skip assigned variables and stale entries left behind by bumps
+            if not self.values[v] and -neg_activity == self.activity[v]:
+                return v if self.phase[v] > 0 else -v
+        return 0
+
+    def solve(self) -> Optional[Dict[int, bool]]:
+        """Return a satisfying assignment by variable number, or None if unsatisfiable."""
+        if not self.ok or self._propagate() is not None:
+            self.ok = False
+            return None
+        restarts = 0
+        budget = self.RESTART_UNIT * _luby(restarts)
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                if not self.trail_lim:
+                    self.ok = False
+                    return None
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._enqueue(learnt[0], self._attach(learnt))
+                self.var_inc /= self.ACTIVITY_DECAY
+                budget -= 1
+                continue
+            if budget <= 0:
+                restarts += 1
+                budget = self.RESTART_UNIT * _luby(restarts)
+                self._backtrack(0)
+                continue
+            lit = self._pick_branch()
+            if lit == 0:
+                model = {v: self.values[v] > 0 for v in range(1, self.num_vars + 1)}
+                self._backtrack(0)
+                return model
+            self.decisions += 1
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(lit, None)
+
+# === Tseitin Encoding ===
+
+class CNFEncoder:
+    """Tseitin-encode formulas into a SATSolver, one solver variable per distinct subformula."""
+
+    def __init__(self, solver: Optional[SATSolver] = None):
+        self.solver = solver or SATSolver()
+        self.variables: Dict[str, int] = {}
+        self._literals: Dict[Formula, int] = {}
+
+    def encode(self, formula: Formula) -> int:
+        """Return a literal that is true exactly when formula is."""
+        literals = self._literals
+        stack = [formula]
+        while stack:
+            node = stack[-1]
+            if node in literals:
+                stack.pop()
+                continue
+            pending = [c for c in node.children() if c not in literals]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            literals[node] = self._define(node)
+        return literals[formula]
+
+    def _define(self, node: Formula) -> int:
+        add = self.solver.add_clause
+        if isinstance(node, Variable):
+            v = self.variables.get(node.name)
+            if v is None:
+                v = self.variables[node.name] = self.solver.new_var()
+            return v
+        if isinstance(node, Not):
+            return -self._literals[node.value]
+        x = self.solver.new_var()
+        if isinstance(node, Bottom):
+            add([-x])
+            return x
+        if isinstance(node, (Conjunction, Disjunction)):
+            # One clause per operand plus one wide clause, rather than a chain of binary definitions
+            sign = 1 if isinstance(node, Conjunction) else -1
+            operands = [sign * self._literals[c] for c in node.operands]
+            for a in operands:
+                add([-sign * x, a])
+            add([sign * x] + [-a for a in operands])
+            return x
+        a, b = self._literals[node.left], self._literals[node.right]
+        if isinstance(node, And):
+            add([-x, a])
+            add([-x, b])
+            add([x, -a, -b])
+        elif isinstance(node, Or):
+            add([-x, a, b])
+            add([x, -a])
+            add([x, -b])
+        elif isinstance(node, Implies):
+            add([-x, -a, b])
+            add([x, a])
+            add([x, -b])
+        elif isinstance(node, Iff):
+            add([-x, -a, b])
+            add([-x, a, -b])
+            add([x, a, b])
+            add([x, -a, -b])
+        else:
+            raise TypeError(f"Cannot encode formula type: {type(node)}")
+        return x
+
+    def assert_formula(self, formula: Formula, value: bool = True) -> None:
+        lit = self.encode(formula)
+        self.solver.add_clause([lit if value else -lit])
+
+    def model(self, assignment: Dict[int, bool]) -> Dict[str, bool]:
+        return {name: assignment[v] for name, v in sorted(self.variables.items())}
+
+# === Semantic Queries ===
+
+def is_satisfiable(formula: Formula) -> bool:
+    encoder = CNFEncoder()
+    encoder.assert_formula(formula)
+    return encoder.solver.solve() is not None
+
+def countermodel(premises: List[Formula], conclusion: Formula) -> Optional[Dict[str, bool]]:
+    """Return an assignment making every premise true and the conclusion false, if one exists."""
+    encoder = CNFEncoder()
+    for p in premises:
+        encoder.assert_formula(p)
+    encoder.assert_formula(conclusion, False)
+    assignment = encoder.solver.solve()
+    if assignment is None:
+        return None
+    return encoder.model(assignment)
+
+def entails(premises: List[Formula], conclusion: Formula) -> bool:
+    return countermodel(premises, conclusion) is None
@@ -0,0 +1,61 @@
+from typing import Dict, List, Optional, Tuple
+from proof_helper.core.formula import Formula, FINGERPRINT_MASK, fingerprint_assignment
+from proof_helper.core.proof import Proof, Statement
+from proof_helper.logic import truth_table, sat
+from proof_helper.logic.bdd import BDDManager, BDDTooLarge
+
+Countermodel = Optional[Dict[str, bool]]
+
+# BDDs decide structured problems (long chains, xor-like formulas) quickly but
+# can blow up on others, so a BDD that grows past this gives way to SAT
+BDD_MAX_NODES = 1 << 16
+
+def countermodel(premises: List[Formula], conclusion: Formula) -> Countermodel:
+    """Return an assignment making every premise true and the conclusion false, if one exists.
+
+    Problems whose truth table is small enough (see truth_table.MAX_CELLS) use
+    it. Larger ones first try the 64 sample
+    assignments behind the formulas' fingerprints, then a BDD of bounded size,
+    then the SAT solver.
+    """
+    names = set().union(conclusion.variables, *(p.variables for p in premises))
+    size = conclusion.size + sum(p.size for p in premises)
+    if len(names) <= truth_table.MAX_VARIABLES and (size << len(names)) <= truth_table.MAX_CELLS:
+        return truth_table.countermodel(premises, conclusion)
+    samples = FINGERPRINT_MASK ^ conclusion.fingerprint
+    for p in premises:
+        samples &= p.fingerprint
+    if samples:
+        return fingerprint_assignment((samples & -samples).bit_length() - 1, names)
+    try:
+        return BDDManager(max_nodes=BDD_MAX_NODES).countermodel(premises, conclusion)
+    except BDDTooLarge:
+        return sat.countermodel(premises, conclusion)
+
+def entails(premises: List[Formula], conclusion: Formula) -> bool:
+    return countermodel(premises, conclusion) is None
+
+def equivalent(a: Formula, b: Formula) -> bool:
+    if a is b or a.canonical is b.canonical:
+        return True
+    if a.fingerprint != b.fingerprint:
+        return False
+    return countermodel([a], b) is None and countermodel([b], a) is None
+
+def unprovable_conclusion(proof: Proof) -> Optional[Tuple[Statement, Dict[str, bool]]]:
+    """Return the first conclusion not entailed by the premises, with a countermodel."""
+    premises = [p.formula for p in proof.premises]
+    for c in proof.conclusions:
+        model = countermodel(premises, c.formula)
+        if model is not None:
+            return c, model
+    return None
+
+def proof_goal_countermodel(proof: Proof) -> Countermodel:
+    """Check that the proof's premises entail each of its conclusions.
+
+    Returns None when the exercise is provable, otherwise an assignment showing
+    why some conclusion cannot be derived.
+    """
+    failure = unprovable_conclusion(proof)
+    return failure[1] if failure else None
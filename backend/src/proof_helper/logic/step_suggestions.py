@@ -1,28 +1,84 @@
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from itertools import combinations
 from proof_helper.core.proof import Step, Statement, Subproof, Proof
-from proof_helper.core.formula import Formula
+from proof_helper.core.formula import Formula, fingerprints
 from proof_helper.logic.rule_registry import RuleRegistry
 from proof_helper.logic.rules_base import Rule
 from proof_helper.logic.formula_similarity import score_similarity
+from proof_helper.logic.semantics import equivalent
+
+def drop_equivalent_suggestions(suggestions: List[Tuple[Statement, float]]) -> List[Tuple[Statement, float]]:
+    """Keep only the first suggestion of each rule among logically equivalent formulas."""
+    kept: List[Tuple[Statement, float]] = []
+    buckets: Dict[Tuple[str, int], List[Formula]] = {}
+    prints = fingerprints(s.formula for s, _ in suggestions)
+    for (stmt, score), fp in zip(suggestions, prints):
+        # Fingerprints differ for most pairs, so full equivalence checks are rare
+        bucket = buckets.setdefault((stmt.rule, fp), [])
+        if any(equivalent(stmt.formula, f) for f in bucket):
+            continue
+        bucket.append(stmt.formula)
+        kept.append((stmt, score))
+    return kept
+
+# How many rule applications backwards from a goal custom rules are searched
+MAX_GOAL_DEPTH = 2
+
+def goal_directed_steps(goals: List[Formula], statements: List[Statement],
+                        registry: RuleRegistry) -> List[Tuple[Statement, float]]:
+    """Custom rule steps found by working backwards from the goals.
+
+    A rule concluding a goal is suggested when the statements can fill its
+    premises. Otherwise the premises that concluding the goal fixes become
+    goals themselves, up to MAX_GOAL_DEPTH applications back. Each
+    application back scales the score by 0.9, as in score_similarity.
+    """
+    suggestions: List[Tuple[Statement, float]] = []
+    available = {s.formula for s in statements}
+    seen = set()
+    frontier = [(goal, 0) for goal in goals]
+    for goal, depth in frontier:  # Breadth-first: the list grows while it is walked
+        if goal in seen:
+            continue
+        seen.add(goal)
+        for rule in registry.rules_concluding(goal):
+            supports = rule.supports_for(goal, statements)
+            if supports is not None:
+                stmt = Statement(id=None, formula=goal, rule=rule.name(), premises=[s.id for s in supports])
+                suggestions.append((stmt, 0.9 ** depth))
+            elif depth < MAX_GOAL_DEPTH:
+                frontier.extend((sub, depth + 1) for sub in rule.subgoals(goal) if sub not in available)
+    return suggestions
 
 def generate_next_steps(proof: Proof, registry: RuleRegistry) -> List[Tuple[Statement, float]]:
     suggestions: List[Tuple[Statement, float]] = []
-    all_steps = proof.premises + proof.steps
+    # Everything a new step after the last one may cite
+    all_steps = proof.scope.visible_steps()
+    statements = [s for s in all_steps if isinstance(s, Statement)]
+    rules: List[Tuple[Rule, List[Step]]] = [(rule, all_steps) for rule in registry.get_builtin_rules().values()]
+
+    # Custom rules only take statements, and each support must fill one of the
+    # rule's premises, so each rule is only tried on statements that could
+    candidates = registry.custom_rule_candidates(s.formula for s in statements)
+    for name, fillers in candidates.items():
+        rules.append((registry.get(name), [s for s in statements if s.formula in fillers]))
+
+    # Goals also pull in custom rule steps found by working backwards from them
+    if proof.conclusions:
+        suggestions.extend(goal_directed_steps([c.formula for c in proof.conclusions], statements, registry))
 
-    for rule in registry.get_all_rules():
+    for rule, steps in rules:
         
         expected = rule.num_supports()
 
         # Skip if not enough statements to satisfy fixed-arity rules
-        if expected is not None and len(all_steps) < expected:
+        if expected is not None and len(steps) < expected:
             continue
 
-        from itertools import combinations
         support_sets = (
-            combinations(all_steps, expected)
+            combinations(steps, expected)
             if expected is not None
-            else [all_steps]
+            else [steps]
         )
 
         for support_set in support_sets:
@@ -50,4 +106,4 @@ def generate_next_steps(proof: Proof, registry: RuleRegistry) -> List[Tuple[Stat
                 suggestions.append((stmt, score))
 
     suggestions.sort(key=lambda pair: -pair[1])
-    return list(filter(lambda pair: pair[1] != 0, suggestions))
+    return drop_equivalent_suggestions(list(filter(lambda pair: pair[1] != 0, suggestions)))
@@ -0,0 +1,142 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+from proof_helper.core.formula import Formula, Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction
+
+# A truth table over n variables is a 2**n bit integer: bit k holds the value of
+# the formula under assignment k, where variable i is true iff bit i of k is set.
+# Python's arbitrary-precision integers evaluate all assignments of a connective
+# in a single bitwise operation.
+
+MAX_VARIABLES = 24
+# Evaluating a formula touches every row once per node, so callers choosing
+# between backends should keep rows × nodes under this (tens of milliseconds)
+MAX_CELLS = 1 << 28
+
+class TruthTable:
+    def __init__(self, variables: Sequence[str]):
+        if len(variables) > MAX_VARIABLES:
+            raise ValueError(f"Truth tables support at most {MAX_VARIABLES} variables, got {len(variables)}")
+        self.variables = list(variables)
+        self.rows = 1 << len(self.variables)
+        self.full = (1 << self.rows) - 1
+        self._masks: Dict[str, int] = {}
+        for i, name in enumerate(self.variables):
+            # Blocks of 2**i zeros followed by 2**i ones, repeated across all rows
+            block = 1 << i
+            mask = ((1 << block) - 1) << block
+            width = 2 * block
+            while width < self.rows:
+                mask |= mask << width
+                width *= 2
+            self._masks[name] = mask
+        self._cache: Dict[Formula, int] = {}
+
+    @classmethod
+    def for_formulas(cls, formulas: Iterable[Formula]) -> "TruthTable":
+        names = set()
+        for f in formulas:
+            names |= f.variables
+        return cls(sorted(names))
+
+    def evaluate(self, formula: Formula) -> int:
+        """Return the bitset of assignments under which formula is true.
+
+        Only the result is kept. A subformula's table is dropped once every
+        node using it has been computed, so memory follows the widest point
+        of the formula rather than its size.
+        """
+        cache = self._cache
+        if formula in cache:
+            return cache[formula]
+        uses: Dict[Formula, int] = {}
+        seen = {formula}
+        stack = [formula]
+        while stack:
+            for child in stack.pop().children():
+                uses[child] = uses.get(child, 0) + 1
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+
+        values: Dict[Formula, int] = {}
+        stack = [formula]
+        while stack:
+            node = stack[-1]
+            if node in values:
+                stack.pop()
+                continue
+            children = node.children()
+            pending = [c for c in children if c not in values]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            values[node] = self._combine(node, values)
+            for child in children:
+                uses[child] -= 1
+                if not uses[child]:
+                    del values[child]
+        cache[formula] = values[formula]
+        return cache[formula]
+
+    def _combine(self, node: Formula, cache: Dict[Formula, int]) -> int:
+        if isinstance(node, Variable):
+            if node.name not in self._masks:
+                raise ValueError(f"Variable {node.name} is not in the truth table")
+            return self._masks[node.name]
+        if isinstance(node, Bottom):
+            return 0
+        if isinstance(node, Not):
+            return self.full ^ cache[node.value]
+        if isinstance(node, Conjunction):
+            rows = self.full
+            for operand in node.operands:
+                rows &= cache[operand]
+            return rows
+        if isinstance(node, Disjunction):
+            rows = 0
+            for operand in node.operands:
+                rows |= cache[operand]
+            return rows
+        left, right = cache[node.left], cache[node.right]
+        if isinstance(node, And):
+            return left & right
+        if isinstance(node, Or):
+            return left | right
+        if isinstance(node, Implies):
+            return (self.full ^ left) | right
+        if isinstance(node, Iff):
+            return self.full ^ (left ^ right)
+        raise TypeError(f"Cannot evaluate formula type: {type(node)}")
+
+    def assignment(self, row: int) -> Dict[str, bool]:
+        return {name: bool(row >> i & 1) for i, name in enumerate(self.variables)}
+
+# === Semantic Queries ===
+
+def is_tautology(formula: Formula) -> bool:
+    table = TruthTable.for_formulas([formula])
+    return table.evaluate(formula) == table.full
+
+def is_satisfiable(formula: Formula) -> bool:
+    table = TruthTable.for_formulas([formula])
+    return table.evaluate(formula) != 0
+
+def are_equivalent(a: Formula, b: Formula) -> bool:
+    if a is b:
+        return True
+    table = TruthTable.for_formulas([a, b])
+    return table.evaluate(a) == table.evaluate(b)
+
+def countermodel(premises: List[Formula], conclusion: Formula) -> Optional[Dict[str, bool]]:
+    """Return an assignment making every premise true and the conclusion false, if one exists."""
+    table = TruthTable.for_formulas(premises + [conclusion])
+    rows = table.full
+    for p in premises:
+        rows &= table.evaluate(p)
+    rows &= table.full ^ table.evaluate(conclusion)
+    if not rows:
+        return None
+    return table.assignment((rows & -rows).bit_length() - 1)
+
+def entails(premises: List[Formula], conclusion: Formula) -> bool:
+    return countermodel(premises, conclusion) is None
@@ -1,4 +1,5 @@
-from typing import List, Union, NamedTuple
+from concurrent.futures import Executor
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union, NamedTuple
 from proof_helper.core.proof import Proof, StepID
 from proof_helper.core.proof import Statement, Subproof, Step
 from proof_helper.logic.rule_registry import RuleRegistry
@@ -9,7 +10,20 @@ class VerificationError(NamedTuple):
 
 VerificationResult = Union[bool, VerificationError]
 
+# Checks one statement in the context of its proof; see verify_statement
+StatementCheck = Callable[[Statement, Proof, RuleRegistry], VerificationResult]
+
 def verify_statement(statement: Statement, proof: Proof, checker: RuleRegistry) -> VerificationResult:
+    supports = resolve_supports(statement, proof, checker)
+    if isinstance(supports, VerificationError):
+        return supports
+    return check_rule(statement, supports, checker)
+
+def resolve_supports(statement: Statement, proof: Proof, checker: RuleRegistry) -> Union[List[Step], VerificationError]:
+    """Run the structural checks on a statement and return the steps it cites.
+
+    Everything verify_statement checks except the rule application itself.
+    """
     # Check rule presence
     if statement.rule is None:
         return VerificationError(step_id=str(statement.id), message="Missing rule on statement")
@@ -24,13 +38,20 @@ def verify_statement(statement: Statement, proof: Proof, checker: RuleRegistry)
             return VerificationError(step_id=str(statement.id), message=f"Referenced step {pid} not found")
         supports.append(step)
 
-    # Check all supports occur before the current step
+    # Check all supports occur before the current step and are still in scope
+    scope = proof.scope
+    in_proof = statement.id in scope.position
     for support in supports:
         if not support.id.is_before(statement.id):
             return VerificationError(
                 step_id=str(statement.id),
                 message=f"Step {support.id} must occur before {statement.id}"
             )
+        if in_proof and not scope.is_visible(support.id, statement.id):
+            return VerificationError(
+                step_id=str(statement.id),
+                message=f"Step {support.id} is not in scope at {statement.id}"
+            )
 
     # Check the cited steps match the premises
     actual_ids = {s.id for s in supports}
@@ -40,65 +61,118 @@ def verify_statement(statement: Statement, proof: Proof, checker: RuleRegistry)
             step_id=str(statement.id),
             message="Mismatch between cited step IDs and premise list"
         )
+    return supports
 
-    # Run the rule’s verify method
-    rule = checker.get(statement.rule)
-    if rule.verify(supports, statement):
-        return True
-    else:
-        return VerificationError(step_id=str(statement.id), message=f"Rule {statement.rule} failed to apply")
+def support_content(step: Step, memo: Optional[Dict[int, Hashable]] = None) -> Hashable:
+    """What a rule can see of a cited step: its formula, or the shape of a subproof.
 
-def verify_subproof(subproof: Subproof, proof: Proof, rule_checker: RuleRegistry) -> VerificationResult:
-    if not isinstance(subproof.assumption, Statement):
-        return VerificationError(str(subproof.id), "Subproof assumption must be a Statement")
+    Ids and citations are left out, so renumbering or re-citing a step does not
+    change the content its dependents see. Formulas are interned, so they serve
+    as their own structural keys.
+    """
+    if isinstance(step, Statement):
+        return step.formula
+    memo = {} if memo is None else memo
+    key = memo.get(id(step))
+    if key is None:
+        key = memo[id(step)] = (
+            "subproof",
+            step.assumption.formula,
+            tuple(support_content(s, memo) for s in step.steps),
+        )
+    return key
+
+def rule_check_key(statement: Statement, supports: List[Step]) -> Tuple:
+    """Key of a rule application in the registry's verdict cache."""
+    return (statement.rule, statement.formula, tuple(support_content(s) for s in supports))
+
+def check_rule(statement: Statement, supports: List[Step], checker: RuleRegistry) -> VerificationResult:
+    # Run the rule’s verify method, unless this application has been seen before
+    key = rule_check_key(statement, supports)
+    applies = checker.verdicts.get(key)
+    if applies is None:
+        rule = checker.get(statement.rule)
+        applies = rule.verify(supports, statement)
+        checker.verdicts.put(key, applies)
+    return rule_verdict(statement, applies)
+
+def rule_verdict(statement: Statement, applies: bool) -> VerificationResult:
+    if applies:
+        return True
+    return VerificationError(step_id=str(statement.id), message=f"Rule {statement.rule} failed to apply")
 
-    if subproof.assumption.rule != "Assumption":
-        return VerificationError(str(subproof.assumption.id), "Subproof assumption must use rule 'Assumption'")
+# The verify_* functions stop at the first error. Each is the first item of the
+# matching *_errors generator, which keeps going and yields every error in proof
+# order. Statements are checked independently, so an error never hides later ones.
 
-    result = verify_statement(subproof.assumption, proof, rule_checker)
-    if result is not True:
-        return result
+def subproof_errors(subproof: Subproof, proof: Proof, rule_checker: RuleRegistry,
+                    check: StatementCheck = verify_statement) -> Iterator[VerificationError]:
+    if not isinstance(subproof.assumption, Statement):
+        yield VerificationError(str(subproof.id), "Subproof assumption must be a Statement")
+    else:
+        if subproof.assumption.rule != "Assumption":
+            yield VerificationError(str(subproof.assumption.id), "Subproof assumption must use rule 'Assumption'")
+        else:
+            result = check(subproof.assumption, proof, rule_checker)
+            if result is not True:
+                yield result
 
     for step in subproof.steps:
-        result = verify_step(step, proof, rule_checker)
-        if result is not True:
-            return result
+        yield from step_errors(step, proof, rule_checker, check)
 
-    return True
-
-def verify_step(step: Step, proof: Proof, rule_checker: RuleRegistry) -> VerificationResult:
+def step_errors(step: Step, proof: Proof, rule_checker: RuleRegistry,
+                check: StatementCheck = verify_statement) -> Iterator[VerificationError]:
     if isinstance(step, Statement):
-        return verify_statement(step, proof, rule_checker)
+        result = check(step, proof, rule_checker)
+        if result is not True:
+            yield result
     elif isinstance(step, Subproof):
-        return verify_subproof(step, proof, rule_checker)
-    return VerificationError("?", "Step is neither Statement nor Subproof")
+        yield from subproof_errors(step, proof, rule_checker, check)
+    else:
+        yield VerificationError("?", "Step is neither Statement nor Subproof")
 
-def verify_proof(proof: Proof, rule_checker: RuleRegistry) -> VerificationResult:
+def proof_errors(proof: Proof, rule_checker: RuleRegistry,
+                 check: StatementCheck = verify_statement) -> Iterator[VerificationError]:
     for premise in proof.premises:
         if not isinstance(premise, Statement):
-            return VerificationError(str(premise.id), "Premise must be a Statement")
-
-        if premise.rule != "Assumption":
-            return VerificationError(str(premise.id), "Premise must use rule 'Assumption'")
-
-        result = verify_statement(premise, proof, rule_checker)
-        if result is not True:
-            return result
+            yield VerificationError(str(premise.id), "Premise must be a Statement")
+        elif premise.rule != "Assumption":
+            yield VerificationError(str(premise.id), "Premise must use rule 'Assumption'")
+        else:
+            result = check(premise, proof, rule_checker)
+            if result is not True:
+                yield result
 
     for step in proof.steps:
-        result = verify_step(step, proof, rule_checker)
-        if result is not True:
-            return result
+        yield from step_errors(step, proof, rule_checker, check)
 
     for conclusion in proof.conclusions:
         if not isinstance(conclusion, Statement):
-            return VerificationError(str(conclusion.id), "Conclusion must be a Statement")
-
-        if conclusion.rule != "Reiteration":
-            return VerificationError(str(conclusion.id), "Conclusion must use rule 'Reiteration'")
-
-        result = verify_statement(conclusion, proof, rule_checker)
-        if result is not True:
-            return result
-
-    return True
\ No newline at end of file
+            yield VerificationError(str(conclusion.id), "Conclusion must be a Statement")
+        elif conclusion.rule != "Reiteration":
+            yield VerificationError(str(conclusion.id), "Conclusion must use rule 'Reiteration'")
+        else:
+            result = check(conclusion, proof, rule_checker)
+            if result is not True:
+                yield result
+
+def verify_subproof(subproof: Subproof, proof: Proof, rule_checker: RuleRegistry,
+                    check: StatementCheck = verify_statement) -> VerificationResult:
+    return next(subproof_errors(subproof, proof, rule_checker, check), True)
+
+def verify_step(step: Step, proof: Proof, rule_checker: RuleRegistry,
+                check: StatementCheck = verify_statement) -> VerificationResult:
+    return next(step_errors(step, proof, rule_checker, check), True)
+
+def verify_proof(proof: Proof, rule_checker: RuleRegistry,
+                 check: StatementCheck = verify_statement, executor: Optional[Executor] = None) -> VerificationResult:
+    """Return True if the proof is valid, otherwise its first error.
+
+    With an executor, rule checks run on it in chunks; see logic/parallel.py.
+    """
+    if executor is not None:
+        if check is not verify_statement:
+            raise ValueError("A custom statement check cannot be combined with an executor")
+        from proof_helper.logic.parallel import parallel_verify_proof
+        return parallel_verify_proof(proof, rule_checker, executor)
+    return next(proof_errors(proof, rule_checker, check), True)
@@ -0,0 +1,80 @@
+import pytest
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction
+from proof_helper.logic.bdd import BDDManager, BDDTooLarge, TRUE, FALSE
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+def test_terminals():
+    bdd = BDDManager()
+    assert bdd.from_formula(Bottom()) == FALSE
+    assert bdd.from_formula(Or(P, Not(P))) == TRUE
+    assert bdd.from_formula(And(P, Not(P))) == FALSE
+
+def test_equivalent_formulas_share_a_node():
+    bdd = BDDManager()
+    assert bdd.equivalent(Implies(P, Q), Or(Not(P), Q))
+    assert bdd.equivalent(Iff(P, Q), And(Implies(P, Q), Implies(Q, P)))
+    assert bdd.equivalent(Not(Or(P, Q)), And(Not(P), Not(Q)))
+    assert not bdd.equivalent(Implies(P, Q), Implies(Q, P))
+
+def test_reduced_and_ordered():
+    bdd = BDDManager(order=["Q", "P"])
+    assert bdd.order == ["Q", "P"]
+    node = bdd.from_formula(And(P, Q))
+    assert bdd.node_count == 3  # Q, P and the conjunction rooted at Q
+    assert bdd.from_formula(And(Q, P)) == node
+    assert bdd.from_formula(Or(And(P, Q), And(P, Not(Q)))) == bdd.var("P")
+
+def test_entailment_and_countermodel():
+    bdd = BDDManager()
+    assert bdd.entails([P, Implies(P, Q)], Q)
+    assert bdd.entails([Bottom()], R)
+    assert bdd.countermodel([Or(P, Q)], P) == {"P": False, "Q": True}
+
+def test_satisfying_assignment():
+    bdd = BDDManager()
+    node = bdd.from_formula(And(P, Not(Q)))
+    assert bdd.satisfying_assignment(node) == {"P": True, "Q": False}
+    assert bdd.satisfying_assignment(FALSE) is None
+
+def test_many_variables():
+    bdd = BDDManager()
+    names = [Variable(f"V{i}") for i in range(200)]
+    chain = names[0]
+    for v in names[1:]:
+        chain = And(chain, v)
+    assert bdd.entails([chain], names[150])
+    assert not bdd.entails([names[0]], chain)
+
+def test_cache_statistics_and_eviction():
+    bdd = BDDManager(cache_size=4)
+    names = [Variable(f"V{i}") for i in range(12)]
+    f = names[0]
+    for v in names[1:]:
+        f = Iff(f, v)
+    bdd.from_formula(f)
+    stats = bdd.stats()
+    assert stats["cache_entries"] <= 4
+    assert stats["cache_misses"] > 0
+    assert stats["nodes"] == bdd.node_count
+
+    bdd = BDDManager()
+    g = Or(And(P, Q), R)
+    bdd.ite(bdd.from_formula(g), bdd.var("P"), bdd.var("Q"))
+    hits = bdd.cache_hits
+    bdd.ite(bdd.from_formula(g), bdd.var("P"), bdd.var("Q"))
+    assert bdd.cache_hits == hits + 1
+
+def test_node_budget():
+    bdd = BDDManager(max_nodes=3)
+    bdd.from_formula(And(P, Q))
+    with pytest.raises(BDDTooLarge):
+        bdd.from_formula(Or(And(P, Q), R))
+
+def test_thousands_of_variables_do_not_recurse():
+    xs = [Variable(f"x{i}") for i in range(1500)]
+    bdd = BDDManager()
+    assert bdd.entails([Conjunction(tuple(xs))], xs[0])
+    assert bdd.countermodel([xs[-1]], Conjunction(tuple(xs)))["x0"] is False
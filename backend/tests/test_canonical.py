@@ -0,0 +1,51 @@
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff
+from proof_helper.core.proof import Statement, StepID
+from proof_helper.logic.rules_builtin import AndIntroductionRule, AndEliminationRule, OrIntroductionRule
+from proof_helper.logic.formula_similarity import score_similarity
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+def stmt(i, formula):
+    return Statement(StepID((i,)), formula)
+
+def test_conjuncts_and_disjuncts():
+    assert And(And(P, Q), R).conjuncts == frozenset({P, Q, R})
+    assert And(P, Or(Q, R)).conjuncts == frozenset({P, Or(Q, R)})
+    assert Or(P, Or(Q, Not(R))).disjuncts == frozenset({P, Q, Not(R)})
+    assert Implies(P, Q).conjuncts == frozenset({Implies(P, Q)})
+
+def test_canonical_ignores_order_and_grouping():
+    a = And(And(P, Q), R)
+    b = And(R, And(Q, P))
+    c = And(Q, And(P, R))
+    assert a.canonical is b.canonical is c.canonical
+    assert Or(P, Q).canonical is Or(Q, P).canonical
+
+def test_canonical_is_applied_inside_other_connectives():
+    a = Implies(Not(And(P, Q)), Or(R, P))
+    b = Implies(Not(And(Q, P)), Or(P, R))
+    assert a.canonical is b.canonical
+    assert Iff(And(P, Q), R).canonical is Iff(And(Q, P), R).canonical
+
+def test_canonical_keeps_distinct_structure():
+    assert And(P, Q).canonical is not Or(P, Q).canonical
+    assert Implies(P, Q).canonical is not Implies(Q, P).canonical
+    assert And(P, P).canonical is not P.canonical  # Duplicates are kept
+    assert And(P, Or(Q, R)).canonical is not Or(And(P, Q), R).canonical
+
+def test_canonical_is_a_fixed_point():
+    f = Or(And(R, Q), Not(Or(Q, P)))
+    assert f.canonical.canonical is f.canonical
+
+def test_rules_use_cached_operand_sets():
+    assert AndIntroductionRule().verify([stmt(1, And(P, Q)), stmt(2, R)], stmt(3, And(R, And(Q, P))))
+    assert AndEliminationRule().verify([stmt(1, And(And(P, Q), R))], stmt(2, And(R, P)))
+    assert OrIntroductionRule().verify([stmt(1, Q)], stmt(2, Or(P, Or(Q, R))))
+    assert not OrIntroductionRule().verify([stmt(1, Q)], stmt(2, Or(P, R)))
+
+def test_similarity_treats_reordered_formulas_as_identical():
+    a = And(And(P, Q), R)
+    b = And(P, And(Q, R))
+    assert score_similarity(a, b) == score_similarity(a, a)
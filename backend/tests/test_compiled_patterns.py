@@ -0,0 +1,60 @@
+import itertools
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom, Conjunction, Disjunction
+from proof_helper.logic.compiled_patterns import MAX_COMPILED_DEPTH, compile_builder, compile_matcher
+
+A, B, C = Variable("A"), Variable("B"), Variable("C")
+P, Q, R = Variable("P"), Variable("Q"), Variable("R")
+
+PATTERNS = [
+    A,
+    Bottom(),
+    Not(A),
+    And(A, B),
+    Or(A, A),  # non-linear: both sides must be equal
+    Implies(And(A, B), A),
+    Iff(Not(P), A),  # P has no variables bound by the target, so it must appear literally
+    Conjunction((A, B, C)),
+    Disjunction((A, Not(B), Bottom())),
+]
+
+TARGETS = [
+    P, Bottom(), Not(Q), And(P, Q), Or(P, P), Or(P, Q), Implies(And(P, Q), P), Implies(And(P, Q), Q),
+    Iff(Not(P), R), Iff(Not(Q), R), Conjunction((P, Q, R)), Conjunction((P, Q, R, P)), And(P, And(Q, R)),
+    Disjunction((P, Not(Q), Bottom())), Disjunction((P, Q, Bottom())),
+]
+
+def test_compiled_matchers_agree_with_match():
+    for pattern, target in itertools.product(PATTERNS, TARGETS):
+        expected: dict = {}
+        matched = pattern.match(target, expected)
+        subst: dict = {}
+        trail: list = []
+        assert compile_matcher(pattern)(target, subst, trail) == matched, (pattern, target)
+        if matched:
+            assert subst == expected
+            assert sorted(trail) == sorted(subst)
+
+def test_compiled_matchers_respect_existing_bindings():
+    match = compile_matcher(And(A, B))
+    trail: list = []
+    assert not match(And(P, Q), {"A": Q}, trail)
+    subst = {"A": P}
+    assert match(And(P, Q), subst, trail)
+    assert trail == ["B"] and subst == {"A": P, "B": Q}
+
+def test_compiled_builders_agree_with_substitute():
+    subst = {"A": And(P, Q), "B": Not(R), "C": Bottom()}
+    for pattern in PATTERNS:
+        assert compile_builder(pattern)(subst) is pattern.substitute(subst)
+    # Unbound variables are left as they are
+    assert compile_builder(Implies(A, R))({}) is Implies(A, R)
+
+def test_deep_patterns_fall_back_to_the_interpreter():
+    deep = A
+    for _ in range(MAX_COMPILED_DEPTH * 5):
+        deep = Not(deep)
+    target = deep.substitute({"A": P})
+    subst: dict = {}
+    assert compile_matcher(deep)(target, subst, [])
+    assert subst == {"A": P}
+    assert compile_builder(deep)(subst) is target
@@ -0,0 +1,48 @@
+import pickle
+from proof_helper.core.formula import Variable, And, Or, Conjunction
+from proof_helper.core.proof import Proof, StepID, Statement, Subproof
+
+P = Variable("P")
+Q = Variable("Q")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=[sid(p) for p in premises or []])
+
+def block(at: str, outside: str = "1", formula=Q) -> Subproof:
+    return Subproof(sid(at), stmt(f"{at}.1", P, "Assumption"), [
+        stmt(f"{at}.2", formula, "Reiteration", [outside]),
+        stmt(f"{at}.3", And(P, formula), "And Introduction", [f"{at}.1", f"{at}.2"]),
+    ])
+
+def test_formula_digest_is_structural():
+    assert And(P, Q).digest == And(Variable("P"), Variable("Q")).digest
+    assert And(P, Q).digest != And(Q, P).digest
+    assert And(P, Q).digest != Or(P, Q).digest
+    assert Conjunction((P, Q, P)).digest != And(And(P, Q), P).digest
+
+def test_moved_steps_keep_their_hash():
+    assert block("2").content_hash == block("7").content_hash
+    assert stmt("3", Q, "Reiteration", ["1"]).content_hash == stmt("5", Q, "Reiteration", ["1"]).content_hash
+
+def test_hash_covers_content_and_citations():
+    base = block("2").content_hash
+    assert block("2", formula=P).content_hash != base
+    assert block("2", outside="3").content_hash != base
+    assert stmt("3", Q, "Reiteration", ["1"]).content_hash != stmt("3", Q, "Reiteration", ["2"]).content_hash
+    assert stmt("3", Q, "Reiteration").content_hash != stmt("3", Q, "Assumption").content_hash
+    # Citing the step before vs. a fixed step: 3.2 citing 3.1 and 3.2 citing 1 differ
+    assert stmt("3.2", Q, "Reiteration", ["3.1"]).content_hash != stmt("3.2", Q, "Reiteration", ["1"]).content_hash
+
+def test_misplaced_children_pin_the_subproof():
+    odd = lambda at: Subproof(sid(at), stmt("9.1", P, "Assumption"), [])
+    assert odd("2").content_hash != odd("3").content_hash
+
+def test_proof_hash_covers_positions():
+    def proof(at):
+        return Proof([stmt("1", Q, "Assumption")], [block(at)], [])
+    assert proof("2").content_hash == proof("2").content_hash
+    assert proof("2").content_hash != proof("3").content_hash
+    assert pickle.loads(pickle.dumps(proof("2"))).content_hash == proof("2").content_hash
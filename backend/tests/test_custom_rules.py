@@ -4,7 +4,7 @@ import tempfile
 import pytest
 from proof_helper.logic.rules_custom import CustomRule
 from proof_helper.core.proof import Proof, StepID, Statement
-from proof_helper.core.formula import Variable, And
+from proof_helper.core.formula import Variable, And, Or, Implies
 from proof_helper.io.rule_storage import CustomRuleStore
 from proof_helper.logic.rule_registry import RuleRegistry
 from proof_helper.logic.verify import verify_proof
@@ -138,3 +138,39 @@ def test_loaded_rule_used_in_verification(temp_rule_dir):
 
     result = verify_proof(proof, registry)
     assert result is True
+
+def chain_rule(n: int) -> CustomRule:
+    # From P1 → P2, P2 → P3, ..., P(n-1) → Pn and P1, conclude Pn
+    ps = [Variable(f"P{i}") for i in range(1, n + 1)]
+    premises = [stmt(str(i), Implies(ps[i - 1], ps[i]), "Assumption") for i in range(1, n)]
+    premises.append(stmt(str(n), ps[0], "Assumption"))
+    return CustomRule("Chain", Proof(premises, [], [stmt(str(n + 1), ps[-1], "Reiteration")]))
+
+def test_custom_rule_matches_supports_in_any_order():
+    A, B, C, D, E, F, G = (Variable(x) for x in "ABCDEFG")
+    rule = chain_rule(7)
+    links = [Implies(A, B), Implies(B, C), Implies(C, D), Implies(D, E), Implies(E, F), Implies(F, G)]
+    supports = [stmt(str(i), f) for i, f in enumerate(reversed(links + [A]), start=1)]
+    assert rule.verify(supports, stmt("9", G)) is True
+    assert rule.verify(supports, stmt("9", F)) is False
+    assert rule.conclude(supports) == [G]
+
+def test_custom_rule_backtracks_over_ambiguous_premises():
+    P, Q, R = Variable("P"), Variable("Q"), Variable("R")
+    # Modus ponens: from A → B and A, conclude B
+    rule = CustomRule("MP", Proof([stmt("1", Implies(P, Q), "Assumption"), stmt("2", P, "Assumption")], [],
+                                  [stmt("3", Q, "Reiteration")]))
+    # Both supports are implications, so A → B first matches Q → R. Then no
+    # support is Q, and the search has to undo that choice and match A → B
+    # against (Q → R) → P instead.
+    supports = [stmt("1", Implies(Q, R)), stmt("2", Implies(Implies(Q, R), P))]
+    assert rule.conclude(supports) == [P]
+    assert rule.verify(supports, stmt("3", P)) is True
+    # Neither assignment concludes Q → R
+    assert rule.verify(supports, stmt("3", Implies(Q, R))) is False
+
+def test_custom_rule_conclusion_variables_not_in_premises_are_literal():
+    P, Q = Variable("P"), Variable("Q")
+    rule = CustomRule("Weaken", Proof([stmt("1", P, "Assumption")], [], [stmt("2", Or(P, Q), "Reiteration")]))
+    assert rule.verify([stmt("1", P)], stmt("2", Or(P, Q))) is True
+    assert rule.verify([stmt("1", P)], stmt("2", Or(P, P))) is False
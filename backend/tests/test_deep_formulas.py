@@ -0,0 +1,60 @@
+import pytest
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff
+from proof_helper.io.serialize import dump_formula
+from proof_helper.io.deserialize import parse_formula
+from proof_helper.logic.formula_similarity import score_similarity
+
+DEPTH = 5000  # Well past the default recursion limit
+
+P = Variable("P")
+Q = Variable("Q")
+
+def deep_not(base, depth=DEPTH):
+    f = base
+    for _ in range(depth):
+        f = Not(f)
+    return f
+
+def deep_and(depth=DEPTH):
+    f = Variable("X0")
+    for i in range(1, depth):
+        f = And(f, Variable(f"X{i}"))
+    return f
+
+def test_deep_to_string():
+    assert str(deep_not(P)) == "¬" * DEPTH + "P"
+    assert str(deep_and(3)) == "X0 ∧ X1 ∧ X2"
+    assert str(deep_and()).count("∧") == DEPTH - 1
+
+def test_to_string_precedence_unchanged():
+    assert str(And(Or(P, Q), P)) == "(P ∨ Q) ∧ P"
+    assert str(And(P, And(Q, P))) == "P ∧ (Q ∧ P)"
+    assert str(Implies(Implies(P, Q), P)) == "(P → Q) → P"
+    assert str(Implies(P, Implies(Q, P))) == "P → Q → P"
+    assert str(Not(Iff(P, Q))) == "¬(P ↔ Q)"
+
+def test_deep_match_and_substitute():
+    pattern = deep_not(Variable("A"))
+    target = deep_not(And(P, Q))
+    subst = {}
+    assert pattern.match(target, subst)
+    assert subst == {"A": And(P, Q)}
+    assert pattern.substitute(subst) is target
+    assert not deep_not(Variable("A")).match(deep_not(P, DEPTH - 1), {})
+
+def test_match_binds_left_to_right():
+    subst = {}
+    assert not And(Variable("A"), Variable("A")).match(And(P, Q), subst)
+    assert subst == {"A": P}
+
+def test_iff_substitute_keeps_connective():
+    assert Iff(Variable("A"), Q).substitute({"A": P}) is Iff(P, Q)
+
+def test_deep_serialize_round_trip():
+    f = Or(deep_not(P), deep_and())
+    assert parse_formula(dump_formula(f)) is f
+
+def test_deep_similarity():
+    f = deep_and()
+    assert score_similarity(f, f) > 0
+    assert score_similarity(deep_not(P), deep_not(P)) == pytest.approx(0.9 ** DEPTH)
@@ -0,0 +1,64 @@
+from proof_helper.core.dependencies import edited_steps
+from proof_helper.core.formula import Variable, And, Implies
+from proof_helper.core.proof import Proof, StepID, Statement, Subproof
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def ids(*names):
+    return [sid(n) for n in names]
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=ids(*(premises or [])))
+
+def sample_proof(q=Q) -> Proof:
+    # 1 P, 2 Q, 3 R (unused)
+    # 4 | 4.1 P
+    #   | 4.2 P ∧ Q     from 4.1, 2
+    # 5 P → P ∧ Q      from 4
+    # 6 P ∧ Q          from 1, 2
+    # 7 conclusion     from 5
+    inner = Subproof(sid("4"), stmt("4.1", P, "Assumption"), [stmt("4.2", And(P, q), "And Introduction", ["4.1", "2"])])
+    return Proof(
+        premises=[stmt("1", P, "Assumption"), stmt("2", q, "Assumption"), stmt("3", R, "Assumption")],
+        steps=[inner,
+               stmt("5", Implies(P, And(P, q)), "Implication Introduction", ["4"]),
+               stmt("6", And(P, q), "And Introduction", ["1", "2"])],
+        conclusions=[stmt("7", Implies(P, And(P, q)), "Reiteration", ["5"])],
+    )
+
+def test_direct_edges():
+    graph = sample_proof().dependencies
+    assert graph.dependencies(sid("4.2")) == ids("2", "4.1")
+    assert graph.dependencies(sid("4")) == ids("4.1", "4.2")
+    assert graph.dependents(sid("2")) == ids("4.2", "6")
+    assert graph.dependents(sid("3")) == []
+
+def test_transitive_queries():
+    graph = sample_proof().dependencies
+    assert graph.ancestors(sid("7")) == ids("2", "4", "4.1", "4.2", "5")
+    assert graph.descendants(sid("2")) == ids("4", "4.2", "5", "6", "7")
+    assert graph.conclusions_relying_on(sid("2")) == ids("7")
+    assert graph.conclusions_relying_on(sid("6")) == []
+
+def test_unused_steps():
+    assert sample_proof().dependencies.unused_steps() == ids("1", "3", "6")
+
+def test_dirty_propagation():
+    graph = sample_proof().dependencies
+    assert graph.mark_dirty(ids("4.1")) == set(ids("4", "4.1", "4.2", "5", "7"))
+    assert graph.mark_dirty(ids("2", "99")) == set(ids("2", "6"))
+    assert graph.dirty == set(ids("2", "4", "4.1", "4.2", "5", "6", "7"))
+    graph.clear_dirty()
+    assert not graph.dirty
+
+def test_edited_steps_feed_dirty_marking():
+    old, new = sample_proof(), sample_proof(q=R)
+    edits = edited_steps(old, new)
+    assert edits == set(ids("2", "4.2", "5", "6", "7"))
+    assert new.dependencies.mark_dirty(edits) == set(ids("2", "4", "4.2", "5", "6", "7"))
+    assert edited_steps(old, sample_proof()) == set()
@@ -0,0 +1,66 @@
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Bottom, Conjunction
+from proof_helper.core.proof import Proof, StepID, Statement
+from proof_helper.logic.discrimination_tree import DiscriminationTree
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.step_suggestions import generate_next_steps
+
+A, B = Variable("A"), Variable("B")
+P, Q, R = Variable("P"), Variable("Q"), Variable("R")
+
+PATTERNS = [A, Not(A), Not(Not(A)), And(A, B), And(Not(A), B), Or(A, A), Implies(A, Or(A, B)), Bottom(),
+            Conjunction((A, B, Not(A)))]
+FORMULAS = [P, Not(P), Not(Not(Q)), And(P, Q), And(Not(P), Q), And(P, Not(Q)), Or(P, Q), Or(P, P),
+            Implies(P, Or(Q, R)), Bottom(), Conjunction((P, Q, Not(R))), Conjunction((P, Q, R))]
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=[sid(p) for p in premises or []])
+
+def test_lookup_finds_every_matching_pattern():
+    tree = DiscriminationTree()
+    for i, pattern in enumerate(PATTERNS):
+        tree.insert(pattern, i)
+    assert len(tree) == len(PATTERNS)
+    for formula in FORMULAS:
+        found = set(tree.generalizations(formula))
+        matching = {i for i, p in enumerate(PATTERNS) if p.match(formula, {})}
+        assert matching <= found, formula
+        # Only repeated variables make the index over-approximate
+        assert all(PATTERNS[i] in (Or(A, A), Implies(A, Or(A, B)), Conjunction((A, B, Not(A)))) for i in found - matching)
+
+def test_lookup_walks_structure():
+    tree = DiscriminationTree()
+    tree.insert(And(Not(A), B), "x")
+    assert tree.generalizations(And(Not(P), Q)) == ["x"]
+    assert tree.generalizations(And(P, Not(Q))) == []
+    assert tree.generalizations(Not(And(P, Q))) == []
+
+def mp_rule() -> Proof:
+    return Proof([stmt("1", Implies(A, B), "Assumption"), stmt("2", A, "Assumption")], [],
+                 [stmt("3", B, "Reiteration", ["1"])])
+
+def test_registry_returns_rules_whose_premises_can_all_be_filled():
+    registry = RuleRegistry()
+    registry.add_custom_rule("MP", mp_rule())
+    registry.add_custom_rule("DNE", Proof([stmt("1", Not(Not(A)), "Assumption")], [], [stmt("2", A, "Reiteration", ["1"])]))
+    registry.add_custom_rule("Top", Proof([], [], [stmt("1", Implies(P, P), "Reiteration")]))
+
+    candidates = registry.custom_rule_candidates([Implies(P, Q), P])
+    assert candidates == {"MP": {Implies(P, Q), P}, "Top": set()}
+    # A rule added later is indexed straight away
+    registry.add_custom_rule("Weaken", Proof([stmt("1", A, "Assumption")], [], [stmt("2", Or(A, B), "Reiteration", ["1"])]))
+    assert set(registry.custom_rule_candidates([Not(Not(P))])) == {"DNE", "Top", "Weaken"}
+
+def test_suggestions_only_try_candidate_rules():
+    registry = RuleRegistry()
+    registry.add_custom_rule("MP", mp_rule())
+    for i in range(50):
+        # Rules whose premises nothing in the proof can fill
+        registry.add_custom_rule(f"Unused {i}", Proof([stmt("1", Not(Implies(A, Variable(f"X{i}"))), "Assumption")], [],
+                                                      [stmt("2", A, "Reiteration", ["1"])]))
+    proof = Proof([stmt("1", Implies(P, Q), "Assumption"), stmt("2", P, "Assumption")], [],
+                  [stmt("3", Q, "Reiteration", ["4"])])
+    assert set(registry.custom_rule_candidates([Implies(P, Q), P])) == {"MP"}
+    assert any(s.rule == "MP" and s.formula == Q for s, _ in generate_next_steps(proof, registry))
@@ -0,0 +1,54 @@
+from proof_helper.core.formula import (
+    Variable, Not, And, Or, Implies, Iff, Bottom, FINGERPRINT_MASK, fingerprints, variable_fingerprint
+)
+from proof_helper.core.proof import Proof, Statement, StepID
+from proof_helper.logic.semantics import equivalent, countermodel
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.step_suggestions import generate_next_steps
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+def test_equivalent_formulas_share_fingerprint():
+    assert Implies(P, Q).fingerprint == Or(Not(P), Q).fingerprint
+    assert Not(And(P, Q)).fingerprint == Or(Not(P), Not(Q)).fingerprint
+    assert Iff(P, Q).fingerprint == And(Implies(P, Q), Implies(Q, P)).fingerprint
+
+def test_constants():
+    assert Or(P, Not(P)).fingerprint == FINGERPRINT_MASK
+    assert Bottom().fingerprint == 0
+    assert P.fingerprint == variable_fingerprint("P")
+
+def test_non_equivalent_formulas_differ():
+    assert P.fingerprint != Q.fingerprint
+    assert And(P, Q).fingerprint != Or(P, Q).fingerprint
+    assert Implies(P, Q).fingerprint != Implies(Q, P).fingerprint
+
+def test_batch_matches_individual():
+    formulas = [And(P, Q), Or(And(P, Q), R), Not(R), Iff(R, And(P, Q))]
+    assert fingerprints(formulas) == [f.fingerprint for f in formulas]
+
+def test_semantic_equivalence():
+    assert equivalent(Implies(P, Q), Or(Not(P), Q))
+    assert not equivalent(Implies(P, Q), Implies(Q, P))
+
+def test_large_countermodel_from_samples():
+    names = [Variable(f"V{i}") for i in range(30)]
+    conj = names[0]
+    for v in names[1:]:
+        conj = And(conj, v)
+    model = countermodel([names[0]], conj)
+    assert model is not None
+    assert model["V0"] is True
+    assert not all(model.values())
+
+def test_suggestions_drop_equivalent_duplicates():
+    proof = Proof(
+        premises=[Statement(StepID((1,)), P, "Assumption"), Statement(StepID((2,)), Q, "Assumption")],
+        steps=[],
+        conclusions=[Statement(StepID((3,)), Or(Q, P), "Reiteration", [StepID((4,))])]
+    )
+    suggestions = generate_next_steps(proof, RuleRegistry())
+    or_intro = [s for s, _ in suggestions if s.rule == "Or Introduction" and s.formula == Or(Q, P)]
+    assert len(or_intro) == 1
@@ -0,0 +1,58 @@
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom, VARIABLE_MASK_BITS, variable_bit
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+def test_size_and_depth():
+    f = Implies(And(P, Q), Not(R))
+    assert P.size == 1 and P.depth == 1
+    assert f.size == 6
+    assert f.depth == 3
+
+def test_variables_and_mask():
+    f = Or(And(P, Q), Not(P))
+    assert f.variables == frozenset({"P", "Q"})
+    assert f.variable_mask == variable_bit("P") | variable_bit("Q")
+    assert Bottom().variables == frozenset()
+    assert Bottom().variable_mask == 0
+
+def test_variable_bits_are_stable_and_bounded():
+    assert variable_bit("P") == variable_bit("P")
+    bits = {variable_bit(f"V{i}") for i in range(1000)}
+    assert len(bits) == VARIABLE_MASK_BITS
+    assert all(bit.bit_length() <= VARIABLE_MASK_BITS for bit in bits)
+
+def test_connective_and_counts():
+    f = Iff(Not(P), Or(Not(Q), Bottom()))
+    assert f.connective == "iff"
+    assert P.connective == "var"
+    assert dict(f.connective_counts) == {"iff": 1, "not": 2, "or": 1, "var": 2, "bottom": 1}
+
+def test_subformulas():
+    f = And(P, Not(P))
+    assert f.subformulas == frozenset({f, P, Not(P)})
+
+def test_metadata_is_cached_on_shared_nodes():
+    inner = And(P, Q)
+    outer = Or(inner, inner)
+    assert outer.size == 7
+    assert inner.__dict__["_size"] == 3
+
+def test_metadata_on_deep_formula():
+    f = P
+    for _ in range(20000):
+        f = Not(f)
+    assert f.size == 20001
+    assert f.depth == 20001
+    assert f.variables == frozenset({"P"})
+
+def test_sets_are_cached_on_the_queried_node_only():
+    chain = P
+    for i in range(8000):
+        chain = And(chain, Variable(f"V{i}"))
+    assert len(chain.variables) == 8001
+    assert len(chain.subformulas) == 16001
+    assert "_variables" not in chain.left.__dict__
+    assert "_subformulas" not in chain.left.__dict__
+    assert chain.left.variables == chain.variables - {"V7999"}
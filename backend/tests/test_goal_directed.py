@@ -0,0 +1,62 @@
+from proof_helper.core.formula import Variable, Not, Or, Implies
+from proof_helper.core.proof import Proof, StepID, Statement
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.step_suggestions import generate_next_steps, goal_directed_steps
+
+A, B, C = Variable("A"), Variable("B"), Variable("C")
+P, Q, R = Variable("P"), Variable("Q"), Variable("R")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=[sid(p) for p in premises or []])
+
+def rule(premises, conclusion) -> Proof:
+    n = len(premises)
+    return Proof([stmt(str(i + 1), f, "Assumption") for i, f in enumerate(premises)], [],
+                 [stmt(str(n + 1), conclusion, "Reiteration")])
+
+def library() -> RuleRegistry:
+    registry = RuleRegistry()
+    registry.add_custom_rule("MP", rule([Implies(A, B), A], B))
+    registry.add_custom_rule("Syllogism", rule([Implies(A, B), Implies(B, C)], Implies(A, C)))
+    registry.add_custom_rule("DNI", rule([A], Not(Not(A))))
+    registry.add_custom_rule("Comm", rule([Or(A, B)], Or(B, A)))
+    return registry
+
+def test_rules_concluding_filters_by_shape():
+    registry = library()
+    assert [r.name() for r in registry.rules_concluding(Or(Q, P))] == ["MP", "Comm"]
+    assert [r.name() for r in registry.rules_concluding(Not(Not(P)))] == ["MP", "DNI"]
+    assert [r.name() for r in registry.rules_concluding(Implies(P, R))] == ["MP", "Syllogism"]
+
+def test_supports_for_finds_premises_in_premise_order():
+    registry = library()
+    statements = [stmt("1", P), stmt("2", Implies(Q, R)), stmt("3", Implies(P, Q))]
+    assert registry.get("Syllogism").supports_for(Implies(P, R), statements) == [statements[2], statements[1]]
+    assert registry.get("MP").supports_for(Q, statements) == [statements[2], statements[0]]
+    assert registry.get("MP").supports_for(P, statements) is None
+
+def test_goals_suggest_rule_steps_that_conclude_them():
+    registry = library()
+    proof = Proof([stmt("1", Implies(P, Q), "Assumption"), stmt("2", Implies(Q, R), "Assumption")], [],
+                  [stmt("3", Implies(P, R), "Reiteration", ["4"])])
+    suggestions = generate_next_steps(proof, registry)
+    assert (Implies(P, R), "Syllogism", [sid("1"), sid("2")]) in [(s.formula, s.rule, s.premises) for s, _ in suggestions]
+
+def test_goals_are_worked_backwards_through_fixed_premises():
+    registry = library()
+    # ¬¬(Q ∨ P) needs Q ∨ P (DNI), which needs P ∨ Q (Comm), which is available
+    statements = [stmt("1", Or(P, Q), "Assumption")]
+    found = goal_directed_steps([Not(Not(Or(Q, P)))], statements, registry)
+    assert [(s.formula, s.rule, s.premises, score) for s, score in found] == [(Or(Q, P), "Comm", [sid("1")], 0.9)]
+
+def test_forward_custom_rule_steps_are_still_suggested_with_goals():
+    registry = library()
+    registry.add_custom_rule("Material", rule([Implies(A, B)], Or(Not(A), B)))
+    # ¬P ∨ Q cannot be instantiated to the goal, but resembles it
+    proof = Proof([stmt("1", Implies(P, Q), "Assumption")], [], [stmt("2", Or(P, Q), "Reiteration", ["3"])])
+    assert "Material" not in [r.name() for r in registry.rules_concluding(Or(P, Q))]
+    suggestions = generate_next_steps(proof, registry)
+    assert (Or(Not(P), Q), "Material") in [(s.formula, s.rule) for s, _ in suggestions]
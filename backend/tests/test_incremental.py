@@ -0,0 +1,124 @@
+from proof_helper.core.formula import Variable, And, Implies
+from proof_helper.core.proof import Proof, StepID, Statement, Subproof
+from proof_helper.logic.incremental import IncrementalVerifier
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.verify import VerificationError, verify_proof
+
+P = Variable("P")
+Q = Variable("Q")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=premises or [])
+
+def chain(n: int, broken_at: int = 0) -> Proof:
+    # 1 P, 2 Q, then i: P ∧ (formula of i - 1), each step distinct
+    premises = [stmt("1", P, "Assumption"), stmt("2", Q, "Assumption")]
+    steps = []
+    previous = Q
+    for i in range(3, n + 1):
+        previous = Q if i == broken_at else And(P, previous)
+        steps.append(stmt(str(i), previous, "And Introduction", [sid("1"), sid(str(i - 1))]))
+    return Proof(premises, steps, [])
+
+def test_matches_full_verification():
+    verifier = IncrementalVerifier(RuleRegistry())
+    for proof in [chain(10), chain(10, broken_at=7)]:
+        assert verifier.verify_proof(proof) == verify_proof(proof, RuleRegistry())
+    assert verifier.verify_proof(chain(10, broken_at=7)) == VerificationError("7", "Rule And Introduction failed to apply")
+
+def test_unchanged_steps_are_cache_hits():
+    verifier = IncrementalVerifier(RuleRegistry())
+    assert verifier.verify_proof(chain(50)) is True
+    assert verifier.misses == 50
+    # One more step: only it is checked
+    assert verifier.verify_proof(chain(51)) is True
+    assert verifier.misses == 51 and verifier.hits == 50
+
+def test_edits_recheck_dependents():
+    inner = Subproof(sid("3"), stmt("3.1", P, "Assumption"), [stmt("3.2", Q, "Reiteration", [sid("2")])])
+    use = stmt("4", Implies(P, Q), "Implication Introduction", [sid("3")])
+    proof = Proof([stmt("1", P, "Assumption"), stmt("2", Q, "Assumption")], [inner, use], [])
+    verifier = IncrementalVerifier(RuleRegistry())
+    assert verifier.verify_proof(proof) is True
+    misses = verifier.misses
+
+    # Changing premise 2 re-checks the reiteration citing it and the
+    # implication introduction whose subproof now ends differently. Premise 2
+    # now reads like premise 1, and the subproof's assumption is unaffected.
+    edited_inner = Subproof(sid("3"), stmt("3.1", P, "Assumption"), [stmt("3.2", P, "Reiteration", [sid("2")])])
+    edited = Proof([stmt("1", P, "Assumption"), stmt("2", P, "Assumption")], [edited_inner, use], [])
+    assert verifier.verify_proof(edited) == verify_proof(edited, RuleRegistry())
+    assert verifier.misses - misses == 2
+    assert verifier.verify_proof(edited) == VerificationError("4", "Rule Implication Introduction failed to apply")
+
+def test_renumbered_steps_are_cache_hits():
+    verifier = IncrementalVerifier(RuleRegistry())
+    assert verifier.verify_proof(chain(20)) is True
+    misses = verifier.misses
+
+    # A new first premise shifts every id by one; only it is checked
+    steps = [stmt(str(int(str(s.id)) + 1), s.formula, s.rule, [sid(str(int(str(p)) + 1)) for p in s.premises])
+             for s in [*chain(20).premises, *chain(20).steps]]
+    renumbered = Proof([stmt("1", Implies(P, Q), "Assumption"), *steps[:2]], steps[2:], [])
+    assert verifier.verify_proof(renumbered) is True
+    assert verifier.misses - misses == 1
+
+def test_renumbered_errors_name_the_current_step():
+    verifier = IncrementalVerifier(RuleRegistry())
+    proof = Proof([stmt("1", P, "Assumption")], [stmt("2", Q, "Reiteration", [sid("1")])], [])
+    assert verifier.verify_proof(proof) == VerificationError("2", "Rule Reiteration failed to apply")
+    hits = verifier.hits
+    shifted = Proof([stmt("1", Q, "Assumption"), stmt("2", P, "Assumption")], [stmt("3", Q, "Reiteration", [sid("2")])], [])
+    assert verifier.verify_proof(shifted) == VerificationError("3", "Rule Reiteration failed to apply")
+    assert verifier.hits - hits == 2
+
+def test_cache_is_bounded_and_follows_registry_changes():
+    registry = RuleRegistry()
+    verifier = IncrementalVerifier(registry, max_entries=5)
+    verifier.verify_proof(chain(20))
+    assert verifier.stats()["entries"] == 5
+
+    rule = Proof([stmt("1", P, "Assumption")], [], [stmt("2", P, "Reiteration", [sid("1")])])
+    registry.add_custom_rule("Same", rule)
+    verifier.verify_proof(chain(3))
+    assert verifier.stats()["entries"] == 3
+
+def test_seen_proofs_are_accepted_by_content_hash():
+    verifier = IncrementalVerifier(RuleRegistry())
+    assert verifier.verify_proof(chain(50)) is True
+    checked = verifier.hits + verifier.misses
+    assert verifier.verify_proof(chain(50)) is True
+    assert verifier.hits + verifier.misses == checked
+    assert verifier.stats()["valid_hits"] == 1
+    # Invalid proofs are never remembered as valid
+    assert list(verifier.proof_errors(chain(50, broken_at=9))) == [VerificationError("9", "Rule And Introduction failed to apply")]
+    assert list(verifier.proof_errors(chain(50, broken_at=9))) == [VerificationError("9", "Rule And Introduction failed to apply")]
+
+def pasted(at: str, reiterated: str = "1") -> Subproof:
+    # P → P ∧ Q style subproof citing the outer premise `reiterated`
+    return Subproof(sid(at), stmt(f"{at}.1", P, "Assumption"), [
+        stmt(f"{at}.2", Q, "Reiteration", [sid(reiterated)]),
+        stmt(f"{at}.3", And(P, Q), "And Introduction", [sid(f"{at}.1"), sid(f"{at}.2")]),
+    ])
+
+def test_pasted_subproofs_are_not_rechecked():
+    verifier = IncrementalVerifier(RuleRegistry())
+    premise = stmt("1", Q, "Assumption")
+    assert verifier.verify_proof(Proof([premise], [pasted("2")], [])) is True
+    misses = verifier.misses
+
+    # The same subproof at another position: only the new conclusion is checked
+    moved = Proof([premise], [pasted("2"), pasted("3"), stmt("4", Implies(P, And(P, Q)), "Implication Introduction", [sid("3")])], [])
+    assert verifier.verify_proof(moved) is True
+    assert verifier.misses - misses == 1
+    assert verifier.stats()["valid_hits"] == 2
+
+def test_pasted_subproofs_see_their_outside_citations():
+    verifier = IncrementalVerifier(RuleRegistry())
+    assert verifier.verify_proof(Proof([stmt("1", Q, "Assumption")], [pasted("2")], [])) is True
+    # Same subproof, but the premise it reiterates now says something else
+    changed = Proof([stmt("1", P, "Assumption")], [pasted("2")], [])
+    assert verifier.verify_proof(changed) == VerificationError("2.2", "Rule Reiteration failed to apply")
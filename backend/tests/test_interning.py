@@ -0,0 +1,45 @@
+import copy
+import pickle
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom
+from proof_helper.io.deserialize import parse_formula
+from proof_helper.logic.rules_builtin import AndIntroductionRule
+from proof_helper.core.proof import Statement, StepID
+
+P = Variable("P")
+Q = Variable("Q")
+
+def test_structurally_equal_formulas_are_identical():
+    assert Variable("P") is P
+    assert And(P, Not(Q)) is And(Variable("P"), Not(Variable("Q")))
+    assert Bottom() is Bottom()
+
+def test_different_formulas_are_distinct():
+    assert And(P, Q) is not And(Q, P)
+    assert And(P, Q) != Or(P, Q)
+    assert Implies(P, Q) != Iff(P, Q)
+
+def test_keyword_construction_is_interned():
+    assert Variable(name="P") is P
+    assert And(left=P, right=Q) is And(P, Q)
+
+def test_hash_is_stable_and_consistent_with_equality():
+    f = Implies(And(P, Q), Or(Q, P))
+    assert hash(f) == hash(Implies(And(P, Q), Or(Q, P)))
+    assert len({f, Implies(And(P, Q), Or(Q, P))}) == 1
+
+def test_copy_and_pickle_preserve_identity():
+    f = Iff(Not(P), Or(P, Bottom()))
+    assert copy.copy(f) is f
+    assert copy.deepcopy(f) is f
+    assert pickle.loads(pickle.dumps(f)) is f
+
+def test_parse_formula_returns_interned_nodes():
+    data = {"type": "and", "left": {"type": "var", "name": "P"}, "right": {"type": "var", "name": "Q"}}
+    assert parse_formula(data) is And(P, Q)
+
+def test_substitute_and_conclude_return_interned_nodes():
+    pattern = Or(Variable("A"), Not(Variable("A")))
+    assert pattern.substitute({"A": P}) is Or(P, Not(P))
+
+    supports = [Statement(StepID((1,)), P), Statement(StepID((2,)), Q)]
+    assert AndIntroductionRule().conclude(supports)[0] is And(P, Q)
@@ -0,0 +1,114 @@
+import pytest
+from proof_helper.core.formula import (
+    Variable, Not, And, Or, Implies, Conjunction, Disjunction,
+    conjunction, disjunction, conjunct_list, disjunct_list,
+)
+from proof_helper.core.packed_formula import PackedFormula
+from proof_helper.core.proof import Proof, StepID, Statement
+from proof_helper.io.serialize import dump_formula
+from proof_helper.io.deserialize import parse_formula
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.rules_builtin import AndIntroductionRule, AndEliminationRule
+from proof_helper.logic.verify import verify_proof
+from proof_helper.logic import truth_table, bdd, sat
+
+WIDTH = 1000
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+def atoms(n=WIDTH):
+    return [Variable(f"X{i}") for i in range(n)]
+
+def stmt(i, formula, rule=None, premises=()):
+    return Statement(StepID((i,)), formula, rule, list(premises))
+
+def test_builders_pick_the_narrowest_node():
+    assert conjunction([P]) is P
+    assert conjunction([P, Q]) is And(P, Q)
+    assert conjunction([P, Q, R]) is Conjunction((P, Q, R))
+    assert disjunction([P, Q, R]) is Disjunction((P, Q, R))
+    with pytest.raises(ValueError):
+        conjunction([])
+    with pytest.raises(ValueError):
+        Conjunction((P,))
+
+def test_renders_like_the_nested_chain():
+    assert str(Conjunction((P, Q, R))) == str(And(And(P, Q), R)) == "P ∧ Q ∧ R"
+    assert str(Not(Disjunction((P, Q, R)))) == "¬(P ∨ Q ∨ R)"
+    assert str(Conjunction((P, Or(Q, R), And(P, Q)))) == "P ∧ (Q ∨ R) ∧ (P ∧ Q)"
+    assert str(Conjunction(tuple(atoms()))).count("∧") == WIDTH - 1
+
+def test_operands_look_through_both_forms():
+    f = Conjunction((And(P, Q), R, Conjunction((Q, Not(P), Q))))
+    assert conjunct_list(f) == [P, Q, R, Q, Not(P), Q]
+    assert f.conjuncts == frozenset({P, Q, R, Not(P)})
+    assert disjunct_list(Or(Disjunction((P, Q, R)), P)) == [P, Q, R, P]
+
+def test_canonical_identifies_nary_and_nested_forms():
+    nested = And(And(P, Q), R)
+    assert Conjunction((R, Q, P)).canonical is nested.canonical
+    assert Disjunction((Q, P)).canonical is Or(P, Q).canonical
+    assert Conjunction((P, Q, R)).canonical is not Disjunction((P, Q, R)).canonical
+
+def test_match_and_substitute():
+    A, B, C = Variable("A"), Variable("B"), Variable("C")
+    subst = {}
+    assert Conjunction((A, B, C)).match(Conjunction((P, Not(Q), R)), subst)
+    assert subst == {"A": P, "B": Not(Q), "C": R}
+    assert not Conjunction((A, B)).match(Conjunction((P, Q, R)), {})
+    assert not Conjunction((A, B)).match(And(P, Q), {})
+    assert Conjunction((A, B, A)).substitute({"A": P, "B": Q}) is Conjunction((P, Q, P))
+
+def test_json_round_trip_and_backward_compatibility():
+    f = Implies(Conjunction((P, Q, R)), Disjunction((R, Not(P), Q)))
+    data = dump_formula(f)
+    assert data["left"] == {
+        "type": "and",
+        "operands": [{"type": "var", "name": n} for n in "PQR"],
+    }
+    assert parse_formula(data) is f
+    # Binary nodes keep their left/right shape
+    assert dump_formula(And(P, Q)) == {
+        "type": "and", "left": {"type": "var", "name": "P"}, "right": {"type": "var", "name": "Q"},
+    }
+    with pytest.raises(ValueError):
+        parse_formula({"type": "or", "operands": [{"type": "var", "name": "P"}]})
+
+def test_packed_round_trip():
+    f = Or(Conjunction((P, Not(Q), Disjunction((Q, R, P)))), P)
+    packed = PackedFormula.from_formula(f)
+    assert packed.to_formula() is f
+    subst = {}
+    pattern = PackedFormula.from_formula(Or(Variable("A"), Variable("B")))
+    assert pattern.match(packed, subst)
+    assert subst["A"].to_formula() is f.left
+
+def test_semantic_backends_agree():
+    f = Conjunction((P, Disjunction((Q, Not(P), R)), Not(R)))
+    expected = Implies(f, Q)
+    assert truth_table.is_tautology(expected)
+    assert bdd.BDDManager().is_tautology(expected)
+    assert sat.entails([f], Q)
+    assert f.fingerprint == And(And(P, Or(Or(Q, Not(P)), R)), Not(R)).fingerprint
+
+def test_and_introduction_concludes_the_nested_chain():
+    premises = [stmt(1, P, "Assumption"), stmt(2, Q, "Assumption"), stmt(3, R, "Assumption")]
+    goal = And(And(P, Q), R)
+    assert AndIntroductionRule().conclude(premises) == [goal]
+    intro = Statement(StepID((4,)), goal, "And Introduction", [p.id for p in premises])
+    reiterated = Statement(StepID((5,)), goal, "Reiteration", [intro.id])
+    assert verify_proof(Proof(premises, [intro], [reiterated]), RuleRegistry()) is True
+
+def test_wide_conjunction_verifies():
+    xs = atoms()
+    conj = Conjunction(tuple(xs))
+    assert conj.depth == 2
+
+    premises = [stmt(i + 1, x, "Assumption") for i, x in enumerate(xs)]
+    intro = stmt(WIDTH + 1, conj, "And Introduction", [p.id for p in premises])
+    elim = stmt(WIDTH + 2, conjunction(xs[::-1][:3]), "And Elimination", [intro.id])
+    proof = Proof(premises=premises, steps=[intro, elim], conclusions=[])
+    assert verify_proof(proof, RuleRegistry()) is True
+    assert AndEliminationRule().conclude([intro]) == xs
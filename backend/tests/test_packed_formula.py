@@ -0,0 +1,74 @@
+import os
+import tempfile
+import pytest
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom
+from proof_helper.core.packed_formula import PackedFormula, PackedFormulaLibrary
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+FORMULAS = [
+    P,
+    Bottom(),
+    Not(Not(P)),
+    And(P, Or(Q, Not(R))),
+    Iff(Implies(P, Q), Or(Not(P), Q)),
+]
+
+@pytest.mark.parametrize("f", FORMULAS)
+def test_round_trip(f):
+    assert PackedFormula.from_formula(f).to_formula() is f
+
+def test_equality_and_hash():
+    a = PackedFormula.from_formula(And(P, Q))
+    b = PackedFormula.from_formula(And(Variable("P"), Variable("Q")))
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a != PackedFormula.from_formula(And(Q, P))
+    assert a != PackedFormula.from_formula(Or(P, Q))
+
+def test_encoding_is_compact():
+    f = And(P, Or(Q, Not(R)))
+    packed = PackedFormula.from_formula(f)
+    assert len(packed) == f.size
+    assert packed.symbols == ("P", "Q", "R")
+
+def test_match_binds_subtrees():
+    pattern = PackedFormula.from_formula(Or(Variable("A"), Not(Variable("A"))))
+    target = PackedFormula.from_formula(Or(And(P, Q), Not(And(P, Q))))
+    subst = {}
+    assert pattern.match(target, subst)
+    assert subst == {"A": PackedFormula.from_formula(And(P, Q))}
+
+def test_match_agrees_with_formula_match():
+    pattern = And(Variable("A"), Variable("A"))
+    for target in [And(P, P), And(P, Q), Or(P, P), And(Not(Q), Not(Q))]:
+        expected = pattern.match(target, {})
+        assert PackedFormula.from_formula(pattern).match(PackedFormula.from_formula(target), {}) == expected
+
+def test_match_respects_existing_bindings():
+    pattern = PackedFormula.from_formula(Not(Variable("A")))
+    target = PackedFormula.from_formula(Not(P))
+    assert not pattern.match(target, {"A": PackedFormula.from_formula(Q)})
+    assert pattern.match(target, {"A": PackedFormula.from_formula(P)})
+
+def test_library_save_and_mmap_load():
+    library = PackedFormulaLibrary(FORMULAS)
+    assert len(library) == len(FORMULAS)
+    assert list(library) == FORMULAS
+    assert library.packed(3) == PackedFormula.from_formula(FORMULAS[3])
+
+    path = os.path.join(tempfile.mkdtemp(), "formulas.pfl")
+    library.save(path)
+    loaded = PackedFormulaLibrary.load(path)
+    assert list(loaded) == FORMULAS
+    assert loaded.packed(4) == PackedFormula.from_formula(FORMULAS[4])
+    with pytest.raises(ValueError):
+        loaded.append(P)
+    loaded.close()
+    os.remove(path)
+
+def test_library_index_out_of_range():
+    with pytest.raises(IndexError):
+        PackedFormulaLibrary([P])[1]
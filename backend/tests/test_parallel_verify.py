@@ -0,0 +1,76 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from proof_helper.core.formula import Variable, Not, And, Or, Implies
+from proof_helper.core.proof import Proof, StepID, Statement, Subproof
+from proof_helper.logic.parallel import parallel_proof_errors, parallel_verify_proof
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.verify import proof_errors, verify_proof
+
+P = Variable("P")
+Q = Variable("Q")
+A = Variable("A")
+B = Variable("B")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=[sid(p) for p in premises or []])
+
+def registry() -> RuleRegistry:
+    registry = RuleRegistry()
+    swap = Proof([stmt("1", And(A, B), "Assumption")], [], [stmt("2", And(B, A), "Reiteration", ["1"])])
+    registry.add_custom_rule("Swap", swap)
+    return registry
+
+def big_proof(n: int) -> Proof:
+    # Alternating custom-rule and built-in steps; every seventh one is wrong,
+    # plus a subproof and a dangling citation
+    premises = [stmt("1", And(P, Q), "Assumption")]
+    steps = []
+    for i in range(2, n):
+        if i % 7 == 0:
+            steps.append(stmt(str(i), Or(P, P), "Swap", ["1"]))
+        elif i % 2:
+            steps.append(stmt(str(i), And(Q, P), "Swap", ["1"]))
+        else:
+            steps.append(stmt(str(i), P, "And Elimination", ["1"]))
+    steps.append(Subproof(sid(str(n)), stmt(f"{n}.1", P, "Assumption"), [stmt(f"{n}.2", And(P, Q), "Reiteration", ["1"])]))
+    steps.append(stmt(str(n + 1), Implies(P, And(P, Q)), "Implication Introduction", [str(n)]))
+    conclusions = [stmt(str(n + 2), P, "Reiteration", ["99999"])]
+    return Proof(premises, steps, conclusions)
+
+def test_matches_sequential_errors_on_a_process_pool():
+    proof = big_proof(200)
+    expected = list(proof_errors(proof, registry()))
+    assert len(expected) > 20
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert list(parallel_proof_errors(proof, registry(), pool, chunk_size=16)) == expected
+        assert verify_proof(proof, registry(), executor=pool) == expected[0]
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 1000])
+def test_chunking_does_not_change_results(chunk_size):
+    proof = big_proof(100)
+    expected = list(proof_errors(proof, registry()))
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        assert list(parallel_proof_errors(proof, registry(), pool, chunk_size)) == expected
+
+def test_valid_proof():
+    proof = Proof([stmt("1", And(P, Q), "Assumption")],
+                  [stmt(str(i), And(Q, P), "Swap", ["1"]) for i in range(2, 50)], [])
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert parallel_verify_proof(proof, registry(), pool, chunk_size=8) is True
+
+def test_custom_check_cannot_use_executor():
+    with ThreadPoolExecutor(max_workers=1) as pool, pytest.raises(ValueError):
+        verify_proof(big_proof(5), registry(), lambda s, p, c: True, executor=pool)
+
+def test_deep_formulas_are_sent_to_a_process_pool():
+    deep = P
+    for _ in range(3000):
+        deep = Not(deep)
+    steps = [stmt(str(i), And(deep, deep), "And Introduction", ["1", "1"]) for i in range(2, 202)]
+    proof = Proof([stmt("1", deep, "Assumption")], steps, [])
+    assert verify_proof(proof, RuleRegistry()) is True
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert verify_proof(proof, RuleRegistry(), executor=pool) is True
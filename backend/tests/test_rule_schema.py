@@ -0,0 +1,69 @@
+from proof_helper.core.formula import Variable, Not, And, Or, Implies
+from proof_helper.core.proof import Proof, StepID, Statement
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.rule_schema import schema_key
+from proof_helper.logic.verify import verify_proof
+
+A, B = Variable("A"), Variable("B")
+P, Q, R = Variable("P"), Variable("Q"), Variable("R")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=[sid(p) for p in premises or []])
+
+def rule(premises, conclusion) -> Proof:
+    n = len(premises)
+    return Proof([stmt(str(i + 1), f, "Assumption") for i, f in enumerate(premises)], [],
+                 [stmt(str(n + 1), conclusion, "Reiteration")])
+
+def test_schema_key_ignores_variable_names():
+    assert schema_key([P], [Or(P, Not(P))]) == schema_key([Q], [Or(Q, Not(Q))])
+    assert schema_key([Implies(P, Q), P], [Q]) == schema_key([Implies(A, B), A], [B])
+    # Premises are ordered by shape, so listing them differently does not matter
+    assert schema_key([P, Implies(P, Q)], [Q]) == schema_key([Implies(A, B), A], [B])
+
+def test_schema_key_keeps_conclusion_only_variables_literal():
+    # P ⊢ P ∨ Q concludes X ∨ Q, while A ⊢ A ∨ B concludes X ∨ B
+    assert schema_key([P], [Or(P, Q)]) != schema_key([A], [Or(A, B)])
+    assert schema_key([P], [Or(P, Q)]) == schema_key([A], [Or(A, Q)])
+
+def test_rules_differing_in_literal_variables_are_not_duplicates():
+    registry = RuleRegistry()
+    registry.add_custom_rule("R1", rule([P], Or(P, Q)))
+    registry.add_custom_rule("R2", rule([A], Or(A, B)))
+    assert registry.duplicates == {}
+    assert [r.name() for r in registry.rules_concluding(Or(R, B))] == ["R1", "R2"]
+    assert registry.get("R2").supports_for(Or(R, B), [stmt("1", R)]) is not None
+    assert registry.get("R1").supports_for(Or(R, B), [stmt("1", R)]) is None
+
+def test_schema_key_keeps_structure():
+    assert schema_key([], [Or(P, Not(P))]) != schema_key([], [Or(P, Not(Q))])
+    assert schema_key([Implies(P, Q), P], [Q]) != schema_key([Implies(P, Q), Q], [P])
+    assert schema_key([And(P, Q)], [P]) != schema_key([And(P, Q)], [Q])
+
+def test_duplicates_are_registered_but_not_indexed():
+    registry = RuleRegistry()
+    registry.add_custom_rule("Weaken", rule([P], Or(P, Not(P))))
+    registry.add_custom_rule("Weaken again", rule([Q], Or(Q, Not(Q))))
+    assert registry.duplicates == {"Weaken again": "Weaken"}
+    assert registry.equivalent_rule(rule([R], Or(R, Not(R)))) == "Weaken"
+    assert registry.equivalent_rule(rule([R], Or(R, R))) is None
+
+    # Lookups see one representative, but either name can still be cited
+    assert [r.name() for r in registry.rules_concluding(Or(A, Not(A)))] == ["Weaken"]
+    assert set(registry.custom_rule_candidates([A])) == {"Weaken"}
+    proof = Proof([stmt("1", A, "Assumption")], [stmt("2", Or(A, Not(A)), "Weaken again", ["1"])], [])
+    assert verify_proof(proof, registry) is True
+
+def test_subsuming_rules():
+    registry = RuleRegistry()
+    registry.add_custom_rule("MP", rule([Implies(A, B), A], B))
+    registry.add_custom_rule("DNI", rule([A], Not(Not(A))))
+    # An instance of modus ponens, with a premise to spare
+    instance = rule([Implies(And(P, Q), R), And(P, Q), Q], R)
+    assert registry.subsuming_rules(instance) == ["MP"]
+    assert registry.subsuming_rules(rule([Not(P)], Not(Not(Not(P))))) == ["DNI"]
+    assert registry.subsuming_rules(rule([P], Not(Not(Not(Not(P)))))) == []
+    assert registry.subsuming_rules(rule([P], Not(P))) == []
@@ -0,0 +1,90 @@
+import itertools
+import random
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom
+from proof_helper.logic.sat import SATSolver, CNFEncoder, is_satisfiable, entails, countermodel
+from proof_helper.logic import truth_table
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+def satisfies(model, clauses):
+    return all(any(model[abs(l)] == (l > 0) for l in c) for c in clauses)
+
+def brute_force(num_vars, clauses):
+    for bits in itertools.product([False, True], repeat=num_vars):
+        model = {v + 1: b for v, b in enumerate(bits)}
+        if satisfies(model, clauses):
+            return True
+    return False
+
+def test_simple_sat_and_unsat():
+    solver = SATSolver()
+    solver.add_clause([1, 2])
+    solver.add_clause([-1])
+    assert solver.solve() == {1: False, 2: True}
+
+    solver = SATSolver()
+    solver.add_clause([1])
+    assert not solver.add_clause([-1])
+    assert solver.solve() is None
+
+def test_random_cnf_agrees_with_brute_force():
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randint(1, 8)
+        clauses = [
+            [rng.choice([1, -1]) * rng.randint(1, n) for _ in range(rng.randint(1, 3))]
+            for _ in range(rng.randint(1, 35))
+        ]
+        solver = SATSolver(n)
+        for c in clauses:
+            solver.add_clause(c)
+        model = solver.solve()
+        assert (model is not None) == brute_force(n, clauses)
+        if model is not None:
+            assert satisfies(model, clauses)
+
+def test_pigeonhole_is_unsat():
+    pigeons, holes = 5, 4
+    var = lambda p, h: p * holes + h + 1
+    solver = SATSolver(pigeons * holes)
+    for p in range(pigeons):
+        solver.add_clause([var(p, h) for h in range(holes)])
+    for h in range(holes):
+        for a, b in itertools.combinations(range(pigeons), 2):
+            solver.add_clause([-var(a, h), -var(b, h)])
+    assert solver.solve() is None
+    assert solver.conflicts > 0
+
+def test_tseitin_shares_subformulas():
+    encoder = CNFEncoder()
+    shared = And(P, Q)
+    a = encoder.encode(Or(shared, R))
+    b = encoder.encode(Implies(shared, R))
+    assert a != b
+    assert encoder.encode(shared) == encoder.encode(And(P, Q))
+    assert encoder.encode(Not(shared)) == -encoder.encode(shared)
+
+def test_semantic_queries_agree_with_truth_tables():
+    formulas = [
+        Or(P, Not(P)), And(P, Not(P)), Bottom(), Iff(Implies(P, Q), Or(Not(P), Q)),
+        Implies(And(Implies(P, Q), Implies(Q, R)), Implies(P, R)), Iff(P, Not(P)),
+    ]
+    for f in formulas:
+        assert is_satisfiable(f) == truth_table.is_satisfiable(f)
+        assert entails([], f) == truth_table.is_tautology(f)
+
+def test_countermodel():
+    assert entails([P, Implies(P, Q)], Q)
+    assert entails([Bottom()], R)
+    model = countermodel([Or(P, Q)], P)
+    assert model == {"P": False, "Q": True}
+
+def test_large_entailment():
+    names = [Variable(f"V{i}") for i in range(300)]
+    chain = names[0]
+    for a, b in zip(names, names[1:]):
+        chain = And(chain, Implies(a, b))
+    assert entails([chain], names[-1])
+    assert not entails([chain], Not(names[-1]))
@@ -0,0 +1,68 @@
+from proof_helper.core.formula import Variable, Implies
+from proof_helper.core.proof import Proof, StepID, Statement, Subproof
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.verify import VerificationError, verify_proof
+
+P = Variable("P")
+Q = Variable("Q")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=premises or [])
+
+def nested_proof(cite="1") -> Proof:
+    # 1 P          premise
+    # 2 | 2.1 Q    assumption
+    #   | 2.2 | 2.2.1 P   assumption
+    #   |     | 2.2.2 P   reiteration
+    #   | 2.3 P           reiteration of `cite`
+    # 3 Q → P
+    inner = Subproof(sid("2.2"), stmt("2.2.1", P, "Assumption"), [stmt("2.2.2", P, "Reiteration", [sid("2.2.1")])])
+    outer = Subproof(sid("2"), stmt("2.1", Q, "Assumption"), [inner, stmt("2.3", P, "Reiteration", [sid(cite)])])
+    return Proof(
+        premises=[stmt("1", P, "Assumption")],
+        steps=[outer, stmt("3", Implies(Q, P), "Implication Introduction", [sid("2")])],
+        conclusions=[stmt("4", Implies(Q, P), "Reiteration", [sid("3")])],
+    )
+
+def visible_ids(proof, at=None):
+    return [str(s.id) for s in proof.scope.visible_steps(None if at is None else sid(at))]
+
+def test_visibility_follows_subproof_nesting():
+    scope = nested_proof().scope
+    assert scope.is_visible(sid("1"), sid("2.2.2"))
+    assert scope.is_visible(sid("2.1"), sid("2.2.2"))
+    assert scope.is_visible(sid("2.2.1"), sid("2.2.2"))
+    assert scope.is_visible(sid("2.2"), sid("2.3"))       # Closed subproof
+    assert not scope.is_visible(sid("2.2.1"), sid("2.3"))  # Inside a closed subproof
+    assert not scope.is_visible(sid("2.1"), sid("3"))
+    assert not scope.is_visible(sid("2"), sid("2.3"))      # Still open
+    assert not scope.is_visible(sid("3"), sid("2.3"))      # Later
+    assert not scope.is_visible(sid("9"), sid("3"))
+
+def test_visible_steps():
+    proof = nested_proof()
+    assert visible_ids(proof, "2.2.2") == ["1", "2.1", "2.2.1"]
+    assert visible_ids(proof, "2.3") == ["1", "2.1", "2.2"]
+    assert visible_ids(proof, "4") == ["1", "2", "3"]
+    assert visible_ids(proof) == ["1", "2", "3"]
+
+def test_visible_steps_match_is_visible():
+    proof = nested_proof()
+    scope = proof.scope
+    for at in scope.steps:
+        expected = [s.id for s in scope.steps if scope.is_visible(s.id, at.id)]
+        assert [s.id for s in scope.visible_steps(at.id)] == expected
+
+def test_citing_into_a_closed_subproof_fails():
+    result = verify_proof(nested_proof("2.2.2"), RuleRegistry())
+    assert result == VerificationError("2.3", "Step 2.2.2 is not in scope at 2.3")
+
+def test_citing_an_open_subproof_fails():
+    result = verify_proof(nested_proof("2"), RuleRegistry())
+    assert result == VerificationError("2.3", "Step 2 is not in scope at 2.3")
+
+def test_in_scope_citations_verify():
+    assert verify_proof(nested_proof("1"), RuleRegistry()) is True
@@ -0,0 +1,49 @@
+from proof_helper.core.formula import Variable, And, Implies, Conjunction
+from proof_helper.core.proof import Proof, Statement, StepID
+from proof_helper.logic import semantics
+from proof_helper.logic.semantics import entails, countermodel, proof_goal_countermodel
+
+P = Variable("P")
+Q = Variable("Q")
+
+def test_small_problems_use_truth_tables():
+    assert entails([P, Implies(P, Q)], Q)
+    assert countermodel([Q], P) == {"P": False, "Q": True}
+
+def _chain(n):
+    names = [Variable(f"V{i}") for i in range(n)]
+    chain = names[0]
+    for v in names[1:]:
+        chain = And(chain, v)
+    return names, chain
+
+def test_large_problems_use_bdd():
+    names, chain = _chain(40)
+    assert entails([chain], names[39])
+    model = countermodel([names[0]], chain)
+    assert model is not None and model["V0"] is True
+
+def test_wide_premises_are_decided():
+    xs = [Variable(f"x{i}") for i in range(1500)]
+    assert entails([Conjunction(tuple(xs))], xs[0])
+
+def test_large_tables_are_avoided(monkeypatch):
+    def refuse(premises, conclusion):
+        raise AssertionError("truth table used")
+    monkeypatch.setattr(semantics.truth_table, "countermodel", refuse)
+    names, chain = _chain(24)
+    wide = Implies(chain, And(chain, chain))
+    assert entails([wide, chain], names[23])
+
+def test_large_bdds_fall_back_to_sat(monkeypatch):
+    monkeypatch.setattr(semantics, "BDD_MAX_NODES", 4)
+    names, chain = _chain(40)
+    assert entails([chain], names[39])
+    assert not entails([names[0]], chain)
+
+def test_proof_goal_countermodel():
+    premise = Statement(StepID((1,)), Implies(P, Q), "Assumption")
+    provable = Proof([premise, Statement(StepID((2,)), P, "Assumption")], [], [Statement(StepID((3,)), Q, "Reiteration")])
+    unprovable = Proof([premise], [], [Statement(StepID((2,)), Q, "Reiteration")])
+    assert proof_goal_countermodel(provable) is None
+    assert proof_goal_countermodel(unprovable) == {"P": False, "Q": False}
@@ -310,3 +310,110 @@ def test_suggest_rules_invalid_max(client):
 def test_suggest_rules_malformed_json(client):
     response = client.post("/suggest_rules", data="not json")
     assert response.status_code == 400
+
+def test_check_goal_provable(client):
+    payload = {
+        "premises": [
+            {"id": "1", "formula": f_var("P"), "rule": "Assumption"},
+            {"id": "2", "formula": f_var("Q"), "rule": "Assumption"}
+        ],
+        "steps": [],
+        "conclusions": [
+            {"id": "3", "formula": f_and(f_var("P"), f_var("Q")), "rule": "Reiteration", "premises": []}
+        ]
+    }
+    response = client.post("/check_goal", json=payload)
+    assert response.status_code == 200
+    assert response.get_json() == {"provable": True}
+
+def test_check_goal_unprovable_returns_countermodel(client):
+    payload = {
+        "premises": [{"id": "1", "formula": f_or(f_var("P"), f_var("Q")), "rule": "Assumption"}],
+        "steps": [],
+        "conclusions": [{"id": "2", "formula": f_var("P"), "rule": "Reiteration", "premises": []}]
+    }
+    response = client.post("/check_goal", json=payload)
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["provable"] is False
+    assert data["countermodel"] == {"P": False, "Q": True}
+
+def test_check_goal_malformed_json(client):
+    response = client.post("/check_goal", data="not json")
+    assert response.status_code == 400
+
+def test_unsound_rule_rejected_with_countermodel(client):
+    rule = {
+        "premises": [{"id": "1", "formula": f_or(f_var("P"), f_var("Q")), "rule": "Assumption"}],
+        "steps": [],
+        "conclusions": [{"id": "2", "formula": f_var("P"), "rule": "Reiteration", "premises": ["1"]}]
+    }
+    response = client.post("/rules", json={"name": "Unsound", "proof": rule})
+    assert response.status_code == 400
+    data = response.get_json()
+    assert data["step_id"] == "2"
+    assert data["countermodel"] == {"P": False, "Q": True}
+    assert "Unsound" not in client.get("/rules").get_json()["custom"]
+
+def test_suggest_rules_rejects_impossible_goal(client):
+    payload = {
+        "proof": {
+            "premises": [{"id": "1", "formula": f_var("P"), "rule": "Assumption"}],
+            "steps": [],
+            "conclusions": [{"id": "2", "formula": f_var("Q"), "rule": "Reiteration", "premises": ["3"]}]
+        }
+    }
+    response = client.post("/suggest_rules", json=payload)
+    assert response.status_code == 400
+    data = response.get_json()
+    assert data["step_id"] == "2"
+    assert data["countermodel"] == {"P": True, "Q": False}
+
+def test_verify_proof_streams_all_errors(client):
+    payload = {
+        "premises": [{"id": "1", "formula": f_var("P"), "rule": "Assumption"}],
+        "steps": [
+            {"id": "2", "formula": f_var("Q"), "rule": "Reiteration", "premises": ["1"]},
+            {"id": "3", "formula": f_var("P"), "rule": "Reiteration", "premises": ["1"]},
+            {"id": "4", "formula": f_var("P"), "rule": "No Such Rule", "premises": ["1"]}
+        ],
+        "conclusions": [{"id": "5", "formula": f_var("P"), "rule": "Reiteration", "premises": ["9"]}]
+    }
+    response = client.post("/verify_proof?all=true", json=payload)
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line.get("step_id") for line in lines[:-1]] == ["2", "4", "5"]
+    assert lines[-1] == {"done": True, "valid": False, "error_count": 3}
+
+def test_verify_proof_stream_of_valid_proof(client):
+    payload = {
+        "premises": [{"id": "1", "formula": f_var("P"), "rule": "Assumption"}],
+        "steps": [],
+        "conclusions": [{"id": "2", "formula": f_var("P"), "rule": "Reiteration", "premises": ["1"]}]
+    }
+    response = client.post("/verify_proof?all=1", json=payload)
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == [{"done": True, "valid": True, "error_count": 0}]
+
+def test_post_rules_reports_equivalent_and_subsuming_rules(client):
+    def rule(p, q):
+        return {
+            "premises": [
+                {"id": "1", "formula": f_var(p), "rule": "Assumption"},
+                {"id": "2", "formula": f_var(q), "rule": "Assumption"}
+            ],
+            "steps": [
+                {"id": "3", "formula": f_and(f_var(p), f_var(q)), "rule": "And Introduction", "premises": ["1", "2"]}
+            ],
+            "conclusions": [
+                {"id": "4", "formula": f_and(f_var(p), f_var(q)), "rule": "Reiteration", "premises": ["3"]}
+            ]
+        }
+    first = client.post("/rules", json={"name": "Conj", "proof": rule("P", "Q")})
+    assert first.status_code == 200
+    assert first.get_json() == {"equivalent_to": None, "subsumed_by": []}
+
+    renamed = client.post("/rules", json={"name": "Conj2", "proof": rule("A", "B")})
+    assert renamed.status_code == 200
+    assert renamed.get_json() == {"equivalent_to": "Conj", "subsumed_by": ["Conj"]}
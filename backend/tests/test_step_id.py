@@ -0,0 +1,57 @@
+import copy
+import pickle
+import random
+import pytest
+from proof_helper.core.proof import StepID
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def reference_is_before(a, b):
+    for x, y in zip(a, b):
+        if x != y:
+            return x < y
+    return len(a) < len(b)
+
+def test_ordering_matches_paths():
+    rng = random.Random(0)
+    paths = [tuple(rng.randint(0, 300) for _ in range(rng.randint(1, 4))) for _ in range(300)]
+    ids = [StepID(p) for p in paths]
+    for a, pa in zip(ids[:60], paths[:60]):
+        for b, pb in zip(ids, paths):
+            assert a.is_before(b) == reference_is_before(pa, pb)
+            assert (a < b) == (pa < pb)
+            assert a.contains(b) == (pb[:len(pa)] == pa)
+    assert [i.path for i in sorted(ids)] == sorted(paths)
+
+def test_containment_and_scope_helpers():
+    assert sid("2").contains(sid("2.3.1"))
+    assert sid("2").contains(sid("2"))
+    assert not sid("2").contains(sid("23"))
+    assert not sid("2.1").contains(sid("2"))
+    assert sid("1").is_given_for(sid("2.1"))
+    assert not sid("2.1").is_given_for(sid("3"))
+    assert sid("-1").is_before(sid("0"))
+
+def test_equality_hash_and_strings():
+    assert sid("3.2") == StepID((3, 2))
+    assert hash(sid("3.2")) == hash(StepID((3, 2)))
+    assert sid("3.2") != sid("3.2.0")
+    assert str(StepID((3, 2))) == "3.2"
+    assert repr(StepID((3, 2))) == "StepID(path=(3, 2))"
+    assert sid("4.1") is sid("4.1")  # Parsed ids are shared
+
+def test_compact_and_immutable():
+    step_id = StepID((1, 2))
+    assert not hasattr(step_id, "__dict__")
+    with pytest.raises(AttributeError):
+        step_id.path = (3,)
+    assert pickle.loads(pickle.dumps(step_id)) == step_id
+    assert copy.deepcopy(step_id) == step_id
+
+def test_components_out_of_range():
+    assert StepID((2**31 - 1, -2**31)).path == (2**31 - 1, -2**31)
+    with pytest.raises(ValueError):
+        StepID((1, 2**31))
+    with pytest.raises(ValueError):
+        sid("3.99999999999")
@@ -0,0 +1,61 @@
+import copy
+import pytest
+from proof_helper.core.formula import Variable, Implies
+from proof_helper.core.proof import Proof, StepID, Statement, Subproof
+from proof_helper.logic.rule_registry import RuleRegistry
+from proof_helper.logic.verify import verify_proof
+
+P = Variable("P")
+Q = Variable("Q")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=premises or [])
+
+def sample_proof() -> Proof:
+    inner = Subproof(sid("2"), stmt("2.1", Q, "Assumption"), [stmt("2.2", P, "Reiteration", [sid("1")])])
+    return Proof(
+        premises=[stmt("1", P, "Assumption")],
+        steps=[inner, stmt("3", Implies(Q, P), "Implication Introduction", [sid("2")])],
+        conclusions=[stmt("4", Implies(Q, P), "Reiteration", [sid("3")])],
+    )
+
+def test_index_covers_nested_steps():
+    proof = sample_proof()
+    assert set(map(str, proof.step_index)) == {"1", "2", "2.1", "2.2", "3", "4"}
+    assert proof.get_step(sid("2")) is proof.steps[0]
+    assert proof.get_step(sid("2.2")) is proof.steps[0].steps[0]
+    assert proof.get_step(sid("4")) is proof.conclusions[0]
+    assert proof.get_step(sid("2.3")) is None
+    assert proof.get_step(sid("5")) is None
+
+def test_subproof_lookup():
+    inner = sample_proof().steps[0]
+    assert inner.get_step(sid("2")) is inner
+    assert inner.get_step(sid("2.1")) is inner.assumption
+    assert inner.get_step(sid("1")) is None
+
+def test_index_is_read_only_and_built_once():
+    proof = sample_proof()
+    with pytest.raises(TypeError):
+        proof.step_index[sid("9")] = proof.premises[0]
+    proof.get_step(sid("1"))
+    built = proof._step_index
+    proof.get_step(sid("3"))
+    assert proof._step_index is built
+
+def test_index_does_not_affect_equality_or_copies():
+    a, b = sample_proof(), sample_proof()
+    a.get_step(sid("1"))
+    assert a == b
+    c = copy.deepcopy(a)
+    assert c.get_step(sid("2.2")) is c.steps[0].steps[0]
+
+def test_long_proof_verifies():
+    n = 5000
+    premises = [stmt("1", P, "Assumption")]
+    steps = [stmt(str(i), P, "Reiteration", [sid(str(i - 1))]) for i in range(2, n)]
+    proof = Proof(premises=premises, steps=steps, conclusions=[stmt(str(n), P, "Reiteration", [sid(str(n - 1))])])
+    assert verify_proof(proof, RuleRegistry()) is True
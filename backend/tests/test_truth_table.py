@@ -0,0 +1,51 @@
+import pytest
+from proof_helper.core.formula import Variable, Not, And, Or, Implies, Iff, Bottom
+from proof_helper.logic.truth_table import (
+    TruthTable, MAX_VARIABLES, is_tautology, is_satisfiable, are_equivalent,
+    entails, countermodel
+)
+
+P = Variable("P")
+Q = Variable("Q")
+R = Variable("R")
+
+def test_variable_columns():
+    table = TruthTable(["P", "Q"])
+    # Row k assigns P = bit 0 of k and Q = bit 1 of k
+    assert table.evaluate(P) == 0b1010
+    assert table.evaluate(Q) == 0b1100
+    assert table.evaluate(And(P, Q)) == 0b1000
+    assert table.evaluate(Implies(P, Q)) == 0b1101
+    assert table.evaluate(Iff(P, Q)) == 0b1001
+    assert table.evaluate(Bottom()) == 0
+
+def test_tautology_and_satisfiability():
+    assert is_tautology(Or(P, Not(P)))
+    assert not is_tautology(Or(P, Q))
+    assert is_satisfiable(And(P, Not(Q)))
+    assert not is_satisfiable(And(P, Not(P)))
+    assert not is_satisfiable(Bottom())
+
+def test_equivalence():
+    assert are_equivalent(Implies(P, Q), Or(Not(P), Q))
+    assert are_equivalent(Not(And(P, Q)), Or(Not(P), Not(Q)))
+    assert not are_equivalent(Implies(P, Q), Implies(Q, P))
+
+def test_entailment_and_countermodel():
+    assert entails([P, Implies(P, Q)], Q)
+    assert entails([Bottom()], R)
+    assert not entails([Or(P, Q)], P)
+    assert countermodel([Or(P, Q)], P) == {"P": False, "Q": True}
+
+def test_too_many_variables():
+    big = Variable("V0")
+    for i in range(1, MAX_VARIABLES + 1):
+        big = And(big, Variable(f"V{i}"))
+    with pytest.raises(ValueError):
+        is_tautology(big)
+
+def test_only_results_are_kept():
+    table = TruthTable(["P", "Q", "R"])
+    f = Implies(And(P, Q), Or(Q, Not(R)))
+    assert table.evaluate(f) == TruthTable(["P", "Q", "R"]).evaluate(Or(Not(And(P, Q)), Or(Q, Not(R))))
+    assert list(table._cache) == [f]
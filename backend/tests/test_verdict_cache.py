@@ -0,0 +1,68 @@
+from proof_helper.core.formula import Variable, And, Implies
+from proof_helper.core.proof import Proof, StepID, Statement, Subproof
+from proof_helper.logic.rule_registry import RuleRegistry, VerdictCache
+from proof_helper.logic.verify import VerificationError, verify_proof
+
+P = Variable("P")
+Q = Variable("Q")
+
+def sid(s: str) -> StepID:
+    return StepID.from_string(s)
+
+def stmt(id: str, formula, rule=None, premises=None):
+    return Statement(id=sid(id), formula=formula, rule=rule, premises=[sid(p) for p in premises or []])
+
+def exercise(offset: int = 0, conclusion=And(P, Q)) -> Proof:
+    # The same exercise, optionally renumbered
+    n = lambda i: str(i + offset)
+    return Proof(
+        premises=[stmt(n(1), P, "Assumption"), stmt(n(2), Q, "Assumption")],
+        steps=[stmt(n(3), conclusion, "And Introduction", [n(1), n(2)])],
+        conclusions=[stmt(n(4), conclusion, "Reiteration", [n(3)])],
+    )
+
+def test_repeated_applications_hit_the_cache():
+    registry = RuleRegistry()
+    assert verify_proof(exercise(), registry) is True
+    first = registry.verdicts.stats()
+    assert first["hits"] == 0 and first["misses"] == first["entries"] == 4
+
+    # Renumbered steps make the same rule applications
+    assert verify_proof(exercise(offset=10), registry) is True
+    assert registry.verdicts.stats()["hits"] == 4
+    assert registry.verdicts.stats()["misses"] == 4
+
+def test_failed_applications_are_cached_too():
+    registry = RuleRegistry()
+    error = VerificationError("3", "Rule And Introduction failed to apply")
+    assert verify_proof(exercise(conclusion=Implies(P, Q)), registry) == error
+    misses = registry.verdicts.misses
+    assert verify_proof(exercise(conclusion=Implies(P, Q)), registry) == error
+    assert registry.verdicts.misses == misses
+
+def test_subproof_supports_are_keyed_by_content():
+    registry = RuleRegistry()
+    def proof(inner_id):
+        inner = Subproof(sid(inner_id), stmt(f"{inner_id}.1", P, "Assumption"), [stmt(f"{inner_id}.2", P, "Reiteration", [f"{inner_id}.1"])])
+        return Proof([], [inner, stmt("9", Implies(P, P), "Implication Introduction", [inner_id])], [])
+    assert verify_proof(proof("1"), registry) is True
+    hits = registry.verdicts.hits
+    assert verify_proof(proof("2"), registry) is True
+    assert registry.verdicts.hits == hits + 3
+
+def test_adding_a_custom_rule_clears_the_cache():
+    registry = RuleRegistry()
+    verify_proof(exercise(), registry)
+    assert len(registry.verdicts) > 0
+    registry.add_custom_rule("Again", exercise())
+    assert len(registry.verdicts) == 0
+
+def test_cache_is_bounded_lru():
+    cache = VerdictCache(max_entries=2)
+    cache.put("a", True)
+    cache.put("b", False)
+    assert cache.get("a") is True  # "a" is now most recent
+    cache.put("c", True)
+    assert cache.get("b") is None
+    assert cache.get("a") is True and cache.get("c") is True
+    assert cache.stats() == {"entries": 2, "max_entries": 2, "hits": 3, "misses": 1}
@@ -2,7 +2,7 @@ import pytest
 from proof_helper.core.formula import Variable, And, Or, Bottom, Not, Implies
 from proof_helper.core.proof import Proof, StepID, Statement, Subproof, Step
 from proof_helper.logic.rule_registry import RuleRegistry
-from proof_helper.logic.verify import VerificationError, verify_statement, verify_subproof, verify_step, verify_proof
+from proof_helper.logic.verify import VerificationError, verify_statement, verify_subproof, verify_step, verify_proof, proof_errors
 
 # === Helpers ===
 
@@ -337,3 +337,21 @@ def test_verify_proof_with_excluded_middle_custom_rule():
     )
 
     assert verify_proof(user_proof, registry) is True
+
+# === COLLECT ALL ERRORS ===
+
+def test_proof_errors_reports_every_bad_step():
+    P, Q = Variable("P"), Variable("Q")
+    premise = stmt("1", P, rule="Assumption")
+    bad_assumption = subproof("2", stmt("2.1", Q, rule="Reiteration", premises=[sid("1")]), [
+        stmt("2.2", Q, rule="Reiteration", premises=[sid("1")]),
+    ])
+    good = stmt("3", P, rule="Reiteration", premises=[sid("1")])
+    missing = stmt("4", P, rule=None)
+    bad_conclusion = stmt("5", P, rule="Assumption")
+    proof = fake_proof(premises=[premise], steps=[bad_assumption, good, missing], conclusions=[bad_conclusion])
+
+    errors = list(proof_errors(proof, RuleRegistry()))
+    assert [e.step_id for e in errors] == ["2.1", "2.2", "4", "5"]
+    assert errors[0] == verify_proof(proof, RuleRegistry())
+    assert list(proof_errors(fake_proof(premises=[premise]), RuleRegistry())) == []